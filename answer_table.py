@@ -0,0 +1,223 @@
+"""
+玄机命理 - 内存映射的预计算结果表
+
+出生日期的输入范围是封闭的（1940-2025 年，每月按 31 天，0-23 时），
+因此八字结构和桃花运时段可以全部预先算好，写入定长记录的二进制文件。
+运行时用 mmap 只读映射，多个工作进程共用同一份操作系统页缓存；
+查询只需计算一次偏移量，按字节切片即可，不创建中间对象。
+
+文件布局（小端序）：
+    文件头（64 字节）：HEADER_FORMAT，含构建时的引擎结果版本（engine.RESULT_VERSION），
+            与当前引擎不一致的表拒绝打开，避免引擎修改后仍返回旧结果
+    八字区：每个 (年, 月, 日, 时) 一条 BAZI_RECORD_SIZE 字节记录，字段见 BAZI_FIELDS
+    桃花区：每个 (年, 月, 日, 性别) 一条记录，18-58 岁每岁 3 字节：
+            强度（0 表示该年不显著）、成熟度、类型编号*4+质量编号
+
+构建：python answer_table.py build [-o answers.bin]
+
+Author: Mystery Fortune Team
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+from typing import Any, Dict, List
+
+from engine import FortuneEngine, PEACH_QUALITIES, RESULT_VERSION
+
+DEFAULT_TABLE_PATH = 'answers.bin'
+
+MAGIC = b'XJMLTAB1'
+# magic, 起始年, 结束年, 八字记录长度, 桃花记录长度, 八字区偏移, 桃花区偏移, 引擎结果版本
+HEADER_FORMAT = '<8sHHHHQQI'
+HEADER_SIZE = 64
+
+YEAR_START = 1940
+YEAR_END = 2025
+MONTHS = 12
+DAYS = 31
+HOURS = 24
+GENDERS = ('男', '女')
+
+# 八字记录字段（每个字段 1 字节）
+BAZI_FIELDS = ['year_gan', 'year_zhi', 'month_gan', 'month_zhi', 'day_gan', 'day_zhi', 'hour_gan', 'hour_zhi',
+               'wuxing_jin', 'wuxing_mu', 'wuxing_shui', 'wuxing_huo', 'wuxing_tu',
+               'day_wuxing', 'is_strong', 'geju']
+BAZI_RECORD_SIZE = len(BAZI_FIELDS)
+
+PEACH_AGES = range(18, 59)
+PEACH_TYPES = ["流年桃花", "合桃花", "会桃花", "平常桃花"]
+PEACH_RECORD_SIZE = len(PEACH_AGES) * 3
+
+
+def _bazi_index(year: int, month: int, day: int, hour: int) -> int:
+    return (((year - YEAR_START) * MONTHS + month - 1) * DAYS + day - 1) * HOURS + hour
+
+
+def _peach_index(year: int, month: int, day: int, gender: str) -> int:
+    return (((year - YEAR_START) * MONTHS + month - 1) * DAYS + day - 1) * 2 + GENDERS.index(gender)
+
+
+# ============ 构建 ============
+def build(path: str = DEFAULT_TABLE_PATH, engine: FortuneEngine = None, progress: bool = True) -> int:
+    """计算整个输入域并写出结果表
+
+    桃花运中的 is_past/is_current 取决于流年，不写入文件，查询时再计算。
+
+    Returns:
+        文件字节数
+    """
+    engine = engine if engine is not None else FortuneEngine()
+    gan_idx = {g: i for i, g in enumerate(engine.tiangan)}
+    zhi_idx = {z: i for i, z in enumerate(engine.dizhi)}
+    wx_idx = {wx: i for i, wx in enumerate(engine.wuxing)}
+    geju_idx = {g: i for i, g in enumerate(engine.geju_list)}
+    quality_idx = {q[0]: i for i, q in enumerate(PEACH_QUALITIES)}
+    type_idx = {t: i for i, t in enumerate(PEACH_TYPES)}
+
+    years = range(YEAR_START, YEAR_END + 1)
+    bazi_count = len(years) * MONTHS * DAYS * HOURS
+    peach_count = len(years) * MONTHS * DAYS * len(GENDERS)
+    bazi_offset = HEADER_SIZE
+    peach_offset = bazi_offset + bazi_count * BAZI_RECORD_SIZE
+
+    bazi_data = bytearray(bazi_count * BAZI_RECORD_SIZE)
+    peach_data = bytearray(peach_count * PEACH_RECORD_SIZE)
+    bazi_pos = 0
+    peach_pos = 0
+    for year in years:
+        if progress:
+            print(f"\r构建结果表：{year}年", end='', file=sys.stderr, flush=True)
+        for month in range(1, MONTHS + 1):
+            for day in range(1, DAYS + 1):
+                for hour in range(HOURS):
+                    bazi = engine.calculate_bazi(year, month, day, hour)
+                    record = []
+                    for _, gan, zhi in bazi['pillars']:
+                        record += [gan_idx[gan], zhi_idx[zhi]]
+                    record += [bazi['wuxing_count'][wx] for wx in engine.wuxing]
+                    record += [wx_idx[bazi['day_wuxing']], int(bazi['is_strong']), geju_idx[bazi['geju']]]
+                    bazi_data[bazi_pos:bazi_pos + BAZI_RECORD_SIZE] = bytes(record)
+                    bazi_pos += BAZI_RECORD_SIZE
+
+                timelines = engine.calculate_peach_timelines([(year, month, day, g) for g in GENDERS], year)
+                for periods in timelines:
+                    for p in periods:
+                        pos = peach_pos + (p['age'] - PEACH_AGES.start) * 3
+                        peach_data[pos] = p['strength']
+                        peach_data[pos + 1] = p['maturity']
+                        peach_data[pos + 2] = type_idx[p['type']] * 4 + quality_idx[p['quality']]
+                    peach_pos += PEACH_RECORD_SIZE
+    if progress:
+        print(file=sys.stderr)
+
+    header = struct.pack(HEADER_FORMAT, MAGIC, YEAR_START, YEAR_END, BAZI_RECORD_SIZE, PEACH_RECORD_SIZE,
+                         bazi_offset, peach_offset, RESULT_VERSION)
+    with open(path, 'wb') as f:
+        f.write(header.ljust(HEADER_SIZE, b'\0'))
+        f.write(bazi_data)
+        f.write(peach_data)
+        return f.tell()
+
+
+# ============ 查询 ============
+class AnswerTable:
+    """只读映射的预计算结果表"""
+
+    def __init__(self, path: str = DEFAULT_TABLE_PATH):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, year_start, year_end, bazi_size, peach_size, bazi_offset, peach_offset, version = \
+            struct.unpack_from(HEADER_FORMAT, self._mm)
+        if (magic, year_start, year_end, bazi_size, peach_size) != \
+                (MAGIC, YEAR_START, YEAR_END, BAZI_RECORD_SIZE, PEACH_RECORD_SIZE):
+            self._mm.close()
+            raise ValueError(f"结果表格式不符，请重新构建：{path}")
+        # 旧版文件头没有版本字段，该位置为 0，同样视为不一致
+        if version != RESULT_VERSION:
+            self._mm.close()
+            raise ValueError(f"结果表由旧版引擎构建（结果版本 {version}，当前 {RESULT_VERSION}），"
+                             f"请重新构建：python answer_table.py build -o {path}")
+        self._view = memoryview(self._mm)
+        self._bazi_offset = bazi_offset
+        self._peach_offset = peach_offset
+
+    def close(self):
+        self._view.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _check(self, year: int, month: int, day: int):
+        if not (YEAR_START <= year <= YEAR_END and 1 <= month <= MONTHS and 1 <= day <= DAYS):
+            raise ValueError(f"超出结果表范围（{YEAR_START}-{YEAR_END}年）：{year}-{month}-{day}")
+
+    def bazi_record(self, year: int, month: int, day: int, hour: int) -> memoryview:
+        """八字原始记录（BAZI_RECORD_SIZE 字节，字段顺序见 BAZI_FIELDS），不复制数据"""
+        self._check(year, month, day)
+        if not 0 <= hour < HOURS:
+            raise ValueError(f"时辰范围应在0-23之间：{hour}")
+        start = self._bazi_offset + _bazi_index(year, month, day, hour) * BAZI_RECORD_SIZE
+        return self._view[start:start + BAZI_RECORD_SIZE]
+
+    def peach_record(self, year: int, month: int, day: int, gender: str) -> memoryview:
+        """桃花原始记录（PEACH_RECORD_SIZE 字节），不复制数据"""
+        self._check(year, month, day)
+        if gender not in GENDERS:
+            raise ValueError(f"性别应为 男 或 女：{gender}")
+        start = self._peach_offset + _peach_index(year, month, day, gender) * PEACH_RECORD_SIZE
+        return self._view[start:start + PEACH_RECORD_SIZE]
+
+    def bazi(self, year: int, month: int, day: int, hour: int) -> Dict[str, Any]:
+        """八字结构（下标形式，键同 BAZI_FIELDS，另含 wuxing_count 列表）"""
+        record = dict(zip(BAZI_FIELDS, self.bazi_record(year, month, day, hour)))
+        record['wuxing_count'] = [record.pop(f) for f in BAZI_FIELDS[8:13]]
+        record['is_strong'] = bool(record['is_strong'])
+        return record
+
+    def peach_periods(self, year: int, month: int, day: int, gender: str,
+                      current_year: int) -> List[Dict[str, Any]]:
+        """桃花运时段，结果同 FortuneEngine.calculate_peach_timelines 的单条记录"""
+        record = self.peach_record(year, month, day, gender)
+        periods = []
+        for i, age in enumerate(PEACH_AGES):
+            strength = record[i * 3]
+            if not strength:
+                continue
+            kind = record[i * 3 + 2]
+            quality, quality_desc, quality_color = PEACH_QUALITIES[kind % 4]
+            target_year = year + age
+            periods.append({
+                'age': age,
+                'year': target_year,
+                'strength': strength,
+                'type': PEACH_TYPES[kind // 4],
+                'is_past': target_year < current_year,
+                'is_current': target_year == current_year,
+                'quality': quality,
+                'quality_desc': quality_desc,
+                'quality_color': quality_color,
+                'maturity': record[i * 3 + 1],
+            })
+        return periods
+
+
+def main():
+    parser = argparse.ArgumentParser(description="玄机命理预计算结果表")
+    sub = parser.add_subparsers(dest='command', required=True)
+    build_cmd = sub.add_parser('build', help="构建结果表")
+    build_cmd.add_argument('-o', '--output', default=DEFAULT_TABLE_PATH,
+                           help=f"输出文件（默认 {DEFAULT_TABLE_PATH}）")
+    args = parser.parse_args()
+
+    size = build(args.output)
+    print(f"已写出 {args.output}（{size / 1024 / 1024:.1f} MB）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+玄机命理 - asyncio 服务前端（合并相同请求 + 背压）
+
+接口与 server.py 完全相同（复用 server.dispatch）。命理结果是确定性的，
+同一时刻大量用户提交相同参数时，只计算一次，结果分发给所有等待者：
+请求按 路径 + 排序后的查询参数 归一化为键，同键的请求共用同一个计算任务。
+
+背压：同时进行的计算数不超过 max_concurrency，排队中的不同计算不超过
+max_pending，超出时立即返回 503 和 Retry-After，避免排队拖高尾延迟。
+
+运行：python async_server.py [--host 127.0.0.1] [--port 8000]
+      [--concurrency 4] [--max-pending 256]
+
+Author: Mystery Fortune Team
+"""
+
+import argparse
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Dict, Hashable, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import metrics
+from engine import FortuneEngine
+from server import api_stats, dispatch, encode_json
+
+# 单个请求头的最大字节数
+MAX_HEADER_BYTES = 16 * 1024
+
+
+def normalize_target(target: str) -> Hashable:
+    """请求目标归一化：只是参数顺序不同的请求得到同一个键
+
+    按参数名稳定排序，同名参数保持原有先后顺序（dispatch 取第一个值，
+    ?male=鼠&male=牛 与 ?male=牛&male=鼠 的结果不同，不能合并）。
+    """
+    url = urlsplit(target)
+    pairs = parse_qsl(url.query, keep_blank_values=True)
+    return url.path, tuple(sorted(pairs, key=lambda kv: kv[0]))
+
+
+class CoalescingService:
+    """合并相同在途请求、带背压限制的异步计算服务"""
+
+    def __init__(self, engine: Optional[FortuneEngine] = None, max_concurrency: Optional[int] = None,
+                 max_pending: int = 256):
+        """
+        Args:
+            engine: 计算引擎，默认新建
+            max_concurrency: 同时进行的计算数，默认为 CPU 核数
+            max_pending: 允许排队的不同计算数（相同请求合并后只算一个）
+        """
+        self.engine = engine if engine is not None else FortuneEngine()
+        # 启动时构建逐日表，避免首个请求承担构建开销
+        self.engine.day_table
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        self._semaphore = None
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+        self.requests = 0
+        self.computed = 0
+        self.coalesced = 0
+        self.rejected = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """请求统计
+
+        Returns:
+            Dict包含: requests, computed, coalesced, rejected, inflight
+        """
+        return {
+            'requests': self.requests,
+            'computed': self.computed,
+            'coalesced': self.coalesced,
+            'rejected': self.rejected,
+            'inflight': len(self._inflight),
+        }
+
+    async def handle(self, target: str) -> Tuple[int, bytes]:
+        """处理一个请求目标，返回 (HTTP 状态码, JSON 响应体)"""
+        self.requests += 1
+        key = normalize_target(target)
+        if key[0] == '/api/stats':
+            payload = api_stats(self.engine, {})
+            payload['service'] = self.stats()
+            return 200, encode_json(payload)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            if len(self._inflight) >= self.max_pending:
+                self.rejected += 1
+                return 503, encode_json({'error': "服务繁忙，请稍后重试"})
+            task = asyncio.ensure_future(self._run(target))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+        # 某个等待者断开连接时不取消共用的计算
+        return await asyncio.shield(task)
+
+    async def _run(self, target: str) -> Tuple[int, bytes]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            self.computed += 1
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, dispatch, self.engine, target)
+
+    # ============ HTTP/1.1 连接处理 ============
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """处理一个（可能长连接的）HTTP 连接"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ')
+                except ValueError:
+                    await self._respond(writer, 400, encode_json({'error': "请求格式错误"}), False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(':')
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    await self._respond(writer, 400, encode_json({'error': "Content-Length 无效"}), False)
+                    break
+                if length:
+                    await reader.readexactly(length)
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+                if method != 'GET':
+                    status, body = 405, encode_json({'error': f"不支持的请求方法：{method}"})
+                else:
+                    status, body = await self.handle(target)
+                await self._respond(writer, status, body, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, body: bytes, keep_alive: bool):
+        head = [
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+            "Server: MysteryFortune/1.0",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            "Access-Control-Allow-Origin: *",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == 503:
+            head.append("Retry-After: 1")
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+
+    async def serve(self, host: str, port: int):
+        server = await asyncio.start_server(self.serve_connection, host, port, limit=MAX_HEADER_BYTES)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="玄机命理 asyncio HTTP/JSON 服务")
+    parser.add_argument('--host', default='127.0.0.1', help="监听地址（默认 127.0.0.1）")
+    parser.add_argument('--port', type=int, default=8000, help="监听端口（默认 8000）")
+    parser.add_argument('--concurrency', type=int, default=None, help="同时进行的计算数（默认 CPU 核数）")
+    parser.add_argument('--max-pending', type=int, default=256, help="允许排队的不同计算数（默认 256）")
+    parser.add_argument('--metrics', action='store_true', help="开启计时统计（结果见 /api/stats）")
+    args = parser.parse_args()
+
+    service = CoalescingService(max_concurrency=args.concurrency, max_pending=args.max_pending)
+    if args.metrics:
+        metrics.enable()
+    if metrics.is_enabled():  # --metrics 或 XUANJI_METRICS=1
+        metrics.watch_engine(service.engine)
+    print(f"玄机命理服务已启动：http://{args.host}:{args.port}/api/")
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
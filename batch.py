@@ -0,0 +1,297 @@
+"""
+玄机命理 - 批量计算命令行工具
+
+从 CSV 或 JSONL 文件读取出生记录（year, month, day, hour, gender，可选 id），
+分块交给进程池计算八字、桃花运和生肖配对，并按输入顺序写出结果。
+每写完一块就更新断点文件，中断后加 --resume 可从断点继续。
+
+运行：python batch.py 输入.csv -o 输出.jsonl [--workers 8] [--chunk-size 2000] [--resume]
+
+输出格式由输出文件扩展名决定（.csv 或 .jsonl）。每条结果包含：
+    id, year, month, day, hour, gender, error,
+    bazi, shengxiao, day_wuxing, is_strong, xi_shen, ji_shen, geju, year_luck,
+    peach_star, peach_peaks（强度≥60 的桃花年）, best_matches（最相配的三个生肖）
+桃花运的出生年份范围比八字窄（PEACH_BIRTH_YEAR_RANGE），超出时八字各列照常输出，
+桃花运两列留空，error 列说明原因。
+
+Author: Mystery Fortune Team
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+
+from engine import FortuneEngine, PEACH_BIRTH_YEAR_RANGE
+
+# 输出字段（CSV 列顺序）
+OUTPUT_FIELDS = ['id', 'year', 'month', 'day', 'hour', 'gender', 'error',
+                 'bazi', 'shengxiao', 'day_wuxing', 'is_strong', 'xi_shen', 'ji_shen', 'geju',
+                 'year_luck', 'peach_star', 'peach_peaks', 'best_matches']
+
+# 计入 peach_peaks 的最低桃花强度（与桃花运报告中“显著桃花年”一致）
+PEACH_PEAK_STRENGTH = 60
+
+# 子进程内的计算状态（由 _init_worker 设置）
+_worker_engine: Optional[FortuneEngine] = None
+_worker_options: Dict[str, Any] = {}
+
+
+# 无法解析的输入行：read_records 产生 {INVALID_KEY: 原因}，输出时记为错误行
+INVALID_KEY = '_invalid'
+
+
+# ============ 读取输入 ============
+def read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """逐条读取 CSV（带表头）或 JSONL 出生记录
+
+    JSONL 中无法解析或不是 JSON 对象的行不会中断读取，产生 {INVALID_KEY: 原因}。
+    """
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        if path.lower().endswith('.csv'):
+            yield from csv.DictReader(f)
+        else:
+            line_no = 0
+            for line in f:
+                line_no += 1
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield {INVALID_KEY: f"第{line_no}行不是有效的 JSON：{e.msg}"}
+                    continue
+                if not isinstance(record, dict):
+                    yield {INVALID_KEY: f"第{line_no}行不是 JSON 对象"}
+                    continue
+                yield record
+
+
+def count_records(path: str) -> int:
+    """统计输入记录数（用于显示进度）"""
+    with open(path, 'rb') as f:
+        lines = sum(1 for line in f if line.strip())
+    return lines - 1 if path.lower().endswith('.csv') else lines
+
+
+# ============ 子进程计算 ============
+def _init_worker(current_year: int, output_format: str):
+    global _worker_engine, _worker_options
+    _worker_engine = FortuneEngine()
+    _worker_options = {'current_year': current_year, 'format': output_format}
+
+
+def _score_record(engine: FortuneEngine, record: Dict[str, Any], current_year: int) -> Dict[str, Any]:
+    if not isinstance(record, dict):
+        record = {INVALID_KEY: "记录不是 JSON 对象"}
+    result = {'id': record.get('id', ''), 'error': ''}
+    if INVALID_KEY in record:
+        result['error'] = record[INVALID_KEY]
+        return result
+    try:
+        year, month, day, hour = (int(record[k]) for k in ('year', 'month', 'day', 'hour'))
+        gender = str(record['gender']).strip()
+    except (KeyError, TypeError, ValueError):
+        result.update({k: record.get(k, '') for k in ('year', 'month', 'day', 'hour', 'gender')})
+        result['error'] = "记录缺少字段或格式错误（需要 year, month, day, hour, gender）"
+        return result
+    result.update(year=year, month=month, day=day, hour=hour, gender=gender)
+
+    error = engine.validate_date(year, month, day, hour)
+    if error is None and gender not in ('男', '女'):
+        error = f"性别应为 男 或 女：{gender}"
+    if error:
+        result['error'] = error
+        return result
+
+    fortune = engine.calculate_fortune(year, month, day, hour, current_year)
+    scores = engine.score_candidates(fortune['shengxiao'], engine.shengxiao, gender)
+    best = sorted(range(12), key=lambda i: -scores[i])[:3]
+
+    result.update(
+        bazi=fortune['bazi'],
+        shengxiao=fortune['shengxiao'],
+        day_wuxing=fortune['day_wuxing'],
+        is_strong=fortune['is_strong'],
+        xi_shen=fortune['xi_shen'],
+        ji_shen=fortune['ji_shen'],
+        geju=fortune['geju'],
+        year_luck=fortune['year_luck'],
+        best_matches=[[engine.shengxiao[i], scores[i]] for i in best],
+    )
+
+    # 桃花运单独校验（年份范围与 /api/peach 一致）
+    peach_error = engine.validate_date(year, month, day, hour, year_range=PEACH_BIRTH_YEAR_RANGE)
+    if peach_error:
+        result['error'] = f"桃花运：{peach_error}"
+        return result
+    _, peach_star = engine.get_peach_blossom_star((year - 4) % 12)
+    timeline = engine.calculate_peach_timelines([(year, month, day, gender)], current_year)[0]
+    result.update(
+        peach_star=peach_star,
+        peach_peaks=[{'age': p['age'], 'year': p['year'], 'strength': p['strength'], 'quality': p['quality']}
+                     for p in timeline if p['strength'] >= PEACH_PEAK_STRENGTH],
+    )
+    return result
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, list):
+        if value and isinstance(value[0], dict):
+            return '、'.join(f"{p['age']}岁({p['year']}){p['strength']}%{p['quality']}" for p in value)
+        if value and isinstance(value[0], list):
+            return '、'.join(f"{name}{score}" for name, score in value)
+        return '、'.join(value)
+    return value
+
+
+def _process_chunk(records: List[Dict[str, Any]]) -> str:
+    """子进程：计算一块记录并直接序列化为输出文本（序列化也在子进程中并行完成）"""
+    current_year = _worker_options['current_year']
+    rows = [_score_record(_worker_engine, record, current_year) for record in records]
+    if _worker_options['format'] == 'csv':
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for row in rows:
+            writer.writerow([_csv_cell(row.get(field, '')) for field in OUTPUT_FIELDS])
+        return buf.getvalue()
+    return ''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows)
+
+
+# ============ 断点 ============
+def _load_checkpoint(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _save_checkpoint(path: str, state: Dict[str, Any]):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _chunks(records: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# ============ 主流程 ============
+def run_batch(input_path: str, output_path: str, workers: Optional[int] = None, chunk_size: int = 2000,
+              resume: bool = False, checkpoint_path: Optional[str] = None,
+              current_year: Optional[int] = None, progress: bool = True) -> int:
+    """批量计算并按输入顺序写出结果
+
+    Returns:
+        本次运行处理的记录数
+    """
+    workers = workers or os.cpu_count() or 1
+    current_year = current_year or datetime.now().year
+    output_format = 'csv' if output_path.lower().endswith('.csv') else 'jsonl'
+    checkpoint_path = checkpoint_path or output_path + '.checkpoint'
+
+    done, offset = 0, 0
+    if resume:
+        state = _load_checkpoint(checkpoint_path)
+        if state is not None:
+            if state['input'] != os.path.abspath(input_path) or state['current_year'] != current_year:
+                raise ValueError(f"断点文件与本次参数不一致：{checkpoint_path}")
+            done, offset = state['records_done'], state['output_bytes']
+
+    total = count_records(input_path) if progress else None
+    records = islice(read_records(input_path), done, None)
+
+    if done:
+        if not os.path.exists(output_path):
+            raise ValueError(f"找不到断点对应的输出文件：{output_path}")
+        # 断点之后可能已写出部分未记录的结果，按断点位置截断
+        out = open(output_path, 'r+b')
+        out.seek(offset)
+        out.truncate()
+    else:
+        out = open(output_path, 'wb')
+    if not done and output_format == 'csv':
+        out.write((','.join(OUTPUT_FIELDS) + '\r\n').encode('utf-8'))
+
+    processed = 0
+    started = time.perf_counter()
+    with out, ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                  initargs=(current_year, output_format)) as pool:
+        pending = deque()
+        chunks = _chunks(records, chunk_size)
+
+        def submit_next() -> bool:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            pending.append((len(chunk), pool.submit(_process_chunk, chunk)))
+            return True
+
+        # 每个进程保持两块在途，既能跑满所有核，又不会把整个输入读入内存
+        while len(pending) < workers * 2 and submit_next():
+            pass
+        while pending:
+            count, future = pending.popleft()
+            out.write(future.result().encode('utf-8'))
+            out.flush()
+            processed += count
+            _save_checkpoint(checkpoint_path, {
+                'input': os.path.abspath(input_path),
+                'current_year': current_year,
+                'records_done': done + processed,
+                'output_bytes': out.tell(),
+            })
+            submit_next()
+
+            if progress:
+                elapsed = time.perf_counter() - started
+                print(f"\r已处理 {done + processed}/{total} 条，{processed / elapsed:.0f} 条/秒",
+                      end='', file=sys.stderr, flush=True)
+
+    if progress:
+        print(file=sys.stderr)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="玄机命理批量计算（CSV / JSONL）")
+    parser.add_argument('input', help="输入文件（.csv 带表头，或 .jsonl 每行一个 JSON 对象）")
+    parser.add_argument('-o', '--output', required=True, help="输出文件（.csv 或 .jsonl）")
+    parser.add_argument('--workers', type=int, default=None, help="进程数（默认 CPU 核数）")
+    parser.add_argument('--chunk-size', type=int, default=2000, help="每块记录数（默认 2000）")
+    parser.add_argument('--resume', action='store_true', help="从断点继续")
+    parser.add_argument('--checkpoint', default=None, help="断点文件（默认 输出文件.checkpoint）")
+    parser.add_argument('--current-year', type=int, default=None, help="流年年份（默认今年）")
+    parser.add_argument('--quiet', action='store_true', help="不显示进度")
+    args = parser.parse_args()
+
+    try:
+        run_batch(args.input, args.output, workers=args.workers, chunk_size=args.chunk_size,
+                  resume=args.resume, checkpoint_path=args.checkpoint,
+                  current_year=args.current_year, progress=not args.quiet)
+    except KeyboardInterrupt:
+        print("\n已中断，可使用 --resume 从断点继续", file=sys.stderr)
+        sys.exit(130)
+    except (OSError, ValueError) as e:
+        print(f"错误：{e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
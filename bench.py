@@ -0,0 +1,278 @@
+"""
+玄机命理 - 无界面性能基准测试
+
+对各计算路径分别测量：
+    - 单次调用延迟（微秒，取多轮的最小值和中位数）
+    - 批量吞吐量（每秒次数，按多个输入规模分别测量）
+
+结果保存为 JSON，之后的运行可与基准文件比较，超出阈值的退化会使程序以状态码 1 退出。
+
+运行：
+    python bench.py --save baseline.json
+    python bench.py --compare baseline.json [--threshold 0.2]
+    python bench.py --only bazi,lunar_date --sizes 100,1000 --quick
+
+Author: Mystery Fortune Team
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from engine import FortuneEngine, EVENT_TYPES, YI_ITEMS
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_THRESHOLD = 0.2
+
+# 单个基准：(单次调用函数, 批量函数(输入规模) -> 批量调用函数)
+Case = Tuple[Callable[[], Any], Callable[[int], Callable[[], Any]]]
+
+
+def _birth_inputs(n: int, seed: int = 42) -> List[Tuple[int, int, int, int]]:
+    rng = random.Random(seed)
+    return [(rng.randint(1940, 2025), rng.randint(1, 12), rng.randint(1, 28), rng.randint(0, 23))
+            for _ in range(n)]
+
+
+def _dates(n: int, seed: int = 42, years: int = 200) -> List[datetime]:
+    """1900 年起 years 年内的随机日期"""
+    rng = random.Random(seed)
+    base = datetime(1900, 1, 1)
+    return [base + timedelta(days=rng.randrange(365 * years)) for _ in range(n)]
+
+
+def build_cases(engine: FortuneEngine) -> Dict[str, Case]:
+    """全部基准用例（名称 -> 用例）"""
+    shengxiao = engine.shengxiao
+    today = datetime(2026, 1, 1)
+
+    def bulk(fn: Callable[[Any], Any], make_inputs: Callable[[int], List[Any]]):
+        """逐条调用 fn"""
+        def factory(n: int):
+            inputs = make_inputs(n)
+            return lambda: [fn(x) for x in inputs]
+        return factory
+
+    def batch(fn: Callable[[List[Any]], Any], make_inputs: Callable[[int], List[Any]]):
+        """整批输入一次传给 fn"""
+        def factory(n: int):
+            inputs = make_inputs(n)
+            return lambda: fn(inputs)
+        return factory
+
+    def peach_records(n: int):
+        return [(y, m, d, '男' if h % 2 else '女') for y, m, d, h in _birth_inputs(n)]
+
+    def zodiac_pairs(n: int):
+        rng = random.Random(42)
+        return [(rng.choice(shengxiao), rng.choice(shengxiao)) for _ in range(n)]
+
+    def peach_args(n: int):
+        return [(y, m, d, '男' if h % 2 else '女', (y - 4) % 12,
+                 engine.get_peach_blossom_star((y - 4) % 12)[0], 2026)
+                for y, m, d, h in _birth_inputs(n)]
+
+    def uncached_chongsha(date):
+        engine.daily_cache.clear()
+        return engine.get_daily_chongsha(date)
+
+    return {
+        'bazi': (lambda: engine.calculate_bazi(1990, 5, 6, 7),
+                 bulk(lambda a: engine.calculate_bazi(*a), _birth_inputs)),
+        'bazi_batch': (lambda: engine.calculate_bazi_batch([(1990, 5, 6, 7)]),
+                       batch(engine.calculate_bazi_batch, _birth_inputs)),
+        'fortune': (lambda: engine.calculate_fortune(1990, 5, 6, 7, 2026),
+                    bulk(lambda a: engine.calculate_fortune(*a, 2026), _birth_inputs)),
+        'zodiac_score': (lambda: engine.get_zodiac_score('鼠', '牛'),
+                         bulk(lambda p: engine.get_zodiac_score(*p), zodiac_pairs)),
+        'match': (lambda: engine.calculate_match('鼠', '牛'),
+                  bulk(lambda p: engine.calculate_match(*p), zodiac_pairs)),
+        'peach_periods': (lambda: engine.calculate_peach_periods(1990, 5, 6, '男', 6, 3, 2026),
+                          bulk(lambda a: engine.calculate_peach_periods(*a), peach_args)),
+        'peach_timelines': (lambda: engine.calculate_peach_timelines([(1990, 5, 6, '男')], 2026),
+                            batch(lambda records: engine.calculate_peach_timelines(records, 2026), peach_records)),
+        'daily_chongsha': (lambda: engine.get_daily_chongsha(today),
+                           bulk(engine.get_daily_chongsha, _dates)),
+        'daily_chongsha_uncached': (lambda: uncached_chongsha(today),
+                                    bulk(uncached_chongsha, _dates)),
+        'lunar_date': (lambda: engine.get_lunar_date(today),
+                       bulk(engine.get_lunar_date, _dates)),
+        'deterministic_slice': (lambda: engine._deterministic_slice(YI_ITEMS, 5, 20260101),
+                                bulk(lambda s: engine._deterministic_slice(YI_ITEMS, 5, s),
+                                     lambda n: list(range(20260101, 20260101 + n)))),
+        'almanac': (lambda: engine.get_almanac(today),
+                    bulk(engine.get_almanac, _dates)),
+        'search_auspicious_90d': (lambda: engine.search_auspicious(EVENT_TYPES[0], today),
+                                  bulk(lambda d: engine.search_auspicious(EVENT_TYPES[0], d),
+                                       _dates)),
+        'find_auspicious_5y': (lambda: engine.find_auspicious_days(EVENT_TYPES[0], today,
+                                                                   today + timedelta(days=5 * 365),
+                                                                   avoid_zodiac=['虎'], limit=20),
+                               bulk(lambda d: engine.find_auspicious_days(EVENT_TYPES[0], d,
+                                                                          d + timedelta(days=5 * 365), limit=20),
+                                    lambda n: _dates(n, years=195))),
+    }
+
+
+def measure_latency(fn: Callable[[], Any], repeat: int, target_time: float = 0.02) -> Dict[str, float]:
+    """单次调用延迟（微秒）：每轮调用足够多次以摊薄计时误差"""
+    fn()  # 预热（构建查表、填充缓存等）
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= target_time or loops >= 1 << 20:
+            break
+        loops *= 2
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return {'min': min(samples) * 1e6, 'median': statistics.median(samples) * 1e6}
+
+
+def measure_throughput(factory: Callable[[int], Callable[[], Any]], size: int, repeat: int) -> float:
+    """批量吞吐量（每秒处理的输入条数，取多轮中最好的一次）"""
+    run = factory(size)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return size / best if best > 0 else float('inf')
+
+
+def run_benchmarks(names: Optional[List[str]] = None, sizes: List[int] = DEFAULT_SIZES,
+                   repeat: int = 5, progress: bool = True) -> Dict[str, Any]:
+    """运行基准测试
+
+    Returns:
+        Dict包含: meta（运行环境）, results（用例名 -> latency_us, throughput）
+    """
+    engine = FortuneEngine()
+    cases = build_cases(engine)
+    if names:
+        unknown = [n for n in names if n not in cases]
+        if unknown:
+            raise ValueError(f"未知的基准用例：{'、'.join(unknown)}（可选：{'、'.join(cases)}）")
+        cases = {n: cases[n] for n in names}
+
+    results = {}
+    for name, (single, factory) in cases.items():
+        if progress:
+            print(f"{name} ...", end='', file=sys.stderr, flush=True)
+        latency = measure_latency(single, repeat)
+        throughput = {str(size): measure_throughput(factory, size, repeat) for size in sizes}
+        results[name] = {'latency_us': latency, 'throughput': throughput}
+        if progress:
+            print(f" {latency['median']:.2f} us", file=sys.stderr)
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sizes': sizes,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """与基准结果比较
+
+    Returns:
+        超出阈值的退化描述列表（为空表示没有退化）
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        # 取多轮最小值比较，受机器负载波动的影响最小
+        now_us, base_us = result['latency_us']['min'], base['latency_us']['min']
+        if now_us > base_us * (1 + threshold):
+            regressions.append(f"{name} 延迟 {base_us:.2f} -> {now_us:.2f} us（+{now_us / base_us - 1:.0%}）")
+        for size, ops in result['throughput'].items():
+            base_ops = base['throughput'].get(size)
+            if base_ops and ops < base_ops / (1 + threshold):
+                regressions.append(f"{name} 吞吐量[{size}] {base_ops:.0f} -> {ops:.0f} 次/秒"
+                                   f"（-{1 - ops / base_ops:.0%}）")
+    return regressions
+
+
+def format_report(current: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    sizes = current['meta']['sizes']
+    header = f"{'用例':<26}{'延迟(us)':>12}" + ''.join(f"{'吞吐@' + str(s):>14}" for s in sizes)
+    if baseline:
+        header += f"{'延迟对比':>10}"
+    lines = [header]
+    for name, result in current['results'].items():
+        line = f"{name:<26}{result['latency_us']['median']:>12.2f}"
+        line += ''.join(f"{result['throughput'][str(s)]:>14.0f}" for s in sizes)
+        base = baseline['results'].get(name) if baseline else None
+        if base:
+            line += f"{result['latency_us']['median'] / base['latency_us']['median']:>10.2f}x"
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="玄机命理性能基准测试")
+    parser.add_argument('--only', default='', help="只运行这些用例，逗号分隔")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help="批量规模，逗号分隔")
+    parser.add_argument('--repeat', type=int, default=5, help="每项测量的轮数（默认 5）")
+    parser.add_argument('--quick', action='store_true', help="快速模式（repeat=3，规模 100,1000）")
+    parser.add_argument('--save', help="保存结果到 JSON 文件")
+    parser.add_argument('--compare', help="与基准 JSON 文件比较")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"允许的退化比例（默认 {DEFAULT_THRESHOLD}，即 20%%）")
+    parser.add_argument('--list', action='store_true', help="列出全部用例")
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(build_cases(FortuneEngine())))
+        return
+
+    sizes = [100, 1000] if args.quick else [int(s) for s in args.sizes.split(',') if s]
+    repeat = 3 if args.quick else args.repeat
+    names = [n for n in args.only.split(',') if n]
+    try:
+        current = run_benchmarks(names, sizes, repeat)
+    except ValueError as e:
+        print(f"错误：{e}", file=sys.stderr)
+        sys.exit(2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print(format_report(current, baseline))
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+
+    if baseline:
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n性能退化（阈值 {args.threshold:.0%}）：", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\n未发现超过 {args.threshold:.0%} 的性能退化")
+
+
+if __name__ == "__main__":
+    main()
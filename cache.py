@@ -0,0 +1,124 @@
+"""
+玄机命理 - 线程安全的 LRU 缓存
+
+有容量上限的最近最少使用（LRU）缓存，可选过期时间（TTL）。
+多个 FortuneEngine 实例或多个服务线程可以共用同一个缓存对象。
+缓存内部用一把锁保护，命中、未命中和淘汰次数都有计数。
+
+Author: Mystery Fortune Team
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+class LRUCache:
+    """有容量上限的线程安全 LRU 缓存（可选 TTL）"""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Args:
+            maxsize: 最多保存的条目数，超出时淘汰最久未使用的条目
+            ttl: 条目存活秒数，None 表示永不过期
+        """
+        if maxsize <= 0:
+            raise ValueError("缓存容量必须大于0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (value, 过期时间戳或 None)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """读取缓存，未命中或已过期时返回 default"""
+        with self._lock:
+            value = self._get_locked(key)
+        return default if value is _MISSING else value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """写入缓存"""
+        with self._lock:
+            self._put_locked(key, value)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """命中则直接返回，否则调用 compute() 计算并写入缓存
+
+        compute 在锁外执行，同一个键被并发计算时以先写入的结果为准。
+        """
+        with self._lock:
+            value = self._get_locked(key)
+        if value is not _MISSING:
+            return value
+
+        value = compute()
+        with self._lock:
+            existing = self._peek_locked(key)
+            if existing is not _MISSING:
+                return existing
+            self._put_locked(key, value)
+        return value
+
+    def clear(self) -> None:
+        """清空缓存（计数保留）"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """缓存统计
+
+        Returns:
+            Dict包含: size, maxsize, hits, misses, evictions, hit_rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total if total else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._peek_locked(key) is not _MISSING
+
+    # ============ 以下方法须在持有锁时调用 ============
+    def _peek_locked(self, key):
+        """不更新计数和使用顺序地读取，过期条目视为不存在"""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self._data[key]
+            return _MISSING
+        return value
+
+    def _get_locked(self, key):
+        value = self._peek_locked(key)
+        if value is _MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._data.move_to_end(key)
+        return value
+
+    def _put_locked(self, key, value):
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._data[key] = (value, expires)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
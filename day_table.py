@@ -0,0 +1,105 @@
+"""
+玄机命理 - 逐日干支冲煞表
+
+一次性预先计算 1900-2100 年每一天的日干、日支和吉神，以紧凑的字节数组保存，
+按公历日序号 O(1) 查询；冲煞、凶神只由日支决定，查询时直接查表。
+区间查询就是对字节数组的切片。
+
+Author: Mystery Fortune Team
+"""
+
+import calendar
+from datetime import date as date_cls, datetime, timedelta
+from types import MappingProxyType
+from typing import Dict, List, Iterator, Mapping, Union
+
+DateLike = Union[date_cls, datetime]
+
+
+class DayTable:
+    """逐日干支冲煞表（1900-01-01 至 2100-12-31）"""
+
+    START_YEAR = 1900
+    END_YEAR = 2100
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.start_ordinal = date_cls(self.START_YEAR, 1, 1).toordinal()
+        self.end_ordinal = date_cls(self.END_YEAR, 12, 31).toordinal()
+        size = self.end_ordinal - self.start_ordinal + 1
+
+        # 每日一个字节：日干下标、日支下标、吉神组合编号
+        self.gan = bytearray(size)
+        self.zhi = bytearray(size)
+        self.ji = bytearray(size)
+        # 吉神组合（如 '天德'、'天德、月德'）去重后的名称表
+        self.ji_names: List[str] = []
+        ji_codes: Dict[str, int] = {}
+
+        pos = 0
+        ordinal = self.start_ordinal
+        for year in range(self.START_YEAR, self.END_YEAR + 1):
+            for month in range(1, 13):
+                for _ in range(calendar.monthrange(year, month)[1]):
+                    gan_idx, zhi_idx = engine._get_day_ganzhi_idx(ordinal)
+                    ji_shen = engine._get_ji_shen(gan_idx, month)
+                    code = ji_codes.get(ji_shen)
+                    if code is None:
+                        code = ji_codes[ji_shen] = len(self.ji_names)
+                        self.ji_names.append(ji_shen)
+                    self.gan[pos] = gan_idx
+                    self.zhi[pos] = zhi_idx
+                    self.ji[pos] = code
+                    pos += 1
+                    ordinal += 1
+
+        # 只由日支决定的字段，按地支下标预先组装
+        self._zhi_info = [engine._build_daily_info(0, zhi_idx, '') for zhi_idx in range(12)]
+
+    def contains(self, date: DateLike) -> bool:
+        """日期是否在表的覆盖范围内"""
+        return self.start_ordinal <= date.toordinal() <= self.end_ordinal
+
+    def index(self, date: DateLike) -> int:
+        """日期在表中的下标"""
+        pos = date.toordinal() - self.start_ordinal
+        if not 0 <= pos < len(self.gan):
+            raise ValueError(f"日期超出范围（{self.START_YEAR}-{self.END_YEAR}年）：{date}")
+        return pos
+
+    def zhi_info(self, zhi_idx: int) -> Mapping[str, str]:
+        """只由日支决定的字段（chong_sx, chong_zhi, sha_dir, xiong_shen, day_zhi），只读"""
+        return MappingProxyType(self._zhi_info[zhi_idx])
+
+    def info_at(self, pos: int) -> Dict[str, str]:
+        """表中第 pos 天（见 index）的冲煞信息，字段同 lookup"""
+        info = dict(self._zhi_info[self.zhi[pos]])
+        info['day_gan'] = self.engine.tiangan[self.gan[pos]]
+        info['ji_shen'] = self.ji_names[self.ji[pos]]
+        return info
+
+    def lookup(self, date: DateLike) -> Dict[str, str]:
+        """查询某日冲煞信息，字段同 FortuneEngine.get_daily_chongsha"""
+        return self.info_at(self.index(date))
+
+    def slice(self, start: DateLike, end: DateLike) -> Dict[str, bytearray]:
+        """区间 [start, end) 的原始下标数组
+
+        Returns:
+            Dict包含: gan（日干下标）, zhi（日支下标）, ji（ji_names 中的编号）
+        """
+        lo = self.index(start)
+        hi = lo + max(0, (end.toordinal() - start.toordinal()))
+        if hi > len(self.gan):
+            raise ValueError(f"日期超出范围（{self.START_YEAR}-{self.END_YEAR}年）：{end}")
+        return {'gan': self.gan[lo:hi], 'zhi': self.zhi[lo:hi], 'ji': self.ji[lo:hi]}
+
+    def iter_days(self, start: DateLike, count: int) -> Iterator[Dict[str, str]]:
+        """从 start 开始逐日生成冲煞信息，每项额外包含 date 字段"""
+        lo = self.index(start)
+        if lo + count > len(self.gan):
+            raise ValueError(f"日期超出范围（{self.START_YEAR}-{self.END_YEAR}年）")
+        for offset in range(count):
+            info = self.info_at(lo + offset)
+            info['date'] = start + timedelta(days=offset)
+            yield info
@@ -0,0 +1,949 @@
+"""
+玄机命理 - 无界面计算引擎
+
+将原 MysteryFortuneApp 中的全部命理计算抽离为纯 Python 对象，不依赖 tkinter，
+所有方法均返回普通数据（dict / list / str / int），可在无显示服务的环境中使用。
+
+包含计算：
+    - 八字排盘、五行统计、日主强弱、喜忌神、格局
+    - 生肖配对评分
+    - 桃花星与一生桃花运时段
+    - 农历日期、每日冲煞、老黄历宜忌
+    - 黄道吉日查询
+
+Author: Mystery Fortune Team
+"""
+
+import math
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Optional, Any, Iterable, Iterator, Mapping
+
+from cache import LRUCache
+from day_table import DayTable
+from lunar_table import to_lunar
+from seeded_random import sin_random, sin_int, sin_slice
+
+
+# 解读文本表（READINGS、YI_EXPLANATIONS 等）在 texts 模块中，首次用到时才导入
+_TEXT_NAMES = ('READINGS', 'LIFE_READINGS', 'YEAR_LUCK_TEXTS', 'YI_EXPLANATIONS', 'JI_EXPLANATIONS',
+               'YI_ITEMS', 'JI_ITEMS', 'CHONGSHA_EXPLANATIONS', 'PEACH_MEANINGS')
+
+
+def __getattr__(name: str):
+    """兼容 from engine import READINGS 等旧用法（按需导入 texts 模块）"""
+    if name in _TEXT_NAMES:
+        import texts
+        return getattr(texts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# 计算结果版本：任何计算结果（字段或数值）发生变化时加一，持久化的结果缓存据此整体失效
+RESULT_VERSION = 1
+
+# 出生年份范围（含两端）：算命大师到 2025 年，桃花运到 2024 年；界面和服务共用
+BIRTH_YEAR_RANGE = (1940, 2025)
+PEACH_BIRTH_YEAR_RANGE = (1940, 2024)
+
+# 黄道吉日事项类型
+EVENT_TYPES = ["结婚嫁娶", "搬家入宅", "开业开张", "出行远行", "签约交易", "动土建房"]
+
+# 各事项特别看重的吉神（黄道吉日排序时加分）
+EVENT_JI_SHEN = {
+    "结婚嫁娶": "天喜",
+    "搬家入宅": "玉堂",
+    "开业开张": "福星",
+    "出行远行": "驿马",
+    "签约交易": "天恩",
+    "动土建房": "玉堂",
+}
+
+# 配对详细分析项目及计算规则：(种子偏移, 基础分, 浮动范围)
+MATCH_DETAIL_NAMES = ["性格相合度", "价值观契合", "生活习惯", "财运互补"]
+MATCH_DETAIL_RULES = [(0, 70, 24), (100, 65, 29), (200, 60, 34), (300, 70, 24)]
+
+# 桃花质量：(名称, 描述, 显示颜色)，按从好到差排列
+PEACH_QUALITIES = [
+    ("正缘桃花", "此桃花为正缘之兆，有望遇到真心人，宜把握机会。", '#22c55e'),
+    ("良缘桃花", "桃花运较旺，感情机会较多，应渗重选择。", '#00d4ff'),
+    ("普通桃花", "桃花运平平，有异性缘但不明显，须主动争取。", '#ffc107'),
+    ("浅淡桃花", "桃花运较弱，感情缘分不深，宜修身养性等待时机。", '#a0a0a0'),
+]
+
+# 每日冲煞缓存的默认容量（约三年的日期）
+DAILY_CACHE_SIZE = 1024
+# 桃花基础强度表的组合数：出生年份除以12的余数 × 桃花星 × 性别
+PEACH_BASE_CACHE_SIZE = 12 * 4 * 2
+
+
+class FortuneEngine:
+    """玄机命理计算引擎（无界面）"""
+
+    def __init__(self, daily_cache: Optional[LRUCache] = None):
+        """
+        Args:
+            daily_cache: 每日冲煞缓存，多个引擎实例/服务线程可传入同一个 LRUCache 共享；
+                默认为每个引擎新建一个容量为 DAILY_CACHE_SIZE 的缓存
+        """
+        # 天干地支数据
+        self.tiangan = ['甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸']
+        self.dizhi = ['子', '丑', '寅', '卯', '辰', '巳', '午', '未', '申', '酉', '戌', '亥']
+        self.shengxiao = ['鼠', '牛', '虎', '兔', '龙', '蛇', '马', '羊', '猴', '鸡', '狗', '猪']
+        self.wuxing = ['金', '木', '水', '火', '土']
+
+        # 农历月份和日期
+        self.lunar_months = ['正月', '二月', '三月', '四月', '五月', '六月',
+                            '七月', '八月', '九月', '十月', '冬月', '腊月']
+        self.lunar_days = ['初一', '初二', '初三', '初四', '初五', '初六', '初七', '初八', '初九', '初十',
+                          '十一', '十二', '十三', '十四', '十五', '十六', '十七', '十八', '十九', '二十',
+                          '廿一', '廿二', '廿三', '廿四', '廿五', '廿六', '廿七', '廿八', '廿九', '三十']
+
+        # 地支六冲关系：子午冲、丑未冲、寅申冲、卯酉冲、辰戌冲、巳亥冲
+        self.chong_map = [6, 7, 8, 9, 10, 11, 0, 1, 2, 3, 4, 5]
+        # 煎方规则：申子辰日煎南、亥卯未日煎西、寅午戌日煎北、巳酉丑日煎东
+        self.sha_map = {0:'南', 4:'南', 8:'南', 3:'西', 7:'西', 11:'西', 2:'北', 6:'北', 10:'北', 1:'东', 5:'东', 9:'东'}
+
+        # 每日冲煞缓存：公历日序号 -> 只读结果
+        self.daily_cache = daily_cache if daily_cache is not None else LRUCache(DAILY_CACHE_SIZE)
+        self._day_table = None
+        # 桃花基础强度表：(年份余数, 桃花星, 性别) -> 各年龄基础强度
+        self.peach_base_cache = LRUCache(PEACH_BASE_CACHE_SIZE)
+        self._base_day_ordinal = datetime(2024, 1, 1).toordinal()
+
+        # 生肖配对表（基于传统命理学）
+        self.zodiac_match = {
+            'sanhe': [[0,4,8], [3,7,11], [2,6,10], [1,5,9]],  # 三合局
+            'liuhe': [[0,1], [2,11], [3,10], [4,9], [5,8], [6,7]],  # 六合
+            'liuchong': [[0,6], [1,7], [2,8], [3,9], [4,10], [5,11]],  # 六冲
+            'liuhai': [[0,7], [1,6], [2,5], [3,4], [8,11], [9,10]]  # 六害
+        }
+
+        # 五行映射
+        self.wuxing_map = {'甲':'木','乙':'木','丙':'火','丁':'火','戊':'土','己':'土','庚':'金','辛':'金','壬':'水','癸':'水'}
+        self.zhi_wuxing = {'子':'水','丑':'土','寅':'木','卯':'木','辰':'土','巳':'火','午':'火','未':'土','申':'金','酉':'金','戌':'土','亥':'水'}
+
+        # 五行生克关系
+        self.sheng_map = {'木':'火', '火':'土', '土':'金', '金':'水', '水':'木'}
+        self.ke_map = {'木':'土', '土':'水', '水':'火', '火':'金', '金':'木'}
+
+        # 十神分析
+        self.shishen_map = {
+            ('同','同'): '比肩', ('同','异'): '劫财',
+            ('生','同'): '枭印', ('生','异'): '正印',
+            ('泄','同'): '食神', ('泄','异'): '伤官',
+            ('克','同'): '偏财', ('克','异'): '正财',
+            ('被克','同'): '七杀', ('被克','异'): '正官'
+        }
+
+        # 格局列表（按日柱干支序号取模）
+        self.geju_list = ["正印格", "偏印格", "食神格", "伤官格", "正财格", "偏财格",
+                          "正官格", "七杀格"]
+
+        # 按下标预先展开的查表数据，供 calculate_bazi / calculate_bazi_batch 复用
+        self._gan_wuxing = [self.wuxing_map[g] for g in self.tiangan]
+        self._zhi_wuxing = [self.zhi_wuxing[z] for z in self.dizhi]
+        # 日主五行 -> (生我者, 我生者, 克我者, 我克者)
+        self._wuxing_relations = {}
+        for wx in self.wuxing:
+            sheng_wo = [k for k, v in self.sheng_map.items() if v == wx][0]
+            ke_wo = [k for k, v in self.ke_map.items() if v == wx][0]
+            self._wuxing_relations[wx] = (sheng_wo, self.sheng_map[wx], ke_wo, self.ke_map[wx])
+
+        # 生肖配对预先计算表，下标为 男方生肖序号*12 + 女方生肖序号
+        self._shengxiao_idx = {sx: i for i, sx in enumerate(self.shengxiao)}
+        self.zodiac_scores: Tuple[int, ...] = tuple(
+            self._compute_zodiac_score(m_idx, f_idx) for m_idx in range(12) for f_idx in range(12))
+        # 详细分析分数（顺序同 MATCH_DETAIL_NAMES，基于生肖索引确定性计算）
+        self.match_detail_scores: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(low + self._deterministic_int(pair + offset, 0, span)
+                  for offset, low, span in MATCH_DETAIL_RULES)
+            for pair in range(144))
+
+    # ============ 确定性算法工具函数 ============
+    # 算法见 seeded_random 模块（正弦生成器，与网页版 Utils 一致）
+    _seeded_random = staticmethod(sin_random)
+    _deterministic_int = staticmethod(sin_int)
+
+    def _deterministic_slice(self, arr: List, n: int, seed: int) -> List:
+        """确定性打乱数组并取前n个"""
+        return sin_slice(arr, n, seed)
+
+    def _get_date_seed(self, date: datetime) -> int:
+        """获取日期种子"""
+        return date.year * 10000 + date.month * 100 + date.day
+
+    # ============ 算命大师 ============
+    def validate_date(self, year: int, month: int, day: int, hour: int,
+                      year_range: Tuple[int, int] = BIRTH_YEAR_RANGE) -> Optional[str]:
+        """验证出生日期范围
+
+        Args:
+            year_range: 允许的年份范围（含两端），桃花运用 PEACH_BIRTH_YEAR_RANGE
+
+        Returns:
+            错误信息，输入合法时返回 None
+        """
+        min_year, max_year = year_range
+        if not (min_year <= year <= max_year):
+            return f"年份范围应在{min_year}-{max_year}之间"
+        if not (1 <= month <= 12):
+            return "月份范围应在1-12之间"
+        if not (1 <= day <= 31):
+            return "日期范围应在1-31之间"
+        if not (0 <= hour <= 23):
+            return "时辰范围应在0-23之间"
+        return None
+
+    def get_geju(self, day_gan: str, day_zhi: str) -> str:
+        """基于日柱确定性计算格局"""
+        seed = self.tiangan.index(day_gan) * 12 + self.dizhi.index(day_zhi)
+        return self.geju_list[seed % len(self.geju_list)]
+
+    def calculate_bazi(self, year: int, month: int, day: int, hour: int) -> Dict[str, Any]:
+        """计算八字命盘的结构化结果
+
+        Returns:
+            Dict包含: pillars, bazi, shengxiao, day_gan, day_zhi, wuxing_count,
+            day_wuxing, is_strong, xi_shen, ji_shen, geju
+        """
+        tiangan = self.tiangan
+        dizhi = self.dizhi
+
+        year_gan_idx = (year - 4) % 10
+        year_zhi_idx = (year - 4) % 12
+        month_gan_idx = (year * 12 + month + 3) % 10
+        month_zhi_idx = (month + 1) % 12
+        day_gan_idx = (year * 365 + month * 30 + day) % 10
+        day_zhi_idx = (year * 365 + month * 30 + day) % 12
+        hour_zhi_idx = (hour + 1) // 2 % 12
+        hour_gan_idx = (day_gan_idx * 2 + hour_zhi_idx) % 10
+
+        year_gan, year_zhi = tiangan[year_gan_idx], dizhi[year_zhi_idx]
+        month_gan, month_zhi = tiangan[month_gan_idx], dizhi[month_zhi_idx]
+        day_gan, day_zhi = tiangan[day_gan_idx], dizhi[day_zhi_idx]
+        hour_gan, hour_zhi = tiangan[hour_gan_idx], dizhi[hour_zhi_idx]
+
+        bazi = f"{year_gan}{year_zhi} {month_gan}{month_zhi} {day_gan}{day_zhi} {hour_gan}{hour_zhi}"
+
+        # 统计五行
+        gan_wuxing = self._gan_wuxing
+        zhi_wuxing = self._zhi_wuxing
+        wuxing_count = {'金':0, '木':0, '水':0, '火':0, '土':0}
+        for idx in (year_gan_idx, month_gan_idx, day_gan_idx, hour_gan_idx):
+            wuxing_count[gan_wuxing[idx]] += 1
+        for idx in (year_zhi_idx, month_zhi_idx, day_zhi_idx, hour_zhi_idx):
+            wuxing_count[zhi_wuxing[idx]] += 1
+
+        day_wuxing = gan_wuxing[day_gan_idx]  # 日主五行
+        sheng_wo, wo_sheng, ke_wo, wo_ke = self._wuxing_relations[day_wuxing]
+
+        # 日主强弱判断
+        help_count = wuxing_count[day_wuxing] + wuxing_count[sheng_wo]
+        drain_count = wuxing_count[wo_sheng] + wuxing_count[wo_ke] + wuxing_count[ke_wo]
+        is_strong = help_count >= drain_count
+
+        # 喜用神分析
+        if is_strong:
+            xi_shen = [wo_sheng, wo_ke, ke_wo]
+            ji_shen = [day_wuxing, sheng_wo]
+        else:
+            xi_shen = [day_wuxing, sheng_wo]
+            ji_shen = [wo_sheng, wo_ke, ke_wo]
+
+        # 格局判断（基于日柱确定性计算）
+        geju = self.geju_list[(day_gan_idx * 12 + day_zhi_idx) % len(self.geju_list)]
+
+        return {
+            'pillars': [("年", year_gan, year_zhi), ("月", month_gan, month_zhi),
+                        ("日", day_gan, day_zhi), ("时", hour_gan, hour_zhi)],
+            'bazi': bazi,
+            'shengxiao': self.shengxiao[year_zhi_idx],
+            'day_gan': day_gan,
+            'day_zhi': day_zhi,
+            'wuxing_count': wuxing_count,
+            'day_wuxing': day_wuxing,
+            'is_strong': is_strong,
+            'xi_shen': xi_shen,
+            'ji_shen': ji_shen,
+            'geju': geju,
+        }
+
+    def calculate_bazi_batch(self, records: Iterable[Tuple[int, int, int, int]]) -> List[Dict[str, Any]]:
+        """批量计算八字命盘
+
+        Args:
+            records: (year, month, day, hour) 元组序列
+
+        Returns:
+            与 records 顺序一致的 calculate_bazi 结果列表；查表数据在引擎
+            构造时建好，整批记录共用
+        """
+        calculate = self.calculate_bazi
+        return [calculate(year, month, day, hour) for year, month, day, hour in records]
+
+    def calculate_fortune(self, year: int, month: int, day: int, hour: int,
+                          current_year: Optional[int] = None) -> Dict[str, Any]:
+        """计算完整的命理分析报告
+
+        Args:
+            current_year: 流年年份，默认取当前年份
+
+        Returns:
+            calculate_bazi 的全部字段，另含 readings, year_gz, year_wx,
+            year_luck, year_summary, year_details, base_info, life_readings
+        """
+        from texts import READINGS, LIFE_READINGS, YEAR_LUCK_TEXTS  # 文本表首次计算时才导入
+
+        result = self.calculate_bazi(year, month, day, hour)
+        day_gan = result['day_gan']
+        day_wuxing = result['day_wuxing']
+        is_strong = result['is_strong']
+        xi_shen = result['xi_shen']
+        ji_shen = result['ji_shen']
+
+        result['readings'] = READINGS.get(day_wuxing, READINGS['木'])[is_strong]
+
+        # 流年运势
+        if current_year is None:
+            current_year = datetime.now().year
+        year_wx = self.wuxing_map[self.tiangan[(current_year-4)%10]]
+        if year_wx in xi_shen:
+            year_luck = "大吉"
+        elif year_wx == day_wuxing:
+            year_luck = "平稳"
+        else:
+            year_luck = "平常"
+        year_summary, year_details = YEAR_LUCK_TEXTS[year_luck]
+
+        result['year_gz'] = f"{self.tiangan[(current_year-4)%10]}{self.dizhi[(current_year-4)%12]}年"
+        result['year_wx'] = year_wx
+        result['year_luck'] = year_luck
+        result['year_summary'] = year_summary
+        result['year_details'] = year_details
+
+        # 一生命运概述
+        strength = '身旺' if is_strong else '身弱'
+        result['base_info'] = (f"您的日主为{day_gan}（属{day_wuxing}），{strength}，"
+                               f"喜用神为{'、'.join(xi_shen[:2])}，忌神为{'、'.join(ji_shen[:2])}。")
+        result['life_readings'] = LIFE_READINGS.get(day_wuxing, LIFE_READINGS['木'])[is_strong]
+
+        return result
+
+    # ============ 黄道吉日 ============
+    def search_auspicious(self, event: str, today: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """查询近三个月的事项吉日
+
+        Returns:
+            List[Dict]，每项包含: date, lunar, luck_level
+        """
+        if today is None:
+            today = datetime.now()
+        base_seed = self._get_date_seed(today)
+
+        # 事项类型索引（用于确定性计算）
+        event_idx = EVENT_TYPES.index(event) if event in EVENT_TYPES else 0
+        luck_levels = ["★★★★★ 大吉", "★★★★☆ 上吉", "★★★☆☆ 中吉"]
+
+        # 生成12个吉日（三个月内）
+        days = []
+        for i in range(12):
+            # 基于日期、事项和序号确定性计算天数
+            seed = base_seed + event_idx * 100 + i * 7
+            days_add = 3 + i * 7 + self._deterministic_int(seed, 0, 4)
+            if days_add > 90:
+                days_add = 80 + self._deterministic_int(seed + 500, 0, 10)
+            lucky_date = today + timedelta(days=days_add)
+
+            days.append({
+                'date': lucky_date,
+                'lunar': self.get_lunar_date(lucky_date),
+                'luck_level': luck_levels[self._deterministic_int(seed + 1000, 0, 2)],
+            })
+        return days
+
+    def find_auspicious_days(self, event: str, start: datetime, end: datetime,
+                             avoid_zodiac: Iterable[str] = (), avoid_sha: Iterable[str] = (),
+                             ji_shen: Iterable[str] = (), weekend_only: bool = False,
+                             limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """在任意日期区间 [start, end) 内按条件筛选并排序吉日（1900-2100年）
+
+        直接扫描 DayTable 的日干支/吉神字节数组，只对最终返回的日期计算农历和冲煞详情。
+
+        Args:
+            event: 事项类型（EVENT_TYPES 之一），对应的吉神 EVENT_JI_SHEN 会加分
+            start, end: 日期区间，含 start 不含 end
+            avoid_zodiac: 排除与这些生肖相冲的日子
+            avoid_sha: 排除煎这些方位的日子（如 '东'）
+            ji_shen: 只保留吉神包含其中任一项的日子（如 '天德'、'月德'）
+            weekend_only: 只保留周六、周日
+            limit: 最多返回条数，None 表示全部
+
+        Returns:
+            List[Dict]，按吉利程度从高到低（同分按日期先后），每项包含:
+            date, lunar, luck_level, score, daily (get_daily_chongsha 结果)
+        """
+        table = self.day_table
+        days = table.slice(start, end)
+        start_pos = table.index(start)
+
+        # 按地支下标排除相冲生肖和煎方
+        avoid_zodiac = set(avoid_zodiac)
+        avoid_sha = set(avoid_sha)
+        zhi_ok = [table.zhi_info(z)['chong_sx'] not in avoid_zodiac
+                  and table.zhi_info(z)['sha_dir'] not in avoid_sha for z in range(12)]
+
+        # 按吉神组合编号预先计算分数（不满足吉神条件的记为 0）
+        required = list(ji_shen)
+        favored = EVENT_JI_SHEN.get(event)
+        ji_scores = []
+        for name in table.ji_names:
+            names = name.split('、')
+            if required and not any(r in names for r in required):
+                ji_scores.append(0)
+                continue
+            # 天德、月德为上吉之神；事项对应的吉神次之
+            score = 1
+            if '天德' in names:
+                score += 3
+            if '月德' in names:
+                score += 3
+            if favored in names:
+                score += 2
+            ji_scores.append(score)
+
+        first_ordinal = start.toordinal()
+        ranked = []
+        for offset, (zhi_idx, ji_code) in enumerate(zip(days['zhi'], days['ji'])):
+            score = ji_scores[ji_code]
+            if not score or not zhi_ok[zhi_idx]:
+                continue
+            # date.weekday(): 周六为5、周日为6
+            if weekend_only and (first_ordinal + offset + 6) % 7 < 5:
+                continue
+            ranked.append((-score, offset))
+        ranked.sort()
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        luck_levels = ["★★★★★ 大吉", "★★★★☆ 上吉", "★★★☆☆ 中吉"]
+        results = []
+        for neg_score, offset in ranked:
+            date = start + timedelta(days=offset)
+            score = -neg_score
+            results.append({
+                'date': date,
+                'lunar': self.get_lunar_date(date),
+                'luck_level': luck_levels[0 if score >= 4 else 1 if score >= 3 else 2],
+                'score': score,
+                'daily': MappingProxyType(table.info_at(start_pos + offset)),
+            })
+        return results
+
+    # ============ 老黄历 ============
+    def get_almanac(self, date: Optional[datetime] = None) -> Dict[str, Any]:
+        """计算某日的老黄历信息
+
+        Returns:
+            Dict包含: date, lunar, year_gz, shengxiao, yi_list, ji_list,
+            daily (get_daily_chongsha 结果)
+        """
+        if date is None:
+            date = datetime.now()
+        return self._build_almanac(date, self.get_daily_chongsha(date))
+
+    def iter_almanac(self, start: Optional[datetime] = None, count: int = 365) -> Iterator[Dict[str, Any]]:
+        """从 start 开始逐日生成老黄历，每次只产生一天的记录
+
+        每项字段同 get_almanac。逐日查表计算，不经过 daily_cache，
+        以免批量导出挤掉服务中的热点日期；内存占用与 count 无关。
+        """
+        if start is None:
+            start = datetime.now()
+        for offset in range(count):
+            date = start + timedelta(days=offset)
+            yield self._build_almanac(date, self._compute_daily_chongsha(date))
+
+    def _build_almanac(self, date: datetime, daily: Mapping[str, str]) -> Dict[str, Any]:
+        from texts import YI_ITEMS, JI_ITEMS
+
+        seed = self._get_date_seed(date)
+        return {
+            'date': date,
+            'lunar': self.get_lunar_date(date),
+            'year_gz': f"{self.tiangan[(date.year-4)%10]}{self.dizhi[(date.year-4)%12]}年",
+            'shengxiao': self.shengxiao[(date.year-4)%12],
+            'yi_list': self._deterministic_slice(YI_ITEMS, 5, seed),
+            'ji_list': self._deterministic_slice(JI_ITEMS, 4, seed + 1000),
+            'daily': daily,
+        }
+
+    # ============ 婚姻配对 ============
+    def get_zodiac_score(self, male: str, female: str) -> int:
+        """基于生肖配对表确定性计算分数（查预先计算的 12×12 分数表）"""
+        return self.zodiac_scores[self._shengxiao_idx[male] * 12 + self._shengxiao_idx[female]]
+
+    def score_candidates(self, zodiac: str, candidates: Iterable[str], gender: str = '男') -> List[int]:
+        """批量计算一个生肖与多个候选生肖的配对分数
+
+        Args:
+            zodiac: 本人生肖
+            candidates: 候选人生肖序列
+            gender: 本人性别（'男' 或 '女'），决定本人在配对中作为男方还是女方
+
+        Returns:
+            与 candidates 一一对应的分数列表
+        """
+        idx = self._shengxiao_idx
+        scores = self.zodiac_scores
+        if gender == '女':
+            f_idx = idx[zodiac]
+            return [scores[idx[c] * 12 + f_idx] for c in candidates]
+        row = idx[zodiac] * 12
+        return [scores[row + idx[c]] for c in candidates]
+
+    def _compute_zodiac_score(self, m_idx: int, f_idx: int) -> int:
+        """按三合、六合、六冲、六害规则计算配对分数（用于构建分数表）"""
+        # 检查三合（+25分）
+        sanhe_bonus = 0
+        for group in self.zodiac_match['sanhe']:
+            if m_idx in group and f_idx in group:
+                sanhe_bonus = 25
+                break
+
+        # 检查六合（+20分）
+        liuhe_bonus = 0
+        for pair in self.zodiac_match['liuhe']:
+            if (pair[0] == m_idx and pair[1] == f_idx) or (pair[0] == f_idx and pair[1] == m_idx):
+                liuhe_bonus = 20
+                break
+
+        # 检查六冲（-20分）
+        liuchong_penalty = 0
+        for pair in self.zodiac_match['liuchong']:
+            if (pair[0] == m_idx and pair[1] == f_idx) or (pair[0] == f_idx and pair[1] == m_idx):
+                liuchong_penalty = -20
+                break
+
+        # 检查六害（-10分）
+        liuhai_penalty = 0
+        for pair in self.zodiac_match['liuhai']:
+            if (pair[0] == m_idx and pair[1] == f_idx) or (pair[0] == f_idx and pair[1] == m_idx):
+                liuhai_penalty = -10
+                break
+
+        # 基础分70分
+        base_score = 70
+        total_score = min(99, max(60, base_score + sanhe_bonus + liuhe_bonus + liuchong_penalty + liuhai_penalty))
+
+        return total_score
+
+    def _match_level(self, score: int) -> Tuple[str, str]:
+        """配对分数 -> (等级, 描述)"""
+        if score >= 90:
+            return "天作之合", "此乃天赐良缘，二人八字相合，五行互补，婚后必定琴瑟和鸣，白头偕老。"
+        elif score >= 80:
+            return "上等婚配", "二人姻缘不浅，性格互补，相处融洽，携手同行定能共创美好未来。"
+        elif score >= 70:
+            return "中等婚配", "姻缘尚可，需要双方多加包容理解，用心经营方能幸福美满。"
+        else:
+            return "需要磨合", "二人性格有所冲突，需要更多沟通与理解，建议婚前多加考虑。"
+
+    def calculate_match(self, male: str, female: str) -> Dict[str, Any]:
+        """计算生肖配对结果
+
+        Returns:
+            Dict包含: male, female, score, level, desc, details
+        """
+        pair = self._shengxiao_idx[male] * 12 + self._shengxiao_idx[female]
+        score = self.zodiac_scores[pair]
+        level, desc = self._match_level(score)
+
+        return {
+            'male': male,
+            'female': female,
+            'score': score,
+            'level': level,
+            'desc': desc,
+            'details': list(zip(MATCH_DETAIL_NAMES, self.match_detail_scores[pair])),
+        }
+
+    # ============ 桃花运 ============
+    def get_peach_blossom_star(self, year_zhi_idx: int) -> Tuple[int, str]:
+        """基于年支计算桃花星位置
+
+        桃花星规则（寅午戌年桃花在卯，申子辰年桃花在酉，巳酉丑年桃花在午，亥卯未年桃花在子）
+        """
+        # 地支索引: 0-子 1-丑 2-寅 3-卯 4-辰 5-巳 6-午 7-未 8-申 9-酉 10-戌 11-亥
+        peach_map = {
+            2: (3, '卯'), 6: (3, '卯'), 10: (3, '卯'),  # 寅午戌年桃花在卯
+            8: (9, '酉'), 0: (9, '酉'), 4: (9, '酉'),   # 申子辰年桃花在酉
+            5: (6, '午'), 9: (6, '午'), 1: (6, '午'),   # 巳酉丑年桃花在午
+            11: (0, '子'), 3: (0, '子'), 7: (0, '子'),  # 亥卯未年桃花在子
+        }
+        return peach_map.get(year_zhi_idx, (3, '卯'))
+
+    def calculate_peach_periods(self, birth_year: int, birth_month: int, birth_day: int,
+                                gender: str, year_zhi_idx: int, peach_star_idx: int,
+                                current_year: Optional[int] = None) -> List[Dict]:
+        """确定性计算一生中的桃花运时间段
+
+        基于：
+        1. 流年地支与桃花星的关系
+        2. 大运周期
+        3. 性别影响（男女起运不同）
+        """
+        periods = []
+        seed = birth_year * 10000 + birth_month * 100 + birth_day
+
+        if current_year is None:
+            current_year = datetime.now().year
+
+        for age, base_strength, peach_type in self._get_peach_base(birth_year % 12, peach_star_idx, gender):
+            target_year = birth_year + age
+
+            # 确定性微调（基于生日种子）
+            fine_tune = self._deterministic_int(seed + age * 7, -5, 5)
+
+            # 确保在合理范围内
+            peach_strength = max(5, min(98, base_strength + fine_tune))
+
+            if peach_strength >= 35:  # 只记录较显著的桃花年
+                periods.append({
+                    'age': age,
+                    'year': target_year,
+                    'strength': peach_strength,
+                    'type': peach_type,
+                    'is_past': target_year < current_year,
+                    'is_current': target_year == current_year
+                })
+
+        return periods
+
+    def _get_peach_base(self, birth_year_mod: int, peach_star_idx: int,
+                        gender: str) -> Tuple[Tuple[int, int, str], ...]:
+        """桃花强度中与生日无关的部分（流年、大运、年龄、性别），按组合缓存
+
+        流年地支只取决于出生年份除以12的余数，因此同一 (余数, 桃花星, 性别)
+        的人共用一张表。微调幅度为 ±5，微调后也不可能达到 35 的年龄直接省略。
+
+        Returns:
+            (年龄, 基础强度, 桃花类型) 元组序列
+        """
+        key = (birth_year_mod, peach_star_idx, gender)
+        base = self.peach_base_cache.get(key)
+        if base is not None:
+            return base
+
+        gender_factor = 1 if gender == '男' else 0
+
+        # 桃花星相关的地支（桃花星本位、六合位、三合位）
+        peach_related = self.get_peach_related_zhi(peach_star_idx)
+
+        life_span = 58  # 分析到58岁
+
+        rows = []
+        for age in range(18, life_span + 1):  # 从18岁开始
+            year_zhi = (birth_year_mod + age - 4) % 12
+
+            # 计算该年的桃花运强度
+            peach_strength = 0
+            peach_type = ""
+
+            # 流年地支正好是桃花星（+40%）
+            if year_zhi == peach_star_idx:
+                peach_strength += 40
+                peach_type = "流年桃花"
+            # 流年地支与桃花星六合（+30%）
+            elif year_zhi in peach_related['liuhe']:
+                peach_strength += 30
+                peach_type = "合桃花"
+            # 流年地支与桃花星三合（+25%）
+            elif year_zhi in peach_related['sanhe']:
+                peach_strength += 25
+                peach_type = "会桃花"
+
+            # 大运影响（10年一运）
+            dayun_idx = ((age - 1) // 10 + gender_factor) % 12
+            if dayun_idx == peach_star_idx:
+                peach_strength += 20
+            elif dayun_idx in peach_related['liuhe']:
+                peach_strength += 15
+
+            # 年龄修正（青年期桃花更旺）
+            if 18 <= age <= 35:
+                peach_strength += 10
+            elif 36 <= age <= 50:
+                peach_strength += 5
+
+            # 性别修正
+            if gender == '女' and 25 <= age <= 40:
+                peach_strength += 5
+            elif gender == '男' and 28 <= age <= 45:
+                peach_strength += 5
+
+            if peach_strength + 5 >= 35:
+                rows.append((age, peach_strength, peach_type if peach_type else "平常桃花"))
+
+        base = tuple(rows)
+        self.peach_base_cache.put(key, base)
+        return base
+
+    def calculate_peach_timelines(self, records: Iterable[Tuple[int, int, int, str]],
+                                  current_year: Optional[int] = None) -> List[List[Dict]]:
+        """批量计算桃花运时段（含桃花质量）
+
+        Args:
+            records: (年, 月, 日, 性别) 序列
+
+        Returns:
+            与 records 一一对应的列表，每项为 calculate_peach_periods 的结果，
+            每个时段另含 quality, quality_desc, quality_color, maturity
+        """
+        if current_year is None:
+            current_year = datetime.now().year
+        sin, floor = math.sin, math.floor
+        maturity_bases = {age: self._peach_maturity_base(age) for age in range(18, 59)}
+        quality_level = self._peach_quality_level
+
+        # 与 calculate_peach_periods + get_peach_quality 逐条计算结果一致，
+        # 这里把 _deterministic_int 展开以减少百万级调用的开销
+        timelines = []
+        for year, month, day, gender in records:
+            peach_star_idx, _ = self.get_peach_blossom_star((year - 4) % 12)
+            seed = year * 10000 + month * 100 + day
+            rows = []
+            for age, base_strength, peach_type in self._get_peach_base(year % 12, peach_star_idx, gender):
+                x = sin(seed + age * 7) * 10000
+                strength = max(5, min(98, base_strength - 5 + int((x - floor(x)) * 11)))
+                if strength < 35:
+                    continue
+                x = sin(seed + strength * 3 + age * 11) * 10000
+                maturity = max(20, min(95, maturity_bases[age] - 10 + int((x - floor(x)) * 31)))
+                quality, quality_desc, quality_color = PEACH_QUALITIES[quality_level(strength, maturity)]
+                target_year = year + age
+                rows.append({
+                    'age': age,
+                    'year': target_year,
+                    'strength': strength,
+                    'type': peach_type,
+                    'is_past': target_year < current_year,
+                    'is_current': target_year == current_year,
+                    'quality': quality,
+                    'quality_desc': quality_desc,
+                    'quality_color': quality_color,
+                    'maturity': maturity,
+                })
+            timelines.append(rows)
+        return timelines
+
+    def get_peach_related_zhi(self, peach_star_idx: int) -> Dict[str, List[int]]:
+        """获取与桃花星相关的地支（六合、三合）"""
+        # 六合关系
+        liuhe_map = {0:1, 1:0, 2:11, 11:2, 3:10, 10:3, 4:9, 9:4, 5:8, 8:5, 6:7, 7:6}
+        # 三合局
+        sanhe_groups = [[8,0,4], [11,3,7], [2,6,10], [5,9,1]]  # 申子辰、亥卯未、寅午戌、巳酉丑
+
+        related = {'liuhe': [], 'sanhe': []}
+
+        # 六合
+        if peach_star_idx in liuhe_map:
+            related['liuhe'] = [liuhe_map[peach_star_idx]]
+
+        # 三合
+        for group in sanhe_groups:
+            if peach_star_idx in group:
+                related['sanhe'] = [z for z in group if z != peach_star_idx]
+                break
+
+        return related
+
+    def get_peach_quality(self, strength: int, age: int, gender: str, seed: int) -> Tuple[str, str, str, int]:
+        """确定性判断桃花质量（好坏程度）"""
+        # 基于强度和年龄确定桃花质量
+        quality_seed = seed + strength * 3 + age * 11
+
+        # 计算成熟度（桃花是否成熟）
+        maturity_base = self._peach_maturity_base(age)
+
+        maturity = maturity_base + self._deterministic_int(quality_seed, -10, 20)
+        maturity = max(20, min(95, maturity))
+
+        quality, quality_desc, quality_color = PEACH_QUALITIES[self._peach_quality_level(strength, maturity)]
+        return quality, quality_desc, quality_color, maturity
+
+    @staticmethod
+    def _peach_maturity_base(age: int) -> int:
+        """成熟度基础值（按年龄）"""
+        if 22 <= age <= 35:
+            return 70
+        elif 18 <= age < 22 or 36 <= age <= 45:
+            return 55
+        return 40
+
+    @staticmethod
+    def _peach_quality_level(strength: int, maturity: int) -> int:
+        """桃花质量等级（PEACH_QUALITIES 下标）"""
+        if strength >= 70 and maturity >= 70:
+            return 0
+        elif strength >= 60 and maturity >= 55:
+            return 1
+        elif strength >= 45:
+            return 2
+        return 3
+
+    @staticmethod
+    def select_top_periods(periods: List[Dict], n: int = 15) -> List[Dict]:
+        """取 18-58 岁中强度最高的 n 个桃花年，按年龄排序"""
+        filtered_periods = [p for p in periods if 18 <= p['age'] <= 58]
+        top_periods = sorted(filtered_periods, key=lambda x: x['strength'], reverse=True)[:n]
+        return sorted(top_periods, key=lambda x: x['age'])
+
+    def calculate_peach_blossom(self, year: int, month: int, day: int, gender: str,
+                                current_year: Optional[int] = None) -> Dict[str, Any]:
+        """计算完整的桃花运分析报告
+
+        Returns:
+            Dict包含: year_zhi, shengxiao, gender, peach_star, meaning, periods,
+            top_periods（含 quality/quality_desc/quality_color/maturity）, summary
+        """
+        from texts import PEACH_MEANINGS
+
+        # 计算年支和桃花星
+        year_zhi_idx = (year - 4) % 12
+        peach_star_idx, peach_star = self.get_peach_blossom_star(year_zhi_idx)
+
+        # 计算桃花运时段
+        periods = self.calculate_peach_periods(year, month, day, gender, year_zhi_idx, peach_star_idx,
+                                               current_year)
+
+        top_periods = self.select_top_periods(periods)
+
+        seed = year * 10000 + month * 100 + day
+        rows = []
+        for p in top_periods:
+            quality, quality_desc, quality_color, maturity = self.get_peach_quality(p['strength'], p['age'], gender, seed)
+            rows.append(dict(p, quality=quality, quality_desc=quality_desc,
+                             quality_color=quality_color, maturity=maturity))
+
+        # 统计桃花运特征（18-58岁范围）
+        high_periods = [p for p in periods if p['strength'] >= 60 and 18 <= p['age'] <= 58]
+        future_high = [p for p in high_periods if not p['is_past']]
+
+        summary = []
+        if len(high_periods) >= 5:
+            summary.append(f"● 您一生桃花运较旺，共有{len(high_periods)}个显著桃花年，异性缘分较好。")
+        elif len(high_periods) >= 2:
+            summary.append(f"● 您一生桃花运中等，共有{len(high_periods)}个显著桃花年，需把握重要时机。")
+        else:
+            summary.append("● 您一生桃花运较淡，异性缘需主动争取，不宜坐等。")
+
+        if future_high:
+            next_peak = min(future_high, key=lambda x: x['year'])
+            summary.append(f"● 您未来最近的桃花旺年在{next_peak['year']}年（{next_peak['age']}岁），强度{next_peak['strength']}%。")
+
+        # 基于性别的建议
+        if gender == '男':
+            summary.append("● 男命桃花旺时，容易遇到心仪对象，但需防烂桃花影响家庭和睦。")
+        else:
+            summary.append("● 女命桃花旺时，容易被追求，但需明辨真心，防止被花言巧语迷惑。")
+
+        return {
+            'year_zhi': self.dizhi[year_zhi_idx],
+            'shengxiao': self.shengxiao[year_zhi_idx],
+            'gender': gender,
+            'peach_star': peach_star,
+            'meaning': PEACH_MEANINGS.get(peach_star, "桃花星特质独特，异性缘丰富。"),
+            'periods': periods,
+            'top_periods': rows,
+            'summary': summary,
+        }
+
+    # ============ 农历与每日冲煞 ============
+    def get_lunar_date(self, date):
+        """公历日期转农历月日文本（如 "闰六月初五"）
+
+        1900-2100 年查 lunar_table 农历数据表，超出范围时使用简化计算。
+        """
+        lunar = to_lunar(date)
+        if lunar is None:
+            return self._get_lunar_general(date)
+
+        _, month, day, is_leap = lunar
+        month_str = self.lunar_months[month - 1]
+        if is_leap:
+            month_str = "闰" + month_str
+        return f"{month_str}{self.lunar_days[day - 1]}"
+
+    def _get_lunar_general(self, date):
+        # 简化计算，仅供参考
+        month_idx = (date.month + 10) % 12
+        day_idx = (date.day + 18) % 30
+        return f"{self.lunar_months[month_idx]}{self.lunar_days[day_idx]}"
+
+    def get_daily_chongsha(self, date: datetime = None) -> Mapping[str, str]:
+        """基于传统命理学计算每日冲煎信息（确保各板块一致）
+
+        1900-2100 年内的日期直接查预先计算的 DayTable，其余日期现场计算。
+        结果按公历日序号存入 daily_cache，返回只读映射，调用方之间不会互相改动。
+
+        Returns:
+            只读Mapping包含: day_gan, day_zhi, chong_sx, chong_zhi, sha_dir, ji_shen, xiong_shen
+        """
+        if date is None:
+            date = datetime.now()
+        return self.daily_cache.get_or_compute(date.toordinal(), lambda: self._compute_daily_chongsha(date))
+
+    def _compute_daily_chongsha(self, date: datetime) -> Mapping[str, str]:
+        table = self.day_table
+        if table.contains(date):
+            info = table.lookup(date)
+        else:
+            gan_idx, zhi_idx = self._get_day_ganzhi_idx(date.toordinal())
+            info = self._build_daily_info(gan_idx, zhi_idx, self._get_ji_shen(gan_idx, date.month))
+        return MappingProxyType(info)
+
+    @property
+    def day_table(self):
+        """1900-2100 年逐日干支/冲煞表（首次访问时构建）"""
+        if self._day_table is None:
+            self._day_table = DayTable(self)
+        return self._day_table
+
+    def _get_day_ganzhi_idx(self, ordinal: int) -> Tuple[int, int]:
+        """由公历日序号计算日干支下标"""
+        # 基准日：2024年1月1日 = 甲辰日（天干索引0，地支索引4）
+        diff_days = ordinal - self._base_day_ordinal
+        return diff_days % 10, (4 + diff_days) % 12
+
+    def _get_ji_shen(self, gan_idx: int, month: int) -> str:
+        """计算吉神（基于月份和日干）"""
+        tian_de_gan = [6, 7, 8, 9, 0, 2, 6, 7, 8, 9, 0, 2]
+        yue_de_gan = [8, 0, 2, 4, 6, 8, 0, 2, 4, 6, 8, 0]
+
+        ji_shen_list = []
+        if gan_idx == tian_de_gan[month - 1]:
+            ji_shen_list.append('天德')
+        if gan_idx == yue_de_gan[month - 1]:
+            ji_shen_list.append('月德')
+        if not ji_shen_list:
+            other_ji_shen = ['天恩', '福星', '文昌', '驿马', '天喜', '玉堂']
+            ji_shen_list.append(other_ji_shen[(gan_idx + month) % len(other_ji_shen)])
+        return '、'.join(ji_shen_list)
+
+    def _build_daily_info(self, gan_idx: int, zhi_idx: int, ji_shen: str) -> Dict[str, str]:
+        """由日干支下标和吉神组装每日冲煎信息"""
+        # 根据日支计算冲的生肖（地支六冲）
+        chong_zhi_idx = self.chong_map[zhi_idx]
+
+        # 计算凶神（基于日支）
+        xiong_shen_list = ['五鬼', '死气', '白虎', '天刑', '朱雀', '天狗']
+
+        return {
+            'day_gan': self.tiangan[gan_idx],
+            'day_zhi': self.dizhi[zhi_idx],
+            'chong_sx': self.shengxiao[chong_zhi_idx],
+            'chong_zhi': self.dizhi[chong_zhi_idx],
+            'sha_dir': self.sha_map[zhi_idx],
+            'ji_shen': ji_shen,
+            'xiong_shen': xiong_shen_list[zhi_idx % len(xiong_shen_list)]
+        }
@@ -0,0 +1,116 @@
+"""
+玄机命理 - NumPy 向量化计算后端（可选）
+
+八字四柱的推算只是整数取模，五行统计只是固定查表，因此可以对整批出生数据
+一次性做数组运算。结果与 FortuneEngine.calculate_bazi 逐条计算完全一致。
+
+需要安装 numpy：pip install numpy
+
+Author: Mystery Fortune Team
+"""
+
+from typing import Dict
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选依赖
+    np = None
+
+from engine import FortuneEngine
+
+
+# 四柱下标数组的键名（与 calculate_bazi 中 pillars 的顺序一致）
+PILLAR_KEYS = ['year_gan', 'year_zhi', 'month_gan', 'month_zhi',
+               'day_gan', 'day_zhi', 'hour_gan', 'hour_zhi']
+
+_tables = None
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("向量化计算需要安装 numpy：pip install numpy")
+
+
+def _get_tables() -> Dict[str, "np.ndarray"]:
+    """由引擎的五行表构造下标查表数组（只构造一次）"""
+    global _tables
+    if _tables is None:
+        engine = FortuneEngine()
+        wx_idx = {wx: i for i, wx in enumerate(engine.wuxing)}
+        # 日主五行下标 -> 生我者 / 我生者 / 克我者 / 我克者 的五行下标
+        relations = []
+        for wx in engine.wuxing:
+            sheng_wo = [k for k, v in engine.sheng_map.items() if v == wx][0]
+            ke_wo = [k for k, v in engine.ke_map.items() if v == wx][0]
+            relations.append([wx_idx[sheng_wo], wx_idx[engine.sheng_map[wx]],
+                              wx_idx[ke_wo], wx_idx[engine.ke_map[wx]]])
+        _tables = {
+            'gan_wuxing': np.array([wx_idx[engine.wuxing_map[g]] for g in engine.tiangan], dtype=np.int8),
+            'zhi_wuxing': np.array([wx_idx[engine.zhi_wuxing[z]] for z in engine.dizhi], dtype=np.int8),
+            'relations': np.array(relations, dtype=np.int8),
+            'geju_count': len(engine.geju_list),
+        }
+    return _tables
+
+
+def calculate_bazi_arrays(years, months, days, hours) -> Dict[str, "np.ndarray"]:
+    """向量化计算一批出生数据的八字结构
+
+    Args:
+        years, months, days, hours: 等长的一维整数数组（或可转换为数组的序列）
+
+    Returns:
+        Dict包含:
+            year_gan ... hour_zhi: 四柱天干（0-9）/地支（0-11）下标数组
+            wuxing_count: (N,5) 五行计数矩阵，列顺序同 FortuneEngine.wuxing（金木水火土）
+            day_wuxing: 日主五行下标数组
+            is_strong: 日主身旺布尔数组
+            geju: 格局下标数组（对应 FortuneEngine.geju_list）
+    """
+    _require_numpy()
+    tables = _get_tables()
+
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    hours = np.asarray(hours, dtype=np.int64)
+
+    day_num = years * 365 + months * 30 + days
+    hour_zhi = (hours + 1) // 2 % 12
+    day_gan = day_num % 10
+
+    result = {
+        'year_gan': (years - 4) % 10,
+        'year_zhi': (years - 4) % 12,
+        'month_gan': (years * 12 + months + 3) % 10,
+        'month_zhi': (months + 1) % 12,
+        'day_gan': day_gan,
+        'day_zhi': day_num % 12,
+        'hour_gan': (day_gan * 2 + hour_zhi) % 10,
+        'hour_zhi': hour_zhi,
+    }
+    for key in PILLAR_KEYS:
+        result[key] = result[key].astype(np.int8)
+
+    # 统计五行（每行各列独立累加，同一次赋值中行下标不重复）
+    n = years.shape[0]
+    rows = np.arange(n)
+    wuxing_count = np.zeros((n, 5), dtype=np.int8)
+    for key in PILLAR_KEYS:
+        table = tables['gan_wuxing'] if key.endswith('_gan') else tables['zhi_wuxing']
+        wuxing_count[rows, table[result[key]]] += 1
+
+    # 日主强弱判断：同我 + 生我 >= 我生 + 我克 + 克我
+    day_wuxing = tables['gan_wuxing'][result['day_gan']]
+    rel = tables['relations'][day_wuxing]
+    sheng_wo, wo_sheng, ke_wo, wo_ke = rel[:, 0], rel[:, 1], rel[:, 2], rel[:, 3]
+    help_count = wuxing_count[rows, day_wuxing] + wuxing_count[rows, sheng_wo]
+    drain_count = (wuxing_count[rows, wo_sheng] + wuxing_count[rows, wo_ke]
+                   + wuxing_count[rows, ke_wo])
+
+    result['wuxing_count'] = wuxing_count
+    result['day_wuxing'] = day_wuxing
+    result['is_strong'] = help_count >= drain_count
+    result['geju'] = ((result['day_gan'].astype(np.int64) * 12 + result['day_zhi'])
+                      % tables['geju_count']).astype(np.int8)
+    return result
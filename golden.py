@@ -0,0 +1,365 @@
+"""
+玄机命理 - 输出一致性校验（黄金文件 + 快速路径对比）
+
+README 承诺“相同输入，相同输出”，任何性能优化都不能改变用户看到的结果。
+本工具提供两种校验：
+
+参考实现是 golden_reference.py 中冻结的原程序计算代码（BaselineFortune），
+不随引擎修改，因此校验的是“与原程序一致”，而不是引擎与自身一致。
+
+1. 黄金文件：按输入域（全部或固定种子抽样）运行参考实现，
+   每条结果的规范化 JSON 取 8 字节 BLAKE2b 摘要，整体 gzip 保存。
+   输入由域定义和种子重新生成，不写入文件，因此每条记录只占 8 字节。
+       python golden.py record -o golden.json.gz [--sample 20000 | --full]
+       python golden.py verify golden.json.gz
+   verify 用当前引擎重新计算，与参考实现记录的摘要比较。
+
+2. 快速路径对比：对同一批输入分别运行参考实现和各优化路径
+   （批量、查表、向量化、预计算结果表、记忆化），逐字段比较并列出差异。
+
+农历字段（lunar）是有意的改动：原程序只有 2024/2025 年的手写数据（部分月份有误），
+其余年份为近似公式，现已改为 1900-2100 年农历数据表，因此比较前两边都去掉该字段。
+       python golden.py compare [--sample 20000] [--answers answers.bin]
+
+Author: Mystery Fortune Team
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from engine import FortuneEngine, EVENT_TYPES
+from golden_reference import BaselineFortune
+
+GOLDEN_VERSION = 2
+DEFAULT_SAMPLE = 20000
+DEFAULT_SEED = 20240101
+# 黄金文件固定流年，避免结果随运行年份变化
+DEFAULT_CURRENT_YEAR = 2026
+DIGEST_SIZE = 8
+
+YEARS = range(1940, 2026)
+GENDERS = ('男', '女')
+DATE_START = datetime(1900, 1, 1)
+DATE_COUNT = (datetime(2101, 1, 1) - DATE_START).days
+
+
+# ============ 输入域 ============
+class Domain(NamedTuple):
+    """输入域：size 条输入，decode(i) 得到第 i 条的参数元组"""
+    size: int
+    decode: Callable[[int], Tuple]
+
+
+def _decode_birth(i: int) -> Tuple[int, int, int, int]:
+    i, hour = divmod(i, 24)
+    i, day = divmod(i, 31)
+    year_off, month = divmod(i, 12)
+    return YEARS.start + year_off, month + 1, day + 1, hour
+
+
+def _decode_peach(i: int) -> Tuple[int, int, int, str]:
+    i, gender = divmod(i, 2)
+    year, month, day, _ = _decode_birth(i * 24)
+    return year, month, day, GENDERS[gender]
+
+
+def _decode_date(i: int) -> Tuple[datetime]:
+    return (DATE_START + timedelta(days=i),)
+
+
+def _decode_auspicious(i: int) -> Tuple[str, datetime]:
+    i, event = divmod(i, len(EVENT_TYPES))
+    return EVENT_TYPES[event], DATE_START + timedelta(days=i)
+
+
+DOMAINS: Dict[str, Domain] = {
+    'birth': Domain(len(YEARS) * 12 * 31 * 24, _decode_birth),
+    'peach': Domain(len(YEARS) * 12 * 31 * 2, _decode_peach),
+    'zodiac_pair': Domain(144, lambda i: divmod(i, 12)),
+    'date': Domain(DATE_COUNT, _decode_date),
+    'auspicious': Domain(DATE_COUNT * len(EVENT_TYPES), _decode_auspicious),
+}
+
+
+def sample_inputs(domain: Domain, sample: Optional[int], seed: int) -> List[Tuple]:
+    """按种子抽样输入（sample 为 None 或不小于域大小时返回全部输入）"""
+    if sample is None or sample >= domain.size:
+        indices = range(domain.size)
+    else:
+        indices = sorted(random.Random(seed).sample(range(domain.size), sample))
+    return [domain.decode(i) for i in indices]
+
+
+# ============ 规范化与比较 ============
+def normalize(value: Any) -> Any:
+    """转换为可比较、可序列化的普通数据（tuple -> list，只读映射 -> dict，日期 -> 字符串）"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {str(k): normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize(v) for v in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, 'item'):  # numpy 标量
+        return value.item()
+    return value
+
+
+def digest(value: Any) -> bytes:
+    canonical = json.dumps(normalize(value), ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=DIGEST_SIZE).digest()
+
+
+def diff(expected: Any, actual: Any, path: str = '') -> List[Tuple[str, Any, Any]]:
+    """逐字段比较两个规范化后的结果
+
+    Returns:
+        (字段路径, 期望值, 实际值) 列表
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        out = []
+        for key in sorted(set(expected) | set(actual)):
+            out += diff(expected.get(key, '<缺失>'), actual.get(key, '<缺失>'), f"{path}.{key}" if path else key)
+        return out
+    if isinstance(expected, list) and isinstance(actual, list) and len(expected) == len(actual):
+        out = []
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            out += diff(e, a, f"{path}[{i}]")
+        return out
+    return [] if expected == actual else [(path or '<根>', expected, actual)]
+
+
+def without_lunar(value: Dict[str, Any]) -> Dict[str, Any]:
+    """去掉农历字段（有意改动，见模块说明）"""
+    return {k: v for k, v in value.items() if k != 'lunar'}
+
+
+# ============ 黄金文件记录的计算 ============
+def reference_computations(impl: Any, current_year: int) -> Dict[str, Tuple[str, Callable]]:
+    """计算名 -> (输入域名, 计算函数)
+
+    Args:
+        impl: BaselineFortune（记录）或 FortuneEngine（校验），两者接口相同
+    """
+    sx = impl.shengxiao
+    return {
+        'fortune': ('birth', lambda y, m, d, h: impl.calculate_fortune(y, m, d, h, current_year)),
+        'peach': ('peach', lambda y, m, d, g: impl.calculate_peach_blossom(y, m, d, g, current_year)),
+        'match': ('zodiac_pair', lambda a, b: impl.calculate_match(sx[a], sx[b])),
+        'almanac': ('date', lambda date: without_lunar(impl.get_almanac(date))),
+        'auspicious': ('auspicious', lambda event, today: [without_lunar(day) for day in
+                                                           impl.search_auspicious(event, today)]),
+    }
+
+
+def record_golden(path: str, sample: Optional[int], seed: int, current_year: int, progress: bool = True):
+    baseline = BaselineFortune()
+    meta = {'version': GOLDEN_VERSION, 'sample': sample, 'seed': seed, 'current_year': current_year}
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        f.write(json.dumps(meta) + '\n')
+        for name, (domain_name, fn) in reference_computations(baseline, current_year).items():
+            inputs = sample_inputs(DOMAINS[domain_name], sample, seed)
+            digests = b''.join(digest(fn(*args)) for args in inputs)
+            f.write(json.dumps({'name': name, 'domain': domain_name, 'count': len(inputs),
+                                'digests': base64.b64encode(digests).decode('ascii')}) + '\n')
+            if progress:
+                print(f"{name}: {len(inputs)} 条", file=sys.stderr)
+
+
+def verify_golden(path: str, limit: int = 10) -> int:
+    """用当前引擎重新计算并与黄金文件比较
+
+    Returns:
+        不一致的记录数
+    """
+    engine = FortuneEngine()
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        meta = json.loads(f.readline())
+        if meta['version'] != GOLDEN_VERSION:
+            raise ValueError(f"黄金文件版本不符：{meta['version']}")
+        computations = reference_computations(engine, meta['current_year'])
+        mismatched = 0
+        for line in f:
+            entry = json.loads(line)
+            _, fn = computations[entry['name']]
+            inputs = sample_inputs(DOMAINS[entry['domain']], meta['sample'], meta['seed'])
+            expected = base64.b64decode(entry['digests'])
+            bad = [args for i, args in enumerate(inputs)
+                   if digest(fn(*args)) != expected[i * DIGEST_SIZE:(i + 1) * DIGEST_SIZE]]
+            mismatched += len(bad)
+            print(f"{entry['name']}: {len(inputs)} 条，不一致 {len(bad)} 条")
+            for args in bad[:limit]:
+                print(f"    输入 {normalize(args)}")
+    return mismatched
+
+
+# ============ 快速路径对比 ============
+class Check(NamedTuple):
+    """一项对比：同一批输入分别交给参考实现（逐条）和候选实现（整批）"""
+    domain: str
+    reference: Callable[..., Any]
+    candidate: Callable[[List[Tuple]], Iterable[Any]]
+
+
+def build_checks(engine: FortuneEngine, current_year: int, answers: Optional[str] = None) -> Dict[str, Check]:
+    """候选快速路径（依赖缺失的项目会跳过）"""
+    sx = engine.shengxiao
+    ref = BaselineFortune()
+
+    def peach_reference(y, m, d, g):
+        star = ref._get_peach_blossom_star((y - 4) % 12)[0]
+        seed = y * 10000 + m * 100 + d
+        rows = []
+        for p in ref._calculate_peach_periods(y, m, d, g, (y - 4) % 12, star, current_year):
+            quality, desc, color, maturity = ref._get_peach_quality(p['strength'], p['age'], g, seed)
+            rows.append(dict(p, quality=quality, quality_desc=desc, quality_color=color, maturity=maturity))
+        return rows
+
+    def zodiac_reference(a, b):
+        return ref._get_zodiac_score(sx[a], sx[b])
+
+    def bazi_indices(y, m, d, h):
+        b = ref.calculate_bazi(y, m, d, h)
+        out = {}
+        for (_, gan, zhi), key in zip(b['pillars'], ('year', 'month', 'day', 'hour')):
+            out[f'{key}_gan'] = ref.tiangan.index(gan)
+            out[f'{key}_zhi'] = ref.dizhi.index(zhi)
+        out['wuxing_count'] = [b['wuxing_count'][wx] for wx in ref.wuxing]
+        out['day_wuxing'] = ref.wuxing.index(b['day_wuxing'])
+        out['is_strong'] = b['is_strong']
+        # 格局编号与候选实现的输出编码一致
+        out['geju'] = engine.geju_list.index(b['geju'])
+        return out
+
+    def almanac_stream(inputs):
+        # iter_almanac 逐日连续生成，按输入日期逐个取第一天
+        return [without_lunar(next(engine.iter_almanac(date, 1))) for (date,) in inputs]
+
+    checks = {
+        'bazi_batch': Check('birth', ref.calculate_bazi, engine.calculate_bazi_batch),
+        'peach_timelines': Check('peach', peach_reference,
+                                 lambda inputs: engine.calculate_peach_timelines(inputs, current_year)),
+        'daily_table': Check('date', ref.get_daily_chongsha,
+                             lambda inputs: [engine.day_table.lookup(date) for (date,) in inputs]),
+        'almanac_stream': Check('date', lambda date: without_lunar(ref.get_almanac(date)), almanac_stream),
+        'zodiac_table': Check('zodiac_pair', zodiac_reference,
+                              lambda inputs: [engine.get_zodiac_score(sx[a], sx[b]) for a, b in inputs]),
+        'score_candidates': Check('zodiac_pair', zodiac_reference,
+                                  lambda inputs: [engine.score_candidates(sx[a], [sx[b]])[0] for a, b in inputs]),
+    }
+
+    try:
+        from engine_vectorized import calculate_bazi_arrays, np
+    except ImportError:
+        np = None
+    if np is not None:
+        def vectorized(inputs):
+            arrays = calculate_bazi_arrays(*zip(*inputs))
+            keys = [k for k in arrays if k != 'wuxing_count']
+            return [dict({k: arrays[k][i] for k in keys}, wuxing_count=arrays['wuxing_count'][i].tolist())
+                    for i in range(len(inputs))]
+        checks['bazi_vectorized'] = Check('birth', bazi_indices, vectorized)
+
+        from seeded_random import sin_int_array
+        checks['sin_int_array'] = Check('birth', lambda y, m, d, h: ref._deterministic_int(y * 10000 + m * 100 + d + h, -5, 20),
+                                        lambda inputs: sin_int_array([y * 10000 + m * 100 + d + h
+                                                                      for y, m, d, h in inputs], -5, 20).tolist())
+
+    from memo import FortuneMemo
+    memo = FortuneMemo(engine, path=None, current_year=current_year)
+    checks['memo_fortune'] = Check('birth', lambda *a: ref.calculate_fortune(*a, current_year),
+                                   lambda inputs: [memo.fortune(*args) for args in inputs])
+
+    if answers:
+        from answer_table import AnswerTable
+        table = AnswerTable(answers)
+        checks['answer_table_bazi'] = Check('birth', bazi_indices,
+                                            lambda inputs: [table.bazi(*args) for args in inputs])
+        checks['answer_table_peach'] = Check('peach', peach_reference,
+                                             lambda inputs: [table.peach_periods(*args, current_year)
+                                                             for args in inputs])
+    return checks
+
+
+def run_compare(sample: Optional[int], seed: int, current_year: int, answers: Optional[str] = None,
+                only: Optional[List[str]] = None, limit: int = 5) -> int:
+    """运行全部快速路径对比
+
+    Returns:
+        不一致的记录数
+
+    Raises:
+        ValueError: only 中有不存在（或因依赖缺失、未指定 answers 而不可用）的对比名
+    """
+    engine = FortuneEngine()
+    checks = build_checks(engine, current_year, answers)
+    if only:
+        unknown = [name for name in only if name not in checks]
+        if unknown:
+            raise ValueError(f"未知或不可用的对比：{', '.join(unknown)}（可选：{', '.join(checks)}；"
+                             f"answer_table_* 需要 --answers）")
+        checks = {name: checks[name] for name in only}
+    mismatched = 0
+    for name, check in checks.items():
+        inputs = sample_inputs(DOMAINS[check.domain], sample, seed)
+        actual = list(check.candidate(inputs))
+        bad = 0
+        for args, got in zip(inputs, actual):
+            differences = diff(normalize(check.reference(*args)), normalize(got))
+            if differences:
+                bad += 1
+                if bad <= limit:
+                    print(f"    {name} 输入 {normalize(args)}：")
+                    for field, exp, act in differences[:limit]:
+                        print(f"        {field}: 期望 {exp!r}，实际 {act!r}")
+        if len(actual) != len(inputs):
+            bad += abs(len(inputs) - len(actual))
+        mismatched += bad
+        print(f"{name}: {len(inputs)} 条，{'一致' if not bad else f'不一致 {bad} 条'}")
+    return mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="玄机命理输出一致性校验")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    record = sub.add_parser('record', help="用参考实现生成黄金文件")
+    record.add_argument('-o', '--output', required=True, help="黄金文件路径（gzip）")
+    verify = sub.add_parser('verify', help="与黄金文件比较")
+    verify.add_argument('golden', help="黄金文件路径")
+    compare = sub.add_parser('compare', help="参考实现与各快速路径逐字段对比")
+    compare.add_argument('--answers', help="预计算结果表文件（answer_table.py build 生成）")
+    compare.add_argument('--only', default='', help="只运行这些对比，逗号分隔")
+
+    for p in (record, compare):
+        p.add_argument('--sample', type=int, default=DEFAULT_SAMPLE,
+                       help=f"每个输入域抽样条数（默认 {DEFAULT_SAMPLE}）")
+        p.add_argument('--full', action='store_true', help="使用全部输入域（较慢）")
+        p.add_argument('--seed', type=int, default=DEFAULT_SEED, help="抽样种子")
+        p.add_argument('--current-year', type=int, default=DEFAULT_CURRENT_YEAR,
+                       help=f"流年年份（默认 {DEFAULT_CURRENT_YEAR}）")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record_golden(args.output, None if args.full else args.sample, args.seed, args.current_year)
+        return
+    if args.command == 'verify':
+        mismatched = verify_golden(args.golden)
+    else:
+        try:
+            mismatched = run_compare(None if args.full else args.sample, args.seed, args.current_year,
+                                     args.answers, [n for n in args.only.split(',') if n])
+        except ValueError as e:
+            parser.error(str(e))
+    sys.exit(1 if mismatched else 0)
+
+
+if __name__ == "__main__":
+    main()
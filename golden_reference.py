@@ -0,0 +1,802 @@
+"""
+玄机命理 - 基线参考实现（golden.py 的对照基准）
+
+计算代码逐字摘自重构前的 a1.py（MysteryFortuneApp），只去掉界面部分，
+golden.py 用它检查引擎及各快速路径的输出是否与原程序一致。
+本文件应保持冻结，不随引擎一起修改。与原代码的差别仅有：
+    - base_info 的 f-string 改写为直接写出文字（原写法在表达式中含反斜杠，
+      Python 3.12 之前无法编译）
+    - datetime.now() 改为参数（流年年份、查询日期），使结果与运行日期无关
+    - 计算结果按引擎的字段组织为字典返回，不再创建控件
+
+Author: Mystery Fortune Team
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+
+class BaselineFortune:
+    """原 MysteryFortuneApp 的计算部分"""
+
+    def __init__(self):
+        # 天干地支数据
+        self.tiangan = ['甲', '乙', '丙', '丁', '戊', '己', '庚', '辛', '壬', '癸']
+        self.dizhi = ['子', '丑', '寅', '卯', '辰', '巳', '午', '未', '申', '酉', '戌', '亥']
+        self.shengxiao = ['鼠', '牛', '虎', '兔', '龙', '蛇', '马', '羊', '猴', '鸡', '狗', '猪']
+        self.wuxing = ['金', '木', '水', '火', '土']
+
+        # 农历月份和日期
+        self.lunar_months = ['正月', '二月', '三月', '四月', '五月', '六月',
+                            '七月', '八月', '九月', '十月', '冬月', '腊月']
+        self.lunar_days = ['初一', '初二', '初三', '初四', '初五', '初六', '初七', '初八', '初九', '初十',
+                          '十一', '十二', '十三', '十四', '十五', '十六', '十七', '十八', '十九', '二十',
+                          '廿一', '廿二', '廿三', '廿四', '廿五', '廿六', '廿七', '廿八', '廿九', '三十']
+
+        # 地支六冲关系：子午冲、丑未冲、寅申冲、卯酉冲、辰戌冲、巳亥冲
+        self.chong_map = [6, 7, 8, 9, 10, 11, 0, 1, 2, 3, 4, 5]
+        # 煎方规则：申子辰日煎南、亥卯未日煎西、寅午戌日煎北、巳酉丑日煎东
+        self.sha_map = {0:'南', 4:'南', 8:'南', 3:'西', 7:'西', 11:'西', 2:'北', 6:'北', 10:'北', 1:'东', 5:'东', 9:'东'}
+
+        self._daily_cache = None
+        self._daily_cache_date = None
+
+        # 生肖配对表（基于传统命理学）
+        self.zodiac_match = {
+            'sanhe': [[0,4,8], [3,7,11], [2,6,10], [1,5,9]],  # 三合局
+            'liuhe': [[0,1], [2,11], [3,10], [4,9], [5,8], [6,7]],  # 六合
+            'liuchong': [[0,6], [1,7], [2,8], [3,9], [4,10], [5,11]],  # 六冲
+            'liuhai': [[0,7], [1,6], [2,5], [3,4], [8,11], [9,10]]  # 六害
+        }
+
+    # ============ 确定性算法工具函数 ============
+    def _seeded_random(self, seed: int) -> float:
+        """基于种子的确定性随机数生成"""
+        x = math.sin(seed) * 10000
+        return x - math.floor(x)
+
+    def _deterministic_int(self, seed: int, min_val: int, max_val: int) -> int:
+        """确定性整数（基于种子）"""
+        return min_val + int(self._seeded_random(seed) * (max_val - min_val + 1))
+
+    def _deterministic_slice(self, arr: List, n: int, seed: int) -> List:
+        """确定性打乱数组并取前n个"""
+        indexed = [(item, self._seeded_random(seed + i)) for i, item in enumerate(arr)]
+        indexed.sort(key=lambda x: x[1])
+        return [x[0] for x in indexed[:n]]
+
+    def _get_date_seed(self, date: datetime) -> int:
+        """获取日期种子"""
+        return date.year * 10000 + date.month * 100 + date.day
+
+    def _get_geju(self, day_gan: str, day_zhi: str) -> str:
+        """基于日柱确定性计算格局"""
+        geju_list = ["正印格", "偏印格", "食神格", "伤官格", "正财格", "偏财格",
+                    "正官格", "七杀格"]
+        seed = self.tiangan.index(day_gan) * 12 + self.dizhi.index(day_zhi)
+        return geju_list[seed % len(geju_list)]
+
+    def _get_zodiac_score(self, male: str, female: str) -> int:
+        """基于生肖配对表确定性计算分数"""
+        m_idx = self.shengxiao.index(male)
+        f_idx = self.shengxiao.index(female)
+
+        # 检查三合（+25分）
+        sanhe_bonus = 0
+        for group in self.zodiac_match['sanhe']:
+            if m_idx in group and f_idx in group:
+                sanhe_bonus = 25
+                break
+
+        # 检查六合（+20分）
+        liuhe_bonus = 0
+        for pair in self.zodiac_match['liuhe']:
+            if (pair[0] == m_idx and pair[1] == f_idx) or (pair[0] == f_idx and pair[1] == m_idx):
+                liuhe_bonus = 20
+                break
+
+        # 检查六冲（-20分）
+        liuchong_penalty = 0
+        for pair in self.zodiac_match['liuchong']:
+            if (pair[0] == m_idx and pair[1] == f_idx) or (pair[0] == f_idx and pair[1] == m_idx):
+                liuchong_penalty = -20
+                break
+
+        # 检查六害（-10分）
+        liuhai_penalty = 0
+        for pair in self.zodiac_match['liuhai']:
+            if (pair[0] == m_idx and pair[1] == f_idx) or (pair[0] == f_idx and pair[1] == m_idx):
+                liuhai_penalty = -10
+                break
+
+        # 基础分70分
+        base_score = 70
+        total_score = min(99, max(60, base_score + sanhe_bonus + liuhe_bonus + liuchong_penalty + liuhai_penalty))
+
+        return total_score
+
+    # ============ 算命大师 ============
+    def calculate_bazi(self, year: int, month: int, day: int, hour: int) -> Dict[str, Any]:
+        # 计算八字
+        year_gan = self.tiangan[(year - 4) % 10]
+        year_zhi = self.dizhi[(year - 4) % 12]
+        shengxiao = self.shengxiao[(year - 4) % 12]
+
+        month_gan = self.tiangan[(year * 12 + month + 3) % 10]
+        month_zhi = self.dizhi[(month + 1) % 12]
+
+        day_gan = self.tiangan[(year * 365 + month * 30 + day) % 10]
+        day_zhi = self.dizhi[(year * 365 + month * 30 + day) % 12]
+
+        hour_zhi_idx = (hour + 1) // 2 % 12
+        hour_gan = self.tiangan[(int(self.tiangan.index(day_gan)) * 2 + hour_zhi_idx) % 10]
+        hour_zhi = self.dizhi[hour_zhi_idx]
+
+        bazi = f"{year_gan}{year_zhi} {month_gan}{month_zhi} {day_gan}{day_zhi} {hour_gan}{hour_zhi}"
+
+        # 五行映射
+        wuxing_map = {'甲':'木','乙':'木','丙':'火','丁':'火','戊':'土','己':'土','庚':'金','辛':'金','壬':'水','癸':'水'}
+        zhi_wuxing = {'子':'水','丑':'土','寅':'木','卯':'木','辰':'土','巳':'火','午':'火','未':'土','申':'金','酉':'金','戌':'土','亥':'水'}
+
+        # 统计五行
+        all_elements = [year_gan, month_gan, day_gan, hour_gan, year_zhi, month_zhi, day_zhi, hour_zhi]
+        wuxing_count = {'金':0, '木':0, '水':0, '火':0, '土':0}
+        for e in all_elements[:4]:
+            wuxing_count[wuxing_map[e]] += 1
+        for e in all_elements[4:]:
+            wuxing_count[zhi_wuxing[e]] += 1
+
+        day_wuxing = wuxing_map[day_gan]  # 日主五行
+
+        # 五行生克关系
+        sheng_map = {'木':'火', '火':'土', '土':'金', '金':'水', '水':'木'}
+        ke_map = {'木':'土', '土':'水', '水':'火', '火':'金', '金':'木'}
+        sheng_wo = [k for k,v in sheng_map.items() if v == day_wuxing][0]  # 生我者
+        wo_sheng = sheng_map[day_wuxing]  # 我生者
+        ke_wo = [k for k,v in ke_map.items() if v == day_wuxing][0]  # 克我者
+        wo_ke = ke_map[day_wuxing]  # 我克者
+
+        # 日主强弱判断
+        help_count = wuxing_count[day_wuxing] + wuxing_count[sheng_wo]
+        drain_count = wuxing_count[wo_sheng] + wuxing_count[wo_ke] + wuxing_count[ke_wo]
+        is_strong = help_count >= drain_count
+
+        # 喜用神分析
+        if is_strong:
+            xi_shen = [wo_sheng, wo_ke, ke_wo]
+            ji_shen = [day_wuxing, sheng_wo]
+        else:
+            xi_shen = [day_wuxing, sheng_wo]
+            ji_shen = [wo_sheng, wo_ke, ke_wo]
+
+        # 十神分析
+        shishen_map = {
+            ('同','同'): '比肩', ('同','异'): '劫财',
+            ('生','同'): '枭印', ('生','异'): '正印',
+            ('泄','同'): '食神', ('泄','异'): '伤官',
+            ('克','同'): '偏财', ('克','异'): '正财',
+            ('被克','同'): '七杀', ('被克','异'): '正官'
+        }
+
+        # 格局判断（基于日柱确定性计算）
+        geju = self._get_geju(day_gan, day_zhi)
+
+        pillars = [("年", year_gan, year_zhi), ("月", month_gan, month_zhi),
+                  ("日", day_gan, day_zhi), ("时", hour_gan, hour_zhi)]
+        return {
+            'pillars': pillars, 'bazi': bazi, 'shengxiao': shengxiao,
+            'day_gan': day_gan, 'day_zhi': day_zhi, 'wuxing_count': wuxing_count,
+            'day_wuxing': day_wuxing, 'is_strong': is_strong,
+            'xi_shen': xi_shen, 'ji_shen': ji_shen, 'geju': geju,
+        }
+
+    def calculate_fortune(self, year: int, month: int, day: int, hour: int, current_year: int) -> Dict[str, Any]:
+        result = self.calculate_bazi(year, month, day, hour)
+        day_gan, day_wuxing, is_strong = result['day_gan'], result['day_wuxing'], result['is_strong']
+        xi_shen, ji_shen = result['xi_shen'], result['ji_shen']
+        wuxing_map = {'甲':'木','乙':'木','丙':'火','丁':'火','戊':'土','己':'土','庚':'金','辛':'金','壬':'水','癸':'水'}
+
+        # 根据日主五行和强弱生成解读
+        readings = {
+            '木': {
+                True: ["日主甲木身旺，如参天大树，刚正不阿，领导力强，适合创业或管理岗位。",
+                       "木旺喜金来雕琢，方能成器，宜从事纪律性强的工作。",
+                       "财运方面，中年后财库渐丰，有積蓄之象。"],
+                False: ["日主甲木身弱，如幼苗无依，需得水木生扶，方能茂盛。",
+                       "适合团队合作，借助贵人之力发展事业。",
+                       "心态平和，不争不抢，婚姻缘分来得较晚，但质量高。"]},
+            '火': {
+                True: ["日主丙火身旺，如日中天，光明磊落，热情开朗，有领袖气质。",
+                       "火旺则燥，需水来济，否则性格急躁，宜修身养性。",
+                       "事业运佳，年轻时即有成就，中年可达高峰。"],
+                False: ["日主丙火身弱，如火烛微弱，需木来生扶，方能光耀。",
+                       "性格温和，善于交际，人缘极佳，适合公关、销售类工作。",
+                       "财运平稳，不宜冒险投资，稳健经营为佳。"]},
+            '土': {
+                True: ["日主戊土身旺，如山岳稳重，诚实守信，有担当，但固执。",
+                       "土旺喜木来疏，否则过于保守，错失良机。",
+                       "适合稳定的工作环境，如政府、国企、教育等行业。"],
+                False: ["日主戊土身弱，如田园乏水，需火土生扶，方能肥沃。",
+                       "性格随和，包容性强，人缘好，但需增强自信。",
+                       "中年后运势渐入佳境，大器晚成。"]},
+            '金': {
+                True: ["日主庚金身旺，如刃剑出鞘，果断刚毅，但需火来练，方成利器。",
+                       "金旺克木太过，宜注意人际关系，避免过于强势。",
+                       "武职、法律、金融行业发展佳，有正财运。"],
+                False: ["日主庚金身弱，如饰品小巧，需土金生扶，方显价值。",
+                       "心思细密，善于策划，适合幕后工作或技术岗位。",
+                       "财运需耐心经营，不可急于求成，稳中求进。"]},
+            '水': {
+                True: ["日主壬水身旺，如江河汹涌，智慧过人，变通能力强。",
+                       "水旺则泪，需土来制，否则思绪不定，难以专注。",
+                       "适合智力工作如研究、写作、咨询等，有海外发展运。"],
+                False: ["日主壬水身弱，如源头细流，需金水生扶，方能汇流成河。",
+                       "性格温顺，适应力强，人缘好，婚姻和美。",
+                       "财运需贵人提携，合作经营为佳，不宜单打独斗。"]}
+        }
+
+        my_readings = readings.get(day_wuxing, readings['木'])[is_strong]
+
+        year_gz = f"{self.tiangan[(current_year-4)%10]}{self.dizhi[(current_year-4)%12]}年"
+        year_wx = wuxing_map[self.tiangan[(current_year-4)%10]]
+        year_zhi = self.dizhi[(current_year-4)%12]
+
+        if year_wx in xi_shen:
+            year_luck = "大吉"
+            year_summary = "流年为喜用神，诸事顺遍，可積极进取。"
+            year_details = [
+                "💰 财运：财运亨通，正财偏财皆有机会，可适当投资理财，但不宜贪心。",
+                "🏢 事业：工作顺利，有贵人相助，适合拓展业务或谋求晋升。",
+                "💗 感情：单身者有望遇良缘，已婚者感情和睦，家庭美满。",
+                "🎯 健康：身体状况良好，但仍需注意作息规律，勿过度劳累。"
+            ]
+        elif year_wx == day_wuxing:
+            year_luck = "平稳"
+            year_summary = "流年与日主同元，运势平稳，宜守不宜攻。"
+            year_details = [
+                "💰 财运：收入稳定，正财为主，不宜投机冒险，稳健理财为宜。",
+                "🏢 事业：工作按部就班，不宜贸然跳槽或创业，守住本职为上。",
+                "💗 感情：感情平淡，需用心经营，多与伴侣沟通交流。",
+                "🎯 健康：注意肠胃保养，饮食宜清淡，保持适当运动。"
+            ]
+        else:
+            year_luck = "平常"
+            year_summary = "流年与命局有冲，宜谨慎行事，避免重大决策。"
+            year_details = [
+                "💰 财运：财运波动，忌贪忌投机，守住现有钱财，勿轻信他人。",
+                "🏢 事业：工作中可能遇到小人或阻碍，宜低调做事，不争风头。",
+                "💗 感情：感情易有波折，多包容理解，避免争吵。",
+                "🎯 健康：注意安全，谨防意外，定期体检，预防为主。"
+            ]
+
+        # 根据日主五行和强弱生成一生命运概述
+        life_readings = {
+            '木': {
+                True: [
+                    "【综合命运】日主甲木身旺，如参天大树，生命力旺盛。一生性格刚正不阿，有领导才能，适合担任管理者角色。",
+                    "【少年运势】（1-25岁）少年时期学业顺利，聪明好学，但性格较为倒强，需注意与人相处的方式方法。",
+                    "【中年运势】（26-50岁）中年事业有成，财运亨通，但木旺克土，需注意婚姻家庭的经营，避免因事业而忽视家人。",
+                    "【晚年运势】（51岁后）晚年安康，子孙孝顺，可享天伦之乐。注意肝胆保养，适当运动。"
+                ],
+                False: [
+                    "【综合命运】日主甲木身弱，如幼苗需水木滋养。一生性格温和，善于合作，适合团队工作，借助贵人之力发展。",
+                    "【少年运势】（1-25岁）少年时期可能较为艰苦，需要努力学习，多依靠父母帮助。",
+                    "【中年运势】（26-50岁）中年运势渐入佳境，遇贵人相助，事业有成。婚姻缘分来得稍晚，但质量高。",
+                    "【晚年运势】（51岁后）晚年子孙孝顺，大器晚成，可享清福。注意肝胆、筋骨保养。"
+                ]
+            },
+            '火': {
+                True: [
+                    "【综合命运】日主丙火身旺，如日中天，光明磊落，热情开朗。具有领袖气质，事业心强，年轻时即有成就。",
+                    "【少年运势】（1-25岁）少年时期活泼好动，学业表现突出，但性格急躁，需修身养性。",
+                    "【中年运势】（26-50岁）中年事业达高峰，名利双收。但火旺则燥，需水来济，宜多与水型人合作。",
+                    "【晚年运势】（51岁后）晚年子孙有出息，家庭和睦。注意心血管保养，忌暴躁。"
+                ],
+                False: [
+                    "【综合命运】日主丙火身弱，如烛火微弱，需木来生扶。性格温和，善于交际，人缘极佳。",
+                    "【少年运势】（1-25岁）少年时期需贵人提携，依靠家庭扶持，学业平稳。",
+                    "【中年运势】（26-50岁）中年运势渐佳，适合公关、销售类工作。财运平稳，不宜冒险投资。",
+                    "【晚年运势】（51岁后）晚年子孙缘深，家庭幸福。注意心脏、血压保养。"
+                ]
+            },
+            '土': {
+                True: [
+                    "【综合命运】日主戊土身旺，如山岳稳重，诚实守信，有担当。但过于固执，需注意灵活变通。",
+                    "【少年运势】（1-25岁）少年时期性格踏实，学业稳定，但不够灵活，需多拓展视野。",
+                    "【中年运势】（26-50岁）中年事业稳定，适合政府、国企、教育等行业。财运稳健，積蓄渐丰。",
+                    "【晚年运势】（51岁后）晚年安稳，子孙孝顺，家业兴旺。注意脾胃保养。"
+                ],
+                False: [
+                    "【综合命运】日主戊土身弱，如田园乏水，需火土生扶。性格随和，包容性强，人缘好。",
+                    "【少年运势】（1-25岁）少年时期需依靠家庭，学业较为平常，但能吃苦耐劳。",
+                    "【中年运势】（26-50岁）中年后运势渐入佳境，大器晚成。适合稳定的工作环境。",
+                    "【晚年运势】（51岁后）晚年福泻深厚，子孙满堂，家庄和睦。注意肠胃保养。"
+                ]
+            },
+            '金': {
+                True: [
+                    "【综合命运】日主庚金身旺，如刃剑出鞘，果断刚毅。适合武职、法律、金融等行业。",
+                    "【少年运势】（1-25岁）少年时期性格要强，学业表现突出，但需注意人际关系。",
+                    "【中年运势】（26-50岁）中年事业有成，正财运佳。但金旺克木太过，宜注意家庭和谐。",
+                    "【晚年运势】（51岁后）晚年安康，子孙孝顺。注意肺部、呼吸系统保养。"
+                ],
+                False: [
+                    "【综合命运】日主庚金身弱，如饰品小巧，需土金生扶。心思细密，善于策划，适合幕后工作。",
+                    "【少年运势】（1-25岁）少年时期需依靠家庭扶持，学业平稳，善于思考。",
+                    "【中年运势】（26-50岁）中年运势渐佳，适合技术、管理岗位。财运需耐心经营，稳中求进。",
+                    "【晚年运势】（51岁后）晚年子孙缘深，家庭和睦。注意肺部、皮肤保养。"
+                ]
+            },
+            '水': {
+                True: [
+                    "【综合命运】日主壬水身旺，如江河汹涌，智慧过人，变通能力强。适合研究、写作、咨询等智力工作。",
+                    "【少年运势】（1-25岁）少年时期聪明过人，学业优异，但思绪不定，需专注。",
+                    "【中年运势】（26-50岁）中年事业有成，有海外发展运。但水旺则泛，需土来制，宜与土型人合作。",
+                    "【晚年运势】（51岁后）晚年智慧不减，可发挥余热。注意肾脏、泰尿系统保养。"
+                ],
+                False: [
+                    "【综合命运】日主壬水身弱，如源头细流，需金水生扶。性格温顺，适应力强，人缘好。",
+                    "【少年运势】（1-25岁）少年时期需家庭扶持，学业平稳，但善于适应环境。",
+                    "【中年运势】（26-50岁）中年运势渐佳，需贵人提携，合作经营为佳。婚姻和美。",
+                    "【晚年运势】（51岁后）晚年子孙缘深，家庭幸福。注意肾脏、注意保暖。"
+                ]
+            }
+        }
+
+        my_life_readings = life_readings.get(day_wuxing, life_readings['木'])[is_strong]
+
+        # 显示基础信息
+        base_info = f"您的日主为{day_gan}（属{day_wuxing}），{'身旺' if is_strong else '身弱'}，喜用神为{'、'.join(xi_shen[:2])}，忌神为{'、'.join(ji_shen[:2])}。"
+
+        result.update(readings=my_readings, year_gz=year_gz, year_wx=year_wx, year_luck=year_luck,
+                      year_summary=year_summary, year_details=year_details,
+                      base_info=base_info, life_readings=my_life_readings)
+        return result
+
+    # ============ 黄道吉日 ============
+    def search_auspicious(self, event: str, today: datetime) -> List[Dict[str, Any]]:
+        base_seed = self._get_date_seed(today)
+
+        # 事项类型索引（用于确定性计算）
+        event_types = ["结婚嫁娶", "搬家入宅", "开业开张", "出行远行", "签约交易", "动土建房"]
+        event_idx = event_types.index(event) if event in event_types else 0
+
+        days = []
+        # 生成12个吉日（三个月内）
+        for i in range(12):
+            # 基于日期、事项和序号确定性计算天数
+            seed = base_seed + event_idx * 100 + i * 7
+            days_add = 3 + i * 7 + self._deterministic_int(seed, 0, 4)
+            if days_add > 90:
+                days_add = 80 + self._deterministic_int(seed + 500, 0, 10)
+            lucky_date = today + timedelta(days=days_add)
+
+            lunar =self.get_lunar_date(lucky_date)
+
+            luck_levels = ["★★★★★ 大吉", "★★★★☆ 上吉", "★★★☆☆ 中吉"]
+            luck_level = luck_levels[self._deterministic_int(seed + 1000, 0, 2)]
+            days.append({'date': lucky_date, 'lunar': lunar, 'luck_level': luck_level})
+        return days
+
+    # ============ 老黄历 ============
+    def get_almanac(self, today: datetime) -> Dict[str, Any]:
+        # 宜忌详细解说字典
+        yi_explanations = {
+            "嫁娶": "【嫁娶】今日适合举办婚礼、订婚、提亲等喜事。选择此日成婚，夫妻和睦，白头偕老，子孙满堂。婚姻大事，需择良辰吉日，方能福泽绵长。",
+            "祭祀": "【祭祀】今日适合祭拜神明、祖先、上香进贡。可前往寺庙烧香祈福，或在家中祭祀先人。诚心祭拜，可保家宅平安，事业顺遂。",
+            "出行": "【出行】今日适合外出、旅游、出差、探亲访友。路途平安顺利，诸事顺心。无论是短途还是远行，都能一路平安，高高兴兴出门，平平安安回家。",
+            "开市": "【开市】今日适合店铺开业、公司开张、新项目启动。选此日开业，财源广进，客似云来，生意兴隆。新店开张或公司成立，均为上上大吉之日。",
+            "纳财": "【纳财】今日适合收取钱财、结算账款、收取租金。财运亨通，进财顺利，适合处理财务事宜。无论是收款还是理财，都能顺风顺水。",
+            "动土": "【动土】今日适合建房动工、地基开挖、园林施工。动土大吉，工程顺利，地基稳固。此日动工，可保建筑稳固，家宅兴旺。",
+            "安床": "【安床】今日适合安置床铺、调整床位。床位安定，睡眠安稳，家庭和睦。新婚安床或调整卧室布局，皆为吉日。",
+            "入宅": "【入宅】今日适合搬家入住、乔迁新居。入住新居后家运亨通，万事如意。新家入住，品质生活从此开始，幸福美满源源不断。",
+            "开光": "【开光】今日适合佛像开光、神位开光、吉祥物品开光。开光后的物品灵气十足，可保佑平安、招财进宝。",
+            "修造": "【修造】今日适合房屋修缮、装修改造。工程顺利，质量保证，修缮后的房屋稳固耐用。无论是小修小补还是大工程，都能顺利完工。"
+        }
+
+        ji_explanations = {
+            "诉讼": "【诉讼】今日不宜打官司、起诉、争讼。若有纠纷，宜和解为上，否则官司缠身，耗财伤神。退一步海阔天空，忍一时风平浪静。",
+            "安葬": "【安葬】今日不宜下葬、安放遗骸。宜另择吉日，以免影响子孙运势。丧葬大事，须慎重择日，方能保家宅安宁。",
+            "破土": "【破土】今日不宜挖掘土地、墓地动工。恐惊动土神，带来不利。若有土木工程，宜择他日方能平安顺利。",
+            "伐木": "【伐木】今日不宜砂伐树木、采伐林木。树木有灵，随意砍伐恐伤元气。若确需破坏树木，应另择吉日进行。",
+            "作灶": "【作灶】今日不宜安装火灶、灶台。灶为家中财库，安装不当影响财运。若要安装厨房设备，应另择吉日，方能财源广进。",
+            "掘井": "【掘井】今日不宜挖掘水井、打水井。井为生命之源，择日不当恐影响家人健康。若需挖井，应另择吉日方能水源不断。",
+            "栽种": "【栽种】今日不宜种植花草树木。植物难以成活，或生长不旺。若要绿化美化环境，应另择吉日，方能花木繁茂。"
+        }
+
+        lunar = self.get_lunar_date(today)
+
+        year_gz = f"{self.tiangan[(today.year-4)%10]}{self.dizhi[(today.year-4)%12]}年"
+        shengxiao = self.shengxiao[(today.year-4)%12]
+
+        yi_list = self._deterministic_slice(list(yi_explanations.keys()), 5, self._get_date_seed(today))
+        ji_list = self._deterministic_slice(list(ji_explanations.keys()), 4, self._get_date_seed(today) + 1000)
+
+        # 使用统一的每日冲煎计算
+        daily_info = self.get_daily_chongsha(today)
+        return {
+            'date': today, 'lunar': lunar, 'year_gz': year_gz, 'shengxiao': shengxiao,
+            'yi_list': yi_list, 'ji_list': ji_list, 'daily': dict(daily_info),
+        }
+
+    # ============ 婚姻配对 ============
+    def calculate_match(self, male: str, female: str) -> Dict[str, Any]:
+        # 基于生肖配对表确定性计算分数
+        score = self._get_zodiac_score(male, female)
+
+        if score >= 90:
+            level = "天作之合"
+            desc = "此乃天赐良缘，二人八字相合，五行互补，婚后必定琴瑟和鸣，白头偕老。"
+        elif score >= 80:
+            level = "上等婚配"
+            desc = "二人姻缘不浅，性格互补，相处融洽，携手同行定能共创美好未来。"
+        elif score >= 70:
+            level = "中等婚配"
+            desc = "姻缘尚可，需要双方多加包容理解，用心经营方能幸福美满。"
+        else:
+            level = "需要磨合"
+            desc = "二人性格有所冲突，需要更多沟通与理解，建议婚前多加考虑。"
+
+        # 详细分析（基于生肖索引确定性计算）
+        m_idx = self.shengxiao.index(male)
+        f_idx = self.shengxiao.index(female)
+        detail_seed = m_idx * 12 + f_idx
+
+        details = [
+            ("性格相合度", 70 + self._deterministic_int(detail_seed, 0, 24)),
+            ("价值观契合", 65 + self._deterministic_int(detail_seed + 100, 0, 29)),
+            ("生活习惯", 60 + self._deterministic_int(detail_seed + 200, 0, 34)),
+            ("财运互补", 70 + self._deterministic_int(detail_seed + 300, 0, 24)),
+        ]
+        return {'male': male, 'female': female, 'score': score, 'level': level, 'desc': desc, 'details': details}
+
+    # ============ 桃花运功能模块 ============
+    def _get_peach_blossom_star(self, year_zhi_idx: int) -> Tuple[int, str]:
+        """基于年支计算桃花星位置
+
+        桃花星规则（寅午戌年桃花在卯，申子辰年桃花在酉，巳酉丑年桃花在午，亥卯未年桃花在子）
+        """
+        # 地支索引: 0-子 1-丑 2-寅 3-卯 4-辰 5-巳 6-午 7-未 8-申 9-酉 10-戌 11-亥
+        peach_map = {
+            2: (3, '卯'), 6: (3, '卯'), 10: (3, '卯'),  # 寅午戌年桃花在卯
+            8: (9, '酉'), 0: (9, '酉'), 4: (9, '酉'),   # 申子辰年桃花在酉
+            5: (6, '午'), 9: (6, '午'), 1: (6, '午'),   # 巳酉丑年桃花在午
+            11: (0, '子'), 3: (0, '子'), 7: (0, '子'),  # 亥卯未年桃花在子
+        }
+        return peach_map.get(year_zhi_idx, (3, '卯'))
+
+    def _calculate_peach_periods(self, birth_year: int, birth_month: int, birth_day: int,
+                                  gender: str, year_zhi_idx: int, peach_star_idx: int,
+                                  current_year: int) -> List[Dict]:
+        """确定性计算一生中的桃花运时间段
+
+        基于：
+        1. 流年地支与桃花星的关系
+        2. 大运周期
+        3. 性别影响（男女起运不同）
+        """
+        periods = []
+        seed = birth_year * 10000 + birth_month * 100 + birth_day
+        gender_factor = 1 if gender == '男' else 0
+
+        # 桃花星相关的地支（桃花星本位、六合位、三合位）
+        peach_related = self._get_peach_related_zhi(peach_star_idx)
+
+        life_span = 58  # 分析到58岁
+
+        for age in range(18, life_span + 1):  # 从18岁开始
+            target_year = birth_year + age
+            year_zhi = (target_year - 4) % 12
+
+            # 计算该年的桃花运强度
+            peach_strength = 0
+            peach_type = ""
+
+            # 流年地支正好是桃花星（+40%）
+            if year_zhi == peach_star_idx:
+                peach_strength += 40
+                peach_type = "流年桃花"
+            # 流年地支与桃花星六合（+30%）
+            elif year_zhi in peach_related['liuhe']:
+                peach_strength += 30
+                peach_type = "合桃花"
+            # 流年地支与桃花星三合（+25%）
+            elif year_zhi in peach_related['sanhe']:
+                peach_strength += 25
+                peach_type = "会桃花"
+
+            # 大运影响（10年一运）
+            dayun_idx = ((age - 1) // 10 + gender_factor) % 12
+            if dayun_idx == peach_star_idx:
+                peach_strength += 20
+            elif dayun_idx in peach_related['liuhe']:
+                peach_strength += 15
+
+            # 年龄修正（青年期桃花更旺）
+            if 18 <= age <= 35:
+                peach_strength += 10
+            elif 36 <= age <= 50:
+                peach_strength += 5
+
+            # 性别修正
+            if gender == '女' and 25 <= age <= 40:
+                peach_strength += 5
+            elif gender == '男' and 28 <= age <= 45:
+                peach_strength += 5
+
+            # 确定性微调（基于生日种子）
+            fine_tune = self._deterministic_int(seed + age * 7, -5, 5)
+            peach_strength += fine_tune
+
+            # 确保在合理范围内
+            peach_strength = max(5, min(98, peach_strength))
+
+            if peach_strength >= 35:  # 只记录较显著的桃花年
+                periods.append({
+                    'age': age,
+                    'year': target_year,
+                    'strength': peach_strength,
+                    'type': peach_type if peach_type else "平常桃花",
+                    'is_past': target_year < current_year,
+                    'is_current': target_year == current_year
+                })
+
+        return periods
+
+    def _get_peach_related_zhi(self, peach_star_idx: int) -> Dict[str, List[int]]:
+        """获取与桃花星相关的地支（六合、三合）"""
+        # 六合关系
+        liuhe_map = {0:1, 1:0, 2:11, 11:2, 3:10, 10:3, 4:9, 9:4, 5:8, 8:5, 6:7, 7:6}
+        # 三合局
+        sanhe_groups = [[8,0,4], [11,3,7], [2,6,10], [5,9,1]]  # 申子辰、亥卯未、寅午戌、巳酉丑
+
+        related = {'liuhe': [], 'sanhe': []}
+
+        # 六合
+        if peach_star_idx in liuhe_map:
+            related['liuhe'] = [liuhe_map[peach_star_idx]]
+
+        # 三合
+        for group in sanhe_groups:
+            if peach_star_idx in group:
+                related['sanhe'] = [z for z in group if z != peach_star_idx]
+                break
+
+        return related
+
+    def _get_peach_quality(self, strength: int, age: int, gender: str, seed: int) -> Tuple[str, str, str]:
+        """确定性判断桃花质量（好坏程度）"""
+        # 基于强度和年龄确定桃花质量
+        quality_seed = seed + strength * 3 + age * 11
+
+        # 计算成熟度（桃花是否成熟）
+        if 22 <= age <= 35:
+            maturity_base = 70
+        elif 18 <= age < 22 or 36 <= age <= 45:
+            maturity_base = 55
+        else:
+            maturity_base = 40
+
+        maturity = maturity_base + self._deterministic_int(quality_seed, -10, 20)
+        maturity = max(20, min(95, maturity))
+
+        # 判断桃花类型
+        if strength >= 70 and maturity >= 70:
+            quality = "正缘桃花"
+            quality_desc = "此桃花为正缘之兆，有望遇到真心人，宜把握机会。"
+            quality_color = '#22c55e'
+        elif strength >= 60 and maturity >= 55:
+            quality = "良缘桃花"
+            quality_desc = "桃花运较旺，感情机会较多，应渗重选择。"
+            quality_color = '#00d4ff'
+        elif strength >= 45:
+            quality = "普通桃花"
+            quality_desc = "桃花运平平，有异性缘但不明显，须主动争取。"
+            quality_color = '#ffc107'
+        else:
+            quality = "浅淡桃花"
+            quality_desc = "桃花运较弱，感情缘分不深，宜修身养性等待时机。"
+            quality_color = '#a0a0a0'
+
+        return quality, quality_desc, quality_color, maturity
+
+    def calculate_peach_blossom(self, year: int, month: int, day: int, gender: str,
+                                current_year: int) -> Dict[str, Any]:
+        # 计算年支和桃花星
+        year_zhi_idx = (year - 4) % 12
+        year_zhi = self.dizhi[year_zhi_idx]
+        shengxiao = self.shengxiao[year_zhi_idx]
+        peach_star_idx, peach_star = self._get_peach_blossom_star(year_zhi_idx)
+
+        # 计算桃花运时段
+        periods = self._calculate_peach_periods(year, month, day, gender, year_zhi_idx, peach_star_idx,
+                                                current_year)
+
+        peach_meanings = {
+            '子': "桃花在子（属鼠）：水地桃花，聪明灵利，异性缘佳，桃花来得早且快，感情世界丰富多彩。",
+            '卯': "桃花在卯（属兔）：木地桃花，温柔文雅，感情细腻，容易吸引异性追求，但需防感情纠葥。",
+            '午': "桃花在午（属马）：火地桃花，热情开朗，魅力四射，感情来得快也旺，但需防感情冲动。",
+            '酉': "桃花在酉（属鸡）：金地桃花，外貌出众，幽雅迷人，桃花质量高，容易遇到优质对象。"
+        }
+
+        meaning = peach_meanings.get(peach_star, "桃花星特质独特，异性缘丰富。")
+
+        # 筛选显著的桃花年份（只显示18-58岁）
+        filtered_periods = [p for p in periods if 18 <= p['age'] <= 58]
+        top_periods = sorted(filtered_periods, key=lambda x: x['strength'], reverse=True)[:15]
+        top_periods = sorted(top_periods, key=lambda x: x['age'])  # 按年龄排序
+
+        seed = year * 10000 + month * 100 + day
+
+        rows = []
+        for p in top_periods:
+            quality, quality_desc, quality_color, maturity = self._get_peach_quality(p['strength'], p['age'], gender, seed)
+            rows.append(dict(p, quality=quality, quality_desc=quality_desc,
+                             quality_color=quality_color, maturity=maturity))
+
+        # 统计桃花运特征（18-58岁范围）
+        high_periods = [p for p in periods if p['strength'] >= 60 and 18 <= p['age'] <= 58]
+        future_high = [p for p in high_periods if not p['is_past']]
+
+        summary_texts = []
+
+        if len(high_periods) >= 5:
+            summary_texts.append(f"● 您一生桃花运较旺，共有{len(high_periods)}个显著桃花年，异性缘分较好。")
+        elif len(high_periods) >= 2:
+            summary_texts.append(f"● 您一生桃花运中等，共有{len(high_periods)}个显著桃花年，需把握重要时机。")
+        else:
+            summary_texts.append("● 您一生桃花运较淡，异性缘需主动争取，不宜坐等。")
+
+        if future_high:
+            next_peak = min(future_high, key=lambda x: x['year'])
+            summary_texts.append(f"● 您未来最近的桃花旺年在{next_peak['year']}年（{next_peak['age']}岁），强度{next_peak['strength']}%。")
+
+        # 基于性别的建议
+        if gender == '男':
+            summary_texts.append("● 男命桃花旺时，容易遇到心仪对象，但需防烂桃花影响家庭和睦。")
+        else:
+            summary_texts.append("● 女命桃花旺时，容易被追求，但需明辨真心，防止被花言巧语迷惑。")
+
+        return {
+            'year_zhi': year_zhi, 'shengxiao': shengxiao, 'gender': gender, 'peach_star': peach_star,
+            'meaning': meaning, 'periods': periods, 'top_periods': rows, 'summary': summary_texts,
+        }
+
+    # ============ 农历与每日冲煞 ============
+    def get_lunar_date(self, date):
+        # 2025年农历基准：2025年1月29日 = 农历乙巳年正月初一
+        # 2025年闰六月
+
+        # 先检查是否是2025年，使用精确的硬编码数据
+        if date.year == 2025:
+            # 2025年每月天数: 正月30, 二月29, 三月30, 四月29, 五月30, 六月29, 闰六月29, 七月30, 八月29, 九月30, 十月30, 冬月29, 腊月30
+            lunar_2025 = [
+                (1, 30, False), (2, 29, False), (3, 30, False), (4, 29, False),
+                (5, 30, False), (6, 29, False), (6, 29, True),  # 闰六月
+                (7, 30, False), (8, 29, False), (9, 30, False), (10, 30, False),
+                (11, 29, False), (12, 30, False)
+            ]
+
+            # 2025年1月29日 = 正月初一
+            base_2025 = datetime(2025, 1, 29)
+            offset = (date - base_2025).days
+
+            if offset < 0:
+                # 2025年1月29日之前属于2024年农历
+                return self._get_lunar_2024(date)
+
+            # 计算农历月日
+            day_count = 0
+            for month_num, days, is_leap in lunar_2025:
+                if offset < day_count + days:
+                    lunar_day = offset - day_count + 1
+                    month_str = self.lunar_months[month_num - 1]
+                    if is_leap:
+                        month_str = "闰" + month_str
+                    day_str = self.lunar_days[lunar_day - 1] if lunar_day <= 30 else "三十"
+                    return f"{month_str}{day_str}"
+                day_count += days
+
+            # 超出2025年范围
+            return "日期超出范围"
+
+        elif date.year == 2024:
+            return self._get_lunar_2024(date)
+        else:
+            # 其他年份使用简化计算
+            return self._get_lunar_general(date)
+
+    def _get_lunar_2024(self, date):
+        # 2024年农历基准：2024年2月10日 = 农历甲辰年正月初一
+        # 2024年无闰月
+        lunar_2024 = [
+            (1, 30), (2, 30), (3, 29), (4, 30), (5, 29), (6, 30),
+            (7, 29), (8, 30), (9, 29), (10, 30), (11, 29), (12, 30)
+        ]
+
+        base_2024 = datetime(2024, 2, 10)
+        offset = (date - base_2024).days
+
+        if offset < 0:
+            return "日期超出范围"
+
+        day_count = 0
+        for month_num, days in lunar_2024:
+            if offset < day_count + days:
+                lunar_day = offset - day_count + 1
+                return f"{self.lunar_months[month_num - 1]}{self.lunar_days[lunar_day - 1]}"
+            day_count += days
+
+        return "日期超出范围"
+
+    def _get_lunar_general(self, date):
+        # 简化计算，仅供参考
+        month_idx = (date.month + 10) % 12
+        day_idx = (date.day + 18) % 30
+        return f"{self.lunar_months[month_idx]}{self.lunar_days[day_idx]}"
+
+    def get_daily_chongsha(self, date: datetime = None) -> Dict[str, str]:
+        """基于传统命理学计算每日冲煎信息（确保各板块一致）
+
+        Returns:
+            Dict包含: day_gan, day_zhi, chong_sx, sha_dir, ji_shen
+        """
+        if date is None:
+            date = datetime.now()
+
+        date_key = f"{date.year}-{date.month}-{date.day}"
+
+        # 缓存当天数据
+        if self._daily_cache_date == date_key and self._daily_cache:
+            return self._daily_cache
+
+        # 基准日：2024年1月1日 = 甲辰日（天干索引0，地支索引4）
+        base_date = datetime(2024, 1, 1)
+        base_gan_idx = 0  # 甲
+        base_zhi_idx = 4  # 辰
+
+        # 计算与基准日的天数差
+        diff_days = (date - base_date).days
+
+        # 干支循环（处理负数情况）
+        gan_idx = ((base_gan_idx + diff_days) % 10 + 10) % 10
+        zhi_idx = ((base_zhi_idx + diff_days) % 12 + 12) % 12
+
+        # 根据日支计算冲的生肖（地支六冲）
+        chong_zhi_idx = self.chong_map[zhi_idx]
+        chong_sx = self.shengxiao[chong_zhi_idx]
+
+        # 根据日支计算煎方
+        sha_dir = self.sha_map[zhi_idx]
+
+        # 计算吉神（基于月份和日干）
+        month = date.month
+        tian_de_gan = [6, 7, 8, 9, 0, 2, 6, 7, 8, 9, 0, 2]
+        yue_de_gan = [8, 0, 2, 4, 6, 8, 0, 2, 4, 6, 8, 0]
+
+        ji_shen_list = []
+        if gan_idx == tian_de_gan[month - 1]:
+            ji_shen_list.append('天德')
+        if gan_idx == yue_de_gan[month - 1]:
+            ji_shen_list.append('月德')
+        if not ji_shen_list:
+            other_ji_shen = ['天恩', '福星', '文昌', '驿马', '天喜', '玉堂']
+            ji_shen_list.append(other_ji_shen[(gan_idx + month) % len(other_ji_shen)])
+
+        # 计算凶神（基于日支）
+        xiong_shen_list = ['五鬼', '死气', '白虎', '天刑', '朱雀', '天狗']
+        xiong_shen = xiong_shen_list[zhi_idx % len(xiong_shen_list)]
+
+        self._daily_cache = {
+            'day_gan': self.tiangan[gan_idx],
+            'day_zhi': self.dizhi[zhi_idx],
+            'chong_sx': chong_sx,
+            'chong_zhi': self.dizhi[chong_zhi_idx],
+            'sha_dir': sha_dir,
+            'ji_shen': '、'.join(ji_shen_list),
+            'xiong_shen': xiong_shen
+        }
+        self._daily_cache_date = date_key
+
+        return self._daily_cache
@@ -0,0 +1,97 @@
+"""
+玄机命理 - 农历数据表（1900-2100）
+
+每个农历年用一个整数打包：
+    bit 0-3   闰月月份（0 表示无闰月）
+    bit 4-15  正月至腊月的大小（bit 15 对应正月，1 为大月 30 天，0 为小月 29 天）
+    bit 16    闰月大小（1 为 30 天，0 为 29 天）
+
+农历 1900 年正月初一为公历 1900-01-31。模块加载时据此建立每年正月初一和
+每月初一的公历日序号累计索引，公历转农历只需两次二分查找。
+
+Author: Mystery Fortune Team
+"""
+
+from bisect import bisect_right
+from datetime import date as date_cls
+from typing import List, Optional, Tuple
+
+LUNAR_START_YEAR = 1900
+LUNAR_END_YEAR = 2100
+
+LUNAR_INFO = (
+    0x04bd8, 0x04ae0, 0x0a570, 0x054d5, 0x0d260, 0x0d950, 0x16554, 0x056a0, 0x09ad0, 0x055d2,  # 1900-1909
+    0x04ae0, 0x0a5b6, 0x0a4d0, 0x0d250, 0x1d255, 0x0b540, 0x0d6a0, 0x0ada2, 0x095b0, 0x14977,  # 1910-1919
+    0x04970, 0x0a4b0, 0x0b4b5, 0x06a50, 0x06d40, 0x1ab54, 0x02b60, 0x09570, 0x052f2, 0x04970,  # 1920-1929
+    0x06566, 0x0d4a0, 0x0ea50, 0x16a95, 0x05ad0, 0x02b60, 0x186e3, 0x092e0, 0x1c8d7, 0x0c950,  # 1930-1939
+    0x0d4a0, 0x1d8a6, 0x0b550, 0x056a0, 0x1a5b4, 0x025d0, 0x092d0, 0x0d2b2, 0x0a950, 0x0b557,  # 1940-1949
+    0x06ca0, 0x0b550, 0x15355, 0x04da0, 0x0a5b0, 0x14573, 0x052b0, 0x0a9a8, 0x0e950, 0x06aa0,  # 1950-1959
+    0x0aea6, 0x0ab50, 0x04b60, 0x0aae4, 0x0a570, 0x05260, 0x0f263, 0x0d950, 0x05b57, 0x056a0,  # 1960-1969
+    0x096d0, 0x04dd5, 0x04ad0, 0x0a4d0, 0x0d4d4, 0x0d250, 0x0d558, 0x0b540, 0x0b6a0, 0x195a6,  # 1970-1979
+    0x095b0, 0x049b0, 0x0a974, 0x0a4b0, 0x0b27a, 0x06a50, 0x06d40, 0x0af46, 0x0ab60, 0x09570,  # 1980-1989
+    0x04af5, 0x04970, 0x064b0, 0x074a3, 0x0ea50, 0x06b58, 0x05ac0, 0x0ab60, 0x096d5, 0x092e0,  # 1990-1999
+    0x0c960, 0x0d954, 0x0d4a0, 0x0da50, 0x07552, 0x056a0, 0x0abb7, 0x025d0, 0x092d0, 0x0cab5,  # 2000-2009
+    0x0a950, 0x0b4a0, 0x0baa4, 0x0ad50, 0x055d9, 0x04ba0, 0x0a5b0, 0x15176, 0x052b0, 0x0a930,  # 2010-2019
+    0x07954, 0x06aa0, 0x0ad50, 0x05b52, 0x04b60, 0x0a6e6, 0x0a4e0, 0x0d260, 0x0ea65, 0x0d530,  # 2020-2029
+    0x05aa0, 0x076a3, 0x096d0, 0x04afb, 0x04ad0, 0x0a4d0, 0x1d0b6, 0x0d250, 0x0d520, 0x0dd45,  # 2030-2039
+    0x0b5a0, 0x056d0, 0x055b2, 0x049b0, 0x0a577, 0x0a4b0, 0x0aa50, 0x1b255, 0x06d20, 0x0ada0,  # 2040-2049
+    0x14b63, 0x09370, 0x049f8, 0x04970, 0x064b0, 0x168a6, 0x0ea50, 0x06b20, 0x1a6c4, 0x0aae0,  # 2050-2059
+    0x092e0, 0x0d2e3, 0x0c960, 0x0d557, 0x0d4a0, 0x0da50, 0x05d55, 0x056a0, 0x0a6d0, 0x055d4,  # 2060-2069
+    0x052d0, 0x0a9b8, 0x0a950, 0x0b4a0, 0x0b6a6, 0x0ad50, 0x055a0, 0x0aba4, 0x0a5b0, 0x052b0,  # 2070-2079
+    0x0b273, 0x06930, 0x07337, 0x06aa0, 0x0ad50, 0x14b55, 0x04b60, 0x0a570, 0x054e4, 0x0d260,  # 2080-2089
+    0x0e968, 0x0d520, 0x0daa0, 0x16aa6, 0x056d0, 0x04ae0, 0x0a9d4, 0x0a4d0, 0x0d150, 0x0f252,  # 2090-2099
+    0x0d520,  # 2100
+)
+
+# 农历1900年正月初一
+_BASE_ORDINAL = date_cls(1900, 1, 31).toordinal()
+
+
+def _year_months(info: int) -> List[Tuple[int, bool, int]]:
+    """展开一年的月份：[(月份, 是否闰月, 天数), ...]"""
+    leap_month = info & 0xf
+    months = []
+    for month in range(1, 13):
+        months.append((month, False, 30 if info & (0x10000 >> month) else 29))
+        if month == leap_month:
+            months.append((month, True, 30 if info & 0x10000 else 29))
+    return months
+
+
+def _build_index():
+    year_starts = []    # 每年正月初一的公历日序号
+    month_starts = []   # 每年各月初一的公历日序号
+    month_labels = []   # 每年各月的 (月份, 是否闰月)
+    ordinal = _BASE_ORDINAL
+    for info in LUNAR_INFO:
+        year_starts.append(ordinal)
+        starts, labels = [], []
+        for month, is_leap, days in _year_months(info):
+            starts.append(ordinal)
+            labels.append((month, is_leap))
+            ordinal += days
+        month_starts.append(starts)
+        month_labels.append(labels)
+    return year_starts, month_starts, month_labels, ordinal
+
+
+_YEAR_STARTS, _MONTH_STARTS, _MONTH_LABELS, _END_ORDINAL = _build_index()
+
+
+def to_lunar(date) -> Optional[Tuple[int, int, int, bool]]:
+    """公历日期转农历
+
+    Args:
+        date: date 或 datetime
+
+    Returns:
+        (农历年, 月, 日, 是否闰月)；超出表格范围时返回 None
+    """
+    ordinal = date.toordinal()
+    if not _BASE_ORDINAL <= ordinal < _END_ORDINAL:
+        return None
+    year_idx = bisect_right(_YEAR_STARTS, ordinal) - 1
+    starts = _MONTH_STARTS[year_idx]
+    month_idx = bisect_right(starts, ordinal) - 1
+    month, is_leap = _MONTH_LABELS[year_idx][month_idx]
+    return LUNAR_START_YEAR + year_idx, month, ordinal - starts[month_idx] + 1, is_leap
@@ -0,0 +1,97 @@
+"""
+玄机命理 - 批量配对排序
+
+配对分数只由双方生肖决定，因此候选人按生肖分入 12 个桶。
+对每个生肖，先把 12 个桶按配对分数（同分时比较详细分析总分）排好序，
+再依次从桶中取人，即可得到任一会员的前 K 名候选人，无需逐对计算。
+同一生肖的会员得到相同的结果，只计算一次。
+
+Author: Mystery Fortune Team
+"""
+
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+from engine import FortuneEngine
+
+# 排序结果中的一项：(候选人ID, 候选人生肖, 配对分数)
+RankedCandidate = Tuple[Hashable, str, int]
+
+
+class MatchRanker:
+    """按生肖分桶的配对排序器"""
+
+    def __init__(self, engine: FortuneEngine, candidates: Iterable[Tuple[Hashable, str]],
+                 candidate_gender: str = '女'):
+        """
+        Args:
+            engine: 计算引擎（使用其预先计算的配对分数表）
+            candidates: 候选人 (ID, 生肖) 序列，同分同生肖时按此顺序排列
+            candidate_gender: 候选人性别（'男' 或 '女'），会员为另一性别
+        """
+        self.engine = engine
+        self.candidate_gender = candidate_gender
+        idx = engine._shengxiao_idx
+        self.buckets: List[List[Hashable]] = [[] for _ in range(12)]
+        for cand_id, zodiac in candidates:
+            self.buckets[idx[zodiac]].append(cand_id)
+
+        # 会员生肖 -> 按配对优劣排好序的候选生肖序号
+        self._bucket_order: List[List[int]] = []
+        for member_idx in range(12):
+            keys = []
+            for cand_idx in range(12):
+                pair = self._pair_index(member_idx, cand_idx)
+                keys.append((-engine.zodiac_scores[pair], -sum(engine.match_detail_scores[pair]), cand_idx))
+            self._bucket_order.append([key[2] for key in sorted(keys)])
+
+        self._top_cache: Dict[Tuple[int, int], Tuple[RankedCandidate, ...]] = {}
+
+    def _pair_index(self, member_idx: int, cand_idx: int) -> int:
+        """配对表下标（男方序号*12 + 女方序号）"""
+        if self.candidate_gender == '女':
+            return member_idx * 12 + cand_idx
+        return cand_idx * 12 + member_idx
+
+    def top_k(self, zodiac: str, k: int = 10) -> Tuple[RankedCandidate, ...]:
+        """某生肖会员的前 K 名候选人
+
+        Returns:
+            (候选人ID, 候选人生肖, 配对分数) 元组，按分数从高到低排列
+
+        Raises:
+            ValueError: k 为负数
+        """
+        if k < 0:
+            raise ValueError(f"候选人数 k 不能为负数：{k}")
+        member_idx = self.engine._shengxiao_idx[zodiac]
+        cached = self._top_cache.get((member_idx, k))
+        if cached is not None:
+            return cached
+
+        result = []
+        for cand_idx in self._bucket_order[member_idx]:
+            bucket = self.buckets[cand_idx]
+            if not bucket:
+                continue
+            cand_zodiac = self.engine.shengxiao[cand_idx]
+            score = self.engine.zodiac_scores[self._pair_index(member_idx, cand_idx)]
+            for cand_id in bucket[:k - len(result)]:
+                result.append((cand_id, cand_zodiac, score))
+            if len(result) >= k:
+                break
+
+        ranked = tuple(result)
+        self._top_cache[(member_idx, k)] = ranked
+        return ranked
+
+    def rank_members(self, members: Iterable[Tuple[Hashable, str]], k: int = 10
+                     ) -> Dict[Hashable, Tuple[RankedCandidate, ...]]:
+        """为每位会员给出前 K 名候选人
+
+        Args:
+            members: 会员 (ID, 生肖) 序列
+
+        Returns:
+            会员ID -> top_k 结果（同生肖会员共用同一个元组）
+        """
+        return {member_id: self.top_k(zodiac, k) for member_id, zodiac in members}
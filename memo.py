@@ -0,0 +1,272 @@
+"""
+玄机命理 - 计算结果记忆化（内存 LRU + SQLite 持久化）
+
+命理结果只取决于出生信息和流年年份，输入空间有限，适合记忆化：
+    - 第一层：进程内 LRUCache，命中时直接返回已计算的结果对象
+    - 第二层：SQLite 文件，结果用固定协议的 pickle 序列化，重启后仍然有效；
+      文件中记录引擎结果版本（engine.RESULT_VERSION）和存储格式版本，
+      任一变化时旧结果整体清空，不会读到旧算法的结果
+
+八字（calculate_fortune）本身只需几微秒，读盘反序列化并不比重新计算快，
+因此默认只有桃花运（calculate_peach_blossom）写入磁盘，八字只走内存缓存；
+可通过 persist 参数调整。
+
+预热整个输入域（八字 1940-2025 年、桃花运 1940-2024 年，每月按 31 天）：
+    python memo.py warm [--db fortune_memo.db] [--current-year 2026] [--kinds peach,fortune]
+
+Author: Mystery Fortune Team
+"""
+
+import argparse
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cache import LRUCache
+from engine import FortuneEngine, RESULT_VERSION, BIRTH_YEAR_RANGE, PEACH_BIRTH_YEAR_RANGE
+
+DEFAULT_DB_PATH = 'fortune_memo.db'
+
+# 记忆化的计算种类
+KINDS = ('fortune', 'peach')
+
+# 各种类的出生年份范围（校验和预热共用，与 server.py 的接口一致）
+YEAR_RANGES = {'fortune': BIRTH_YEAR_RANGE, 'peach': PEACH_BIRTH_YEAR_RANGE}
+
+
+def _warm_years(kind: str) -> range:
+    min_year, max_year = YEAR_RANGES[kind]
+    return range(min_year, max_year + 1)
+
+# 磁盘存储格式版本（键布局或序列化方式变化时加一）
+STORAGE_VERSION = 1
+
+# pickle 协议固定，不随 Python 版本的默认值变化
+PICKLE_PROTOCOL = 4
+
+# 累积多少条新结果后写入一次磁盘
+FLUSH_EVERY = 512
+
+
+def _pack_key(year: int, month: int, day: int, extra: int) -> int:
+    """出生信息打包为整数键（extra 为时辰或性别编号）"""
+    return ((year * 100 + month) * 100 + day) * 100 + extra
+
+
+def _db_key(kind: str, current_year: int, key: int) -> int:
+    """磁盘键：高位为 流年*2+种类编号，低 32 位为出生信息键（作为 SQLite rowid，查找最快）"""
+    return ((current_year * 2 + KINDS.index(kind)) << 32) | key
+
+
+class FortuneMemo:
+    """八字与桃花运结果的两级记忆化缓存
+
+    返回的结果对象会被多个调用方共用，请勿修改。
+    """
+
+    def __init__(self, engine: Optional[FortuneEngine] = None, path: Optional[str] = DEFAULT_DB_PATH,
+                 maxsize: int = 65536, current_year: Optional[int] = None,
+                 persist: Iterable[str] = ('peach',)):
+        """
+        Args:
+            engine: 计算引擎，默认新建
+            path: SQLite 文件路径，None 表示只用内存缓存
+            maxsize: 内存 LRU 容量
+            current_year: 流年年份（结果随之变化，也是键的一部分），默认今年
+            persist: 写入磁盘的计算种类
+        """
+        self.engine = engine if engine is not None else FortuneEngine()
+        self.current_year = current_year or datetime.now().year
+        self.memory = LRUCache(maxsize)
+        self.persist = set(persist) if path else set()
+        self.disk_hits = 0
+        self.computed = 0
+
+        self._db = None
+        self._db_lock = threading.Lock()
+        self._pending: List[Tuple[int, bytes]] = []
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._open_tables()
+
+    def _open_tables(self):
+        """建表；文件中记录的版本与当前不符时清空旧结果"""
+        version = f"{RESULT_VERSION}.{STORAGE_VERSION}"
+        db = self._db
+        db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        row = db.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        if row is None or row[0] != version:
+            db.execute("DROP TABLE IF EXISTS results")
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (version,))
+        db.execute("CREATE TABLE IF NOT EXISTS results (key INTEGER PRIMARY KEY, value BLOB NOT NULL)")
+        db.commit()
+
+    # ============ 对外接口 ============
+    def fortune(self, year: int, month: int, day: int, hour: int) -> Dict[str, Any]:
+        """同 FortuneEngine.calculate_fortune（流年为 self.current_year）"""
+        self._validate('fortune', year, month, day, hour)
+        return self._lookup('fortune', _pack_key(year, month, day, hour),
+                            lambda: self.engine.calculate_fortune(year, month, day, hour, self.current_year))
+
+    def peach_blossom(self, year: int, month: int, day: int, gender: str) -> Dict[str, Any]:
+        """同 FortuneEngine.calculate_peach_blossom（流年为 self.current_year）"""
+        self._validate('peach', year, month, day, 0)
+        if gender not in ('男', '女'):
+            raise ValueError(f"性别应为 男 或 女：{gender}")
+        return self._lookup('peach', _pack_key(year, month, day, 0 if gender == '男' else 1),
+                            lambda: self.engine.calculate_peach_blossom(year, month, day, gender,
+                                                                        self.current_year))
+
+    def stats(self) -> Dict[str, Any]:
+        """缓存统计
+
+        Returns:
+            Dict包含: memory（LRUCache.stats）, disk_hits, computed
+        """
+        return {'memory': self.memory.stats(), 'disk_hits': self.disk_hits, 'computed': self.computed}
+
+    def flush(self):
+        """把尚未写盘的结果写入 SQLite"""
+        if self._db is None:
+            return
+        with self._db_lock:
+            if self._pending:
+                self._db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?)", self._pending)
+                self._db.commit()
+                self._pending = []
+
+    def close(self):
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ============ 预热 ============
+    def warm(self, kinds: Iterable[str] = ('peach',), progress: bool = True) -> int:
+        """离线计算整个输入域并写入磁盘（已存在的键会被覆盖）
+
+        Returns:
+            写入的结果条数
+        """
+        if self._db is None:
+            raise ValueError("预热需要指定 SQLite 文件路径")
+        written = 0
+        for kind in kinds:
+            if kind not in KINDS:
+                raise ValueError(f"未知的计算种类：{kind}（可选：{'、'.join(KINDS)}）")
+            total = len(_warm_years(kind)) * 12 * 31 * (24 if kind == 'fortune' else 2)
+            started = time.perf_counter()
+            batch = []
+            for key, value in self._iter_domain(kind):
+                batch.append((_db_key(kind, self.current_year, key), pickle.dumps(value, PICKLE_PROTOCOL)))
+                if len(batch) >= 5000:
+                    written += self._write_batch(batch)
+                    batch = []
+                    if progress:
+                        elapsed = time.perf_counter() - started
+                        print(f"\r{kind}: {written}/{total} 条，{written / elapsed:.0f} 条/秒",
+                              end='', file=sys.stderr, flush=True)
+            written += self._write_batch(batch)
+            if progress:
+                print(f"\r{kind}: 完成，共 {total} 条" + ' ' * 20, file=sys.stderr)
+        return written
+
+    def _iter_domain(self, kind: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        engine = self.engine
+        for year in _warm_years(kind):
+            for month in range(1, 13):
+                for day in range(1, 32):
+                    if kind == 'fortune':
+                        for hour in range(24):
+                            yield (_pack_key(year, month, day, hour),
+                                   engine.calculate_fortune(year, month, day, hour, self.current_year))
+                    else:
+                        for extra, gender in enumerate(('男', '女')):
+                            yield (_pack_key(year, month, day, extra),
+                                   engine.calculate_peach_blossom(year, month, day, gender, self.current_year))
+
+    def count(self, kind: str) -> int:
+        """磁盘中当前流年某种类的结果条数"""
+        lo = _db_key(kind, self.current_year, 0)
+        with self._db_lock:
+            return self._db.execute("SELECT COUNT(*) FROM results WHERE key >= ? AND key < ?",
+                                    (lo, lo + (1 << 32))).fetchone()[0]
+
+    def _write_batch(self, batch: List[Tuple[int, bytes]]) -> int:
+        with self._db_lock:
+            self._db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?)", batch)
+            self._db.commit()
+        return len(batch)
+
+    # ============ 内部实现 ============
+    def _validate(self, kind: str, year: int, month: int, day: int, hour: int):
+        error = self.engine.validate_date(year, month, day, hour, year_range=YEAR_RANGES[kind])
+        if error:
+            raise ValueError(error)
+
+    def _lookup(self, kind: str, key: int, compute) -> Dict[str, Any]:
+        memory_key = (kind, key)
+        value = self.memory.get(memory_key)
+        if value is not None:
+            return value
+
+        persisted = kind in self.persist
+        if persisted:
+            with self._db_lock:
+                row = self._db.execute("SELECT value FROM results WHERE key = ?",
+                                       (_db_key(kind, self.current_year, key),)).fetchone()
+            if row is not None:
+                self.disk_hits += 1
+                value = pickle.loads(row[0])
+                self.memory.put(memory_key, value)
+                return value
+
+        value = compute()
+        self.computed += 1
+        self.memory.put(memory_key, value)
+        if persisted:
+            with self._db_lock:
+                self._pending.append((_db_key(kind, self.current_year, key), pickle.dumps(value, PICKLE_PROTOCOL)))
+                should_flush = len(self._pending) >= FLUSH_EVERY
+            if should_flush:
+                self.flush()
+        return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="玄机命理结果缓存")
+    sub = parser.add_subparsers(dest='command', required=True)
+    warm = sub.add_parser('warm', help="预计算整个输入域并写入磁盘")
+    warm.add_argument('--kinds', default='peach', help="计算种类，逗号分隔（peach,fortune，默认 peach）")
+    stats = sub.add_parser('stats', help="查看磁盘缓存条数")
+    for p in (warm, stats):
+        p.add_argument('--db', default=DEFAULT_DB_PATH, help=f"SQLite 文件（默认 {DEFAULT_DB_PATH}）")
+        p.add_argument('--current-year', type=int, default=None, help="流年年份（默认今年）")
+    args = parser.parse_args()
+
+    with FortuneMemo(path=args.db, current_year=args.current_year) as memo:
+        if args.command == 'warm':
+            try:
+                memo.warm([k for k in args.kinds.split(',') if k])
+            except ValueError as e:
+                print(f"错误：{e}", file=sys.stderr)
+                sys.exit(1)
+        else:
+            for kind in KINDS:
+                print(f"{kind}: {memo.count(kind)} 条")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+玄机命理 - 运行时计时与计数
+
+关闭时不增加任何开销：引擎方法只在 enable() 时才替换为计时版本，
+disable() 恢复原方法；span() 关闭时返回一个空操作的上下文对象。
+
+开启后记录：
+    - 每个阶段（引擎方法或自定义 span）的耗时直方图、调用次数、异常次数
+    - 通过 watch_cache() 登记的缓存的命中、未命中、淘汰次数和命中率
+
+导出为 Prometheus 文本格式（to_prometheus）或 JSON（to_json）。
+设置环境变量 XUANJI_METRICS=1 时在导入本模块时自动开启；server.py、async_server.py
+和图形界面在开启时都会用 watch_engine() 登记引擎的缓存（图形界面退出时把结果打印到 stderr）。
+
+用法：
+    import metrics
+    metrics.enable()
+    metrics.watch_engine(engine)
+    with metrics.span('report.render'):
+        ...
+    print(metrics.to_prometheus())
+
+Author: Mystery Fortune Team
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional
+
+METRIC_PREFIX = 'xuanji'
+
+# 直方图桶上界（秒），从 1 微秒到 10 秒
+BUCKETS = [1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+           1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+# enable() 时计时的 FortuneEngine 方法（按阶段：输入校验、排盘、文本选取、查表等）
+ENGINE_METHODS = [
+    'validate_date', 'calculate_bazi', 'calculate_bazi_batch', 'calculate_fortune',
+    'search_auspicious', 'find_auspicious_days', 'get_almanac',
+    'get_zodiac_score', 'score_candidates', 'calculate_match',
+    'get_peach_blossom_star', 'calculate_peach_periods', 'get_peach_quality',
+    'calculate_peach_timelines', 'calculate_peach_blossom',
+    'get_lunar_date', 'get_daily_chongsha', '_compute_daily_chongsha', '_deterministic_slice',
+]
+
+
+class _Histogram:
+    __slots__ = ('buckets', 'count', 'total', 'errors')
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)  # 最后一格为 +Inf
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+
+
+class _State:
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.histograms: Dict[str, _Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.caches: Dict[str, Any] = {}
+        self.patched: Dict[str, Callable] = {}
+
+
+_state = _State()
+
+
+# ============ 记录 ============
+def observe(name: str, seconds: float, error: bool = False):
+    """记录一次阶段耗时"""
+    with _state.lock:
+        hist = _state.histograms.get(name)
+        if hist is None:
+            hist = _state.histograms[name] = _Histogram()
+        hist.buckets[bisect_left(BUCKETS, seconds)] += 1
+        hist.count += 1
+        hist.total += seconds
+        if error:
+            hist.errors += 1
+
+
+def incr(name: str, value: int = 1):
+    """计数器加一（关闭时不记录）"""
+    if not _state.enabled:
+        return
+    with _state.lock:
+        _state.counters[name] = _state.counters.get(name, 0) + value
+
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        observe(self.name, time.perf_counter() - self.start, exc_type is not None)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name: str):
+    """计时上下文：with span('阶段名'): ...（关闭时为空操作）"""
+    return _Span(name) if _state.enabled else _NOOP_SPAN
+
+
+def _wrap(name: str, fn: Callable) -> Callable:
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            observe(name, time.perf_counter() - start, True)
+            raise
+        observe(name, time.perf_counter() - start)
+        return result
+    return wrapper
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    """函数计时装饰器（用于界面等不在 ENGINE_METHODS 中的函数；关闭时只多一次开关判断）"""
+    def decorator(fn: Callable) -> Callable:
+        timed_fn = _wrap(name, fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _state.enabled:
+                return timed_fn(*args, **kwargs)
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def watch_cache(name: str, cache: Any):
+    """登记一个带 stats() 的缓存（如 FortuneEngine.daily_cache），导出时读取其命中率"""
+    with _state.lock:
+        _state.caches[name] = cache
+
+
+def watch_engine(engine: Any):
+    """登记 FortuneEngine 的全部缓存：daily（每日冲煞）、peach_base（桃花基础强度表）"""
+    watch_cache('daily', engine.daily_cache)
+    watch_cache('peach_base', engine.peach_base_cache)
+
+
+# ============ 开关 ============
+def enable():
+    """开启计时，并把 ENGINE_METHODS 替换为计时版本"""
+    from engine import FortuneEngine
+
+    with _state.lock:
+        if _state.enabled:
+            return
+        for method in ENGINE_METHODS:
+            original = FortuneEngine.__dict__[method]
+            _state.patched[method] = original
+            setattr(FortuneEngine, method, _wrap(f'engine.{method.lstrip("_")}', original))
+        _state.enabled = True
+
+
+def disable():
+    """关闭计时并恢复引擎原方法（已记录的数据保留）"""
+    from engine import FortuneEngine
+
+    with _state.lock:
+        for method, original in _state.patched.items():
+            setattr(FortuneEngine, method, original)
+        _state.patched.clear()
+        _state.enabled = False
+
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+
+def reset():
+    """清空已记录的数据"""
+    with _state.lock:
+        _state.histograms.clear()
+        _state.counters.clear()
+
+
+# ============ 导出 ============
+def snapshot() -> Dict[str, Any]:
+    """当前数据快照
+
+    Returns:
+        Dict包含:
+            spans: 阶段名 -> count, errors, total_seconds, mean_us, p50_us, p99_us, buckets
+            counters: 计数器名 -> 值
+            caches: 缓存名 -> 缓存的 stats()
+    """
+    with _state.lock:
+        spans = {name: (list(h.buckets), h.count, h.total, h.errors) for name, h in _state.histograms.items()}
+        counters = dict(_state.counters)
+        caches = dict(_state.caches)
+
+    result = {'spans': {}, 'counters': counters, 'caches': {}}
+    for name, (buckets, count, total, errors) in sorted(spans.items()):
+        result['spans'][name] = {
+            'count': count,
+            'errors': errors,
+            'total_seconds': total,
+            'mean_us': total / count * 1e6 if count else 0.0,
+            'p50_us': _quantile(buckets, count, 0.5) * 1e6,
+            'p99_us': _quantile(buckets, count, 0.99) * 1e6,
+            'buckets': buckets,
+        }
+    for name, cache in sorted(caches.items()):
+        result['caches'][name] = cache.stats()
+    return result
+
+
+def _quantile(buckets: List[int], count: int, q: float) -> float:
+    """按直方图估算分位数（取所在桶的上界）"""
+    if not count:
+        return 0.0
+    rank = q * count
+    seen = 0
+    for i, n in enumerate(buckets):
+        seen += n
+        if seen >= rank:
+            return BUCKETS[i] if i < len(BUCKETS) else float('inf')
+    return float('inf')
+
+
+def to_json(indent: Optional[int] = None) -> str:
+    snap = snapshot()
+    snap['bucket_bounds'] = BUCKETS
+    return json.dumps(snap, ensure_ascii=False, indent=indent)
+
+
+def to_prometheus() -> str:
+    """Prometheus 文本格式"""
+    snap = snapshot()
+    p = METRIC_PREFIX
+    lines = [f'# HELP {p}_span_seconds 各阶段耗时', f'# TYPE {p}_span_seconds histogram']
+    for name, data in snap['spans'].items():
+        cumulative = 0
+        for bound, n in zip(BUCKETS + ['+Inf'], data['buckets']):
+            cumulative += n
+            le = bound if bound == '+Inf' else repr(bound)
+            lines.append(f'{p}_span_seconds_bucket{{span="{name}",le="{le}"}} {cumulative}')
+        lines.append(f'{p}_span_seconds_sum{{span="{name}"}} {data["total_seconds"]!r}')
+        lines.append(f'{p}_span_seconds_count{{span="{name}"}} {data["count"]}')
+    lines += [f'# HELP {p}_span_errors_total 各阶段抛出异常次数', f'# TYPE {p}_span_errors_total counter']
+    lines += [f'{p}_span_errors_total{{span="{name}"}} {data["errors"]}' for name, data in snap['spans'].items()]
+
+    if snap['counters']:
+        lines.append(f'# TYPE {p}_events_total counter')
+        lines += [f'{p}_events_total{{name="{name}"}} {value}' for name, value in snap['counters'].items()]
+
+    if snap['caches']:
+        for field, kind in (('hits', 'counter'), ('misses', 'counter'), ('evictions', 'counter'),
+                            ('size', 'gauge'), ('hit_rate', 'gauge')):
+            metric = f'{p}_cache_{field}' + ('_total' if kind == 'counter' else '')
+            lines.append(f'# TYPE {metric} {kind}')
+            lines += [f'{metric}{{cache="{name}"}} {stats[field]}' for name, stats in snap['caches'].items()]
+    return '\n'.join(lines) + '\n'
+
+
+if os.environ.get('XUANJI_METRICS') == '1':
+    enable()
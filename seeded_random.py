@@ -0,0 +1,151 @@
+"""
+玄机命理 - 确定性随机数
+
+同样的种子永远得到同样的结果，是"同样输入同样输出"的基础。提供两类生成器：
+
+    - 正弦生成器（现行算法）：frac(sin(seed) * 10000)
+      FortuneEngine 与网页版 Utils.seededRandom 一直使用这一算法，已有的结果全部依赖它，
+      因此保持不变。它依赖 sin 的浮点实现，只能保证与 CPython 的 math.sin 逐位一致。
+
+    - 整数哈希生成器（新模式使用）：32 位 splitmix 风格的整数混合，
+      只用 32 位整数乘法和移位，与浮点实现无关。NumPy 批量计算比正弦版快（约 1.7 倍），
+      在 Python、NumPy 与网页版 JavaScript（Utils.hashU32，Math.imul）中结果逐位相同。
+      按 HASH_VERSIONS 编号区分版本，已发布的版本参数不再修改，需要改算法时新增版本号。
+
+每种生成器都有标量版和 NumPy 批量版（numpy 为可选依赖，首次调用批量版时才导入）。
+NumPy 批量版的正弦在首次使用时会与 math.sin 抽样比对，不一致的平台自动逐个调用 math.sin，
+保证结果与标量版逐位相同。
+
+Author: Mystery Fortune Team
+"""
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+# numpy 为可选依赖，首次批量计算时才导入（标量版不需要，避免拖慢界面启动）
+np = None
+
+_sin = math.sin
+_floor = math.floor
+
+MASK32 = 0xFFFFFFFF
+
+# 版本号 -> (种子增量, 乘数1, 乘数2, 移位1, 移位2, 移位3)
+HASH_VERSIONS: Dict[int, Tuple[int, int, int, int, int, int]] = {
+    1: (0x9E3779B9, 0x21F0AAAD, 0x735A2D97, 16, 15, 15),
+}
+HASH_VERSION = 1
+
+
+# ============ 正弦生成器（现行算法） ============
+def sin_random(seed: int) -> float:
+    """[0, 1) 之间的确定性随机数：frac(sin(seed) * 10000)"""
+    x = _sin(seed) * 10000
+    return x - _floor(x)
+
+
+def sin_int(seed: int, min_val: int, max_val: int) -> int:
+    """[min_val, max_val] 之间的确定性整数"""
+    x = _sin(seed) * 10000
+    return min_val + int((x - _floor(x)) * (max_val - min_val + 1))
+
+
+def sin_slice(arr: Sequence, n: int, seed: int) -> List:
+    """按 sin_random(seed + i) 排序后取前 n 个（同分时保持原顺序）"""
+    keys = [sin_random(seed + i) for i in range(len(arr))]
+    order = sorted(range(len(arr)), key=keys.__getitem__)
+    return [arr[i] for i in order[:n]]
+
+
+# ============ 整数哈希生成器（新模式） ============
+def hash_u32(seed: int, version: int = HASH_VERSION) -> int:
+    """种子的 32 位无符号哈希值（种子按 32 位补码截断）"""
+    inc, mul1, mul2, s1, s2, s3 = HASH_VERSIONS[version]
+    z = (seed + inc) & MASK32
+    z = ((z ^ (z >> s1)) * mul1) & MASK32
+    z = ((z ^ (z >> s2)) * mul2) & MASK32
+    return z ^ (z >> s3)
+
+
+def hash_random(seed: int, version: int = HASH_VERSION) -> float:
+    """[0, 1) 之间的确定性随机数（哈希值 / 2^32，浮点运算精确无舍入）"""
+    return hash_u32(seed, version) / 4294967296.0
+
+
+def hash_int(seed: int, min_val: int, max_val: int, version: int = HASH_VERSION) -> int:
+    """[min_val, max_val] 之间的确定性整数（纯整数运算）"""
+    return min_val + ((hash_u32(seed, version) * (max_val - min_val + 1)) >> 32)
+
+
+def hash_slice(arr: Sequence, n: int, seed: int, version: int = HASH_VERSION) -> List:
+    """按 hash_u32(seed + i) 排序后取前 n 个（同分时保持原顺序）"""
+    keys = [hash_u32(seed + i, version) for i in range(len(arr))]
+    order = sorted(range(len(arr)), key=keys.__getitem__)
+    return [arr[i] for i in order[:n]]
+
+
+# ============ NumPy 批量版本 ============
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("批量计算需要安装 numpy：pip install numpy") from None
+        np = numpy
+
+
+_numpy_sin_exact = None
+
+
+def numpy_sin_exact() -> bool:
+    """np.sin 在本平台上是否与 math.sin 逐位一致（抽样比对，只检查一次）"""
+    global _numpy_sin_exact
+    if _numpy_sin_exact is None:
+        _require_numpy()
+        # 覆盖实际使用的种子范围：日期种子（19000101-21001231 附近）和小整数
+        samples = np.concatenate([np.arange(-2000, 2000), np.arange(19000101, 21001231, 997)])
+        expected = np.array([_sin(int(s)) for s in samples])
+        _numpy_sin_exact = bool(np.array_equal(np.sin(samples.astype(np.float64)), expected))
+    return _numpy_sin_exact
+
+
+def sin_random_array(seeds) -> "np.ndarray":
+    """sin_random 的批量版本，返回 float64 数组，与逐个调用结果逐位相同"""
+    _require_numpy()
+    seeds = np.asarray(seeds, dtype=np.int64)
+    if numpy_sin_exact():
+        x = np.sin(seeds.astype(np.float64)) * 10000
+    else:
+        x = np.fromiter((_sin(int(s)) for s in seeds.ravel()), dtype=np.float64,
+                        count=seeds.size).reshape(seeds.shape) * 10000
+    return x - np.floor(x)
+
+
+def sin_int_array(seeds, min_val: int, max_val: int) -> "np.ndarray":
+    """sin_int 的批量版本，返回 int64 数组"""
+    return min_val + (sin_random_array(seeds) * (max_val - min_val + 1)).astype(np.int64)
+
+
+def hash_u32_array(seeds, version: int = HASH_VERSION) -> "np.ndarray":
+    """hash_u32 的批量版本，返回 uint32 数组"""
+    _require_numpy()
+    inc, mul1, mul2, s1, s2, s3 = HASH_VERSIONS[version]
+    # 先取 32 位补码再转 uint32，uint32 乘法自动按 2^32 回绕
+    z = (np.asarray(seeds, dtype=np.int64) & MASK32).astype(np.uint32)
+    with np.errstate(over='ignore'):
+        z = z + np.uint32(inc)
+        z = (z ^ (z >> np.uint32(s1))) * np.uint32(mul1)
+        z = (z ^ (z >> np.uint32(s2))) * np.uint32(mul2)
+    return z ^ (z >> np.uint32(s3))
+
+
+def hash_random_array(seeds, version: int = HASH_VERSION) -> "np.ndarray":
+    """hash_random 的批量版本，返回 float64 数组"""
+    return hash_u32_array(seeds, version) / 4294967296.0
+
+
+def hash_int_array(seeds, min_val: int, max_val: int, version: int = HASH_VERSION) -> "np.ndarray":
+    """hash_int 的批量版本，返回 int64 数组"""
+    z = hash_u32_array(seeds, version).astype(np.uint64)
+    return min_val + ((z * np.uint64(max_val - min_val + 1)) >> np.uint64(32)).astype(np.int64)
@@ -0,0 +1,253 @@
+"""
+玄机命理 - 本地 HTTP/JSON 服务
+
+只依赖标准库：ThreadingHTTPServer 每个连接一个线程，HTTP/1.1 长连接。
+所有请求共用同一个 FortuneEngine，因此每日冲煞缓存、配对分数表等也一并共用。
+
+接口（GET，参数放在查询字符串中，返回 JSON）：
+    /api/fortune     year, month, day, hour[, current_year]       八字命理
+    /api/almanac     [date][, days]                               老黄历（默认今天，days 为连续天数）
+    /api/auspicious  event[, start, end, avoid_zodiac, avoid_sha,
+                     ji_shen, weekend_only, limit]                黄道吉日
+    /api/match       male, female                                 生肖配对
+    /api/peach       year, month, day, gender[, current_year]     桃花运
+    /api/stats                                                    缓存统计
+
+日期参数格式为 YYYY-MM-DD，多个取值用逗号分隔（如 avoid_zodiac=鼠,马）。
+
+运行：python server.py [--host 127.0.0.1] [--port 8000]
+
+Author: Mystery Fortune Team
+"""
+
+import argparse
+import json
+from datetime import date as date_cls, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import metrics
+from engine import FortuneEngine, EVENT_TYPES, BIRTH_YEAR_RANGE, PEACH_BIRTH_YEAR_RANGE
+
+# 一次最多返回的老黄历天数
+MAX_ALMANAC_DAYS = 366
+
+Params = Dict[str, List[str]]
+
+
+class ApiError(ValueError):
+    """请求参数错误（返回 HTTP 400）"""
+
+
+# ============ 参数解析 ============
+def _get(params: Params, name: str, default: Optional[str] = None) -> str:
+    values = params.get(name)
+    if values:
+        return values[0]
+    if default is None:
+        raise ApiError(f"缺少参数：{name}")
+    return default
+
+
+def _get_int(params: Params, name: str, default: Optional[int] = None) -> int:
+    raw = _get(params, name, None if default is None else str(default))
+    try:
+        return int(raw)
+    except ValueError:
+        raise ApiError(f"参数 {name} 必须是整数：{raw}")
+
+
+def _get_date(params: Params, name: str, default: Optional[datetime] = None) -> datetime:
+    raw = _get(params, name, '' if default is not None else None)
+    if not raw:
+        return default
+    try:
+        return datetime.strptime(raw, '%Y-%m-%d')
+    except ValueError:
+        raise ApiError(f"参数 {name} 日期格式应为 YYYY-MM-DD：{raw}")
+
+
+def _get_list(params: Params, name: str) -> List[str]:
+    return [item for raw in params.get(name, []) for item in raw.split(',') if item]
+
+
+def _get_date_parts(engine: FortuneEngine, params: Params, hour: bool,
+                    year_range: Tuple[int, int] = BIRTH_YEAR_RANGE) -> Tuple[int, ...]:
+    parts = tuple(_get_int(params, name) for name in ('year', 'month', 'day'))
+    parts += (_get_int(params, 'hour'),) if hour else (0,)
+    error = engine.validate_date(*parts, year_range=year_range)
+    if error:
+        raise ApiError(error)
+    return parts
+
+
+def _check_choice(value: str, choices: List[str], name: str) -> str:
+    if value not in choices:
+        raise ApiError(f"参数 {name} 无效：{value}（可选：{'、'.join(choices)}）")
+    return value
+
+
+# ============ 各接口 ============
+def api_fortune(engine: FortuneEngine, params: Params) -> Dict[str, Any]:
+    year, month, day, hour = _get_date_parts(engine, params, hour=True)
+    current_year = _get_int(params, 'current_year', datetime.now().year)
+    return engine.calculate_fortune(year, month, day, hour, current_year)
+
+
+def api_almanac(engine: FortuneEngine, params: Params) -> Any:
+    date = _get_date(params, 'date', datetime.now())
+    if 'days' not in params:
+        return engine.get_almanac(date)
+    days = _get_int(params, 'days')
+    if not 1 <= days <= MAX_ALMANAC_DAYS:
+        raise ApiError(f"参数 days 应在 1-{MAX_ALMANAC_DAYS} 之间：{days}")
+    return list(engine.iter_almanac(date, days))
+
+
+def api_auspicious(engine: FortuneEngine, params: Params) -> List[Dict[str, Any]]:
+    event = _check_choice(_get(params, 'event'), EVENT_TYPES, 'event')
+    if 'start' not in params and 'end' not in params:
+        return engine.search_auspicious(event)
+
+    start = _get_date(params, 'start')
+    end = _get_date(params, 'end')
+    limit = _get_int(params, 'limit', 0)
+    try:
+        return engine.find_auspicious_days(
+            event, start, end,
+            avoid_zodiac=_get_list(params, 'avoid_zodiac'),
+            avoid_sha=_get_list(params, 'avoid_sha'),
+            ji_shen=_get_list(params, 'ji_shen'),
+            weekend_only=_get(params, 'weekend_only', '0').lower() in ('1', 'true', 'yes'),
+            limit=limit or None,
+        )
+    except ValueError as e:  # 日期超出 DayTable 范围
+        raise ApiError(str(e))
+
+
+def api_match(engine: FortuneEngine, params: Params) -> Dict[str, Any]:
+    male = _check_choice(_get(params, 'male'), engine.shengxiao, 'male')
+    female = _check_choice(_get(params, 'female'), engine.shengxiao, 'female')
+    return engine.calculate_match(male, female)
+
+
+def api_peach(engine: FortuneEngine, params: Params) -> Dict[str, Any]:
+    year, month, day, _ = _get_date_parts(engine, params, hour=False, year_range=PEACH_BIRTH_YEAR_RANGE)
+    gender = _check_choice(_get(params, 'gender'), ['男', '女'], 'gender')
+    current_year = _get_int(params, 'current_year', datetime.now().year)
+    return engine.calculate_peach_blossom(year, month, day, gender, current_year)
+
+
+def api_stats(engine: FortuneEngine, params: Params) -> Dict[str, Any]:
+    stats = {'daily_cache': engine.daily_cache.stats(), 'peach_base_cache': engine.peach_base_cache.stats()}
+    if metrics.is_enabled():
+        stats['metrics'] = metrics.snapshot()
+    return stats
+
+
+ROUTES: Dict[str, Callable[[FortuneEngine, Params], Any]] = {
+    '/api/fortune': api_fortune,
+    '/api/almanac': api_almanac,
+    '/api/auspicious': api_auspicious,
+    '/api/match': api_match,
+    '/api/peach': api_peach,
+    '/api/stats': api_stats,
+}
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.strftime('%Y-%m-%d')
+    if isinstance(obj, date_cls):
+        return obj.isoformat()
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"无法序列化的类型：{type(obj).__name__}")
+
+
+def encode_json(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def dispatch(engine: FortuneEngine, target: str) -> Tuple[int, bytes]:
+    """处理一个请求目标（路径 + 查询字符串）
+
+    Returns:
+        (HTTP 状态码, JSON 响应体)
+    """
+    url = urlsplit(target)
+    handler = ROUTES.get(url.path)
+    if handler is None:
+        return 404, encode_json({'error': f"未知接口：{url.path}"})
+    try:
+        return 200, encode_json(handler(engine, parse_qs(url.query)))
+    except ApiError as e:
+        return 400, encode_json({'error': str(e)})
+    except Exception as e:  # 单个请求出错不影响服务
+        return 500, encode_json({'error': f"服务内部错误：{e}"})
+
+
+# ============ HTTP 服务 ============
+class FortuneRequestHandler(BaseHTTPRequestHandler):
+    """JSON 接口请求处理（HTTP/1.1 长连接）"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'MysteryFortune/1.0'
+    # 响应头和响应体分两次写出，关闭 Nagle 算法避免长连接上的延迟确认等待
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        status, body = dispatch(self.server.engine, self.path)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class FortuneServer(ThreadingHTTPServer):
+    """共用一个 FortuneEngine 的多线程 HTTP 服务"""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address: Tuple[str, int], engine: Optional[FortuneEngine] = None,
+                 verbose: bool = False):
+        super().__init__(address, FortuneRequestHandler)
+        self.engine = engine if engine is not None else FortuneEngine()
+        self.verbose = verbose
+        # 启动时构建逐日表，避免首个请求承担构建开销
+        self.engine.day_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="玄机命理 HTTP/JSON 服务")
+    parser.add_argument('--host', default='127.0.0.1', help="监听地址（默认 127.0.0.1）")
+    parser.add_argument('--port', type=int, default=8000, help="监听端口（默认 8000）")
+    parser.add_argument('--verbose', action='store_true', help="打印每个请求的访问日志")
+    parser.add_argument('--metrics', action='store_true', help="开启计时统计（结果见 /api/stats）")
+    args = parser.parse_args()
+
+    server = FortuneServer((args.host, args.port), verbose=args.verbose)
+    if args.metrics:
+        metrics.enable()
+    if metrics.is_enabled():  # --metrics 或 XUANJI_METRICS=1
+        metrics.watch_engine(server.engine)
+    print(f"玄机命理服务已启动：http://{args.host}:{args.port}/api/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
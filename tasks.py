@@ -0,0 +1,139 @@
+"""
+玄机命理 - 界面后台计算
+
+计算在工作线程中执行，结果经队列交回 Tk 主循环（root.after 轮询），
+回调只在主线程中调用，因此回调里可以放心操作控件。
+
+    - 同一个 key（通常对应一个面板）再次提交时，上一次的任务即被取代：
+      尚未开始的直接取消，已在运行的算完后结果丢弃，不会覆盖新结果
+    - 任务超过 busy_delay_ms 仍未完成时调用 on_busy(True)（显示进度），完成时调用 on_busy(False)；
+      很快完成的任务不显示进度，避免闪烁
+
+用法：
+    runner = TaskRunner(root)
+    runner.submit('fortune', engine.calculate_fortune, 1990, 5, 6, 7,
+                  on_done=render, on_busy=show_progress)
+
+Author: Mystery Fortune Team
+"""
+
+import queue
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class TaskRunner:
+    """后台执行计算，结果在 Tk 主线程中回调"""
+
+    def __init__(self, root, executor: Optional[Executor] = None, poll_ms: int = 15,
+                 busy_delay_ms: int = 120):
+        """
+        Args:
+            root: Tk 根窗口（只使用其 after 方法）
+            executor: 执行器，默认 2 个工作线程；可传入 ProcessPoolExecutor，
+                      此时提交的函数和参数须可 pickle
+            poll_ms: 有任务未完成时检查结果队列的间隔
+            busy_delay_ms: 任务超过此时间未完成才显示进度
+        """
+        self.root = root
+        self.executor = executor if executor is not None else ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix='fortune-task')
+        self.poll_ms = poll_ms
+        self.busy_delay_ms = busy_delay_ms
+        self._tk_thread = threading.get_ident()
+        self._results: "queue.Queue" = queue.Queue()
+        self._generation: Dict[str, int] = {}
+        self._futures: Dict[str, Future] = {}
+        self._callbacks: Dict[str, tuple] = {}
+        self._busy_shown: Dict[str, Callable[[bool], Any]] = {}
+        self._polling = False
+
+    def submit(self, key: str, fn: Callable, *args, on_done: Callable[[Any], Any],
+               on_error: Optional[Callable[[BaseException], Any]] = None,
+               on_busy: Optional[Callable[[bool], Any]] = None) -> int:
+        """提交任务（须在主线程调用），取代同一 key 下尚未完成的任务
+
+        Args:
+            on_done: on_done(结果)，在主线程调用
+            on_error: on_error(异常)，在主线程调用；默认交给 Tk 的异常报告
+            on_busy: 进度显示回调，参数 True 显示、False 隐藏
+
+        Returns:
+            任务序号
+        """
+        generation = self._generation.get(key, 0) + 1
+        self._generation[key] = generation
+        previous = self._futures.get(key)
+        if previous is not None:
+            previous.cancel()
+
+        future = self.executor.submit(fn, *args)
+        self._futures[key] = future
+        self._callbacks[key] = (on_done, on_error)
+        # 完成回调在工作线程中执行，只把结果放入队列
+        future.add_done_callback(lambda f: self._results.put((key, generation, f)))
+
+        if on_busy is not None and key not in self._busy_shown:
+            self.root.after(self.busy_delay_ms, self._show_busy, key, on_busy)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return generation
+
+    def cancel(self, key: str):
+        """取消某个 key 下尚未完成的任务（结果不再回调）"""
+        if key not in self._futures:
+            return
+        self._generation[key] += 1
+        self._futures.pop(key).cancel()
+        self._callbacks.pop(key, None)
+        self._hide_busy(key)
+
+    def pending(self, key: str) -> bool:
+        return key in self._futures
+
+    def shutdown(self):
+        """取消尚未开始的任务并关闭执行器（不等待正在运行的任务）"""
+        # 被取代的任务在 submit 时已取消，这里逐个取消其余未完成的任务，
+        # 不依赖 Python 3.9 才有的 shutdown(cancel_futures=True)
+        for key in list(self._futures):
+            self.cancel(key)
+        self.executor.shutdown(wait=False)
+
+    # ============ 主线程部分 ============
+    def _show_busy(self, key: str, on_busy: Callable[[bool], Any]):
+        # 期间若有新任务取代，以最新任务是否完成为准
+        if key in self._futures and key not in self._busy_shown:
+            self._busy_shown[key] = on_busy
+            on_busy(True)
+
+    def _hide_busy(self, key: str):
+        on_busy = self._busy_shown.pop(key, None)
+        if on_busy is not None:
+            on_busy(False)
+
+    def _poll(self):
+        assert threading.get_ident() == self._tk_thread, "TaskRunner 回调必须在 Tk 主线程中执行"
+        while True:
+            try:
+                key, generation, future = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._generation.get(key) or future.cancelled():
+                continue  # 已被取代
+            on_done, on_error = self._callbacks.pop(key)
+            del self._futures[key]
+            self._hide_busy(key)
+            error = future.exception()
+            if error is None:
+                on_done(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                self.root.report_callback_exception(type(error), error, error.__traceback__)
+
+        if self._futures:
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
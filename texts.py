@@ -0,0 +1,192 @@
+"""
+玄机命理 - 解读文本表
+
+命理解读、流年运势、老黄历宜忌、冲煞吉凶、桃花星等说明文字。
+这些表只在相应功能第一次计算时由 engine 导入，不拖慢界面启动；
+engine.READINGS 等旧名称仍可访问（按需转到本模块）。
+
+Author: Mystery Fortune Team
+"""
+
+
+# ============ 解读文本数据 ============
+
+# 命理综合解读（日主五行 -> 身旺/身弱 -> 解读）
+READINGS = {
+    '木': {
+        True: ["日主甲木身旺，如参天大树，刚正不阿，领导力强，适合创业或管理岗位。",
+               "木旺喜金来雕琢，方能成器，宜从事纪律性强的工作。",
+               "财运方面，中年后财库渐丰，有積蓄之象。"],
+        False: ["日主甲木身弱，如幼苗无依，需得水木生扶，方能茂盛。",
+               "适合团队合作，借助贵人之力发展事业。",
+               "心态平和，不争不抢，婚姻缘分来得较晚，但质量高。"]},
+    '火': {
+        True: ["日主丙火身旺，如日中天，光明磊落，热情开朗，有领袖气质。",
+               "火旺则燥，需水来济，否则性格急躁，宜修身养性。",
+               "事业运佳，年轻时即有成就，中年可达高峰。"],
+        False: ["日主丙火身弱，如火烛微弱，需木来生扶，方能光耀。",
+               "性格温和，善于交际，人缘极佳，适合公关、销售类工作。",
+               "财运平稳，不宜冒险投资，稳健经营为佳。"]},
+    '土': {
+        True: ["日主戊土身旺，如山岳稳重，诚实守信，有担当，但固执。",
+               "土旺喜木来疏，否则过于保守，错失良机。",
+               "适合稳定的工作环境，如政府、国企、教育等行业。"],
+        False: ["日主戊土身弱，如田园乏水，需火土生扶，方能肥沃。",
+               "性格随和，包容性强，人缘好，但需增强自信。",
+               "中年后运势渐入佳境，大器晚成。"]},
+    '金': {
+        True: ["日主庚金身旺，如刃剑出鞘，果断刚毅，但需火来练，方成利器。",
+               "金旺克木太过，宜注意人际关系，避免过于强势。",
+               "武职、法律、金融行业发展佳，有正财运。"],
+        False: ["日主庚金身弱，如饰品小巧，需土金生扶，方显价值。",
+               "心思细密，善于策划，适合幕后工作或技术岗位。",
+               "财运需耐心经营，不可急于求成，稳中求进。"]},
+    '水': {
+        True: ["日主壬水身旺，如江河汹涌，智慧过人，变通能力强。",
+               "水旺则泪，需土来制，否则思绪不定，难以专注。",
+               "适合智力工作如研究、写作、咨询等，有海外发展运。"],
+        False: ["日主壬水身弱，如源头细流，需金水生扶，方能汇流成河。",
+               "性格温顺，适应力强，人缘好，婚姻和美。",
+               "财运需贵人提携，合作经营为佳，不宜单打独斗。"]}
+}
+
+# 一生命运概述（日主五行 -> 身旺/身弱 -> 概述）
+LIFE_READINGS = {
+    '木': {
+        True: [
+            "【综合命运】日主甲木身旺，如参天大树，生命力旺盛。一生性格刚正不阿，有领导才能，适合担任管理者角色。",
+            "【少年运势】（1-25岁）少年时期学业顺利，聪明好学，但性格较为倒强，需注意与人相处的方式方法。",
+            "【中年运势】（26-50岁）中年事业有成，财运亨通，但木旺克土，需注意婚姻家庭的经营，避免因事业而忽视家人。",
+            "【晚年运势】（51岁后）晚年安康，子孙孝顺，可享天伦之乐。注意肝胆保养，适当运动。"
+        ],
+        False: [
+            "【综合命运】日主甲木身弱，如幼苗需水木滋养。一生性格温和，善于合作，适合团队工作，借助贵人之力发展。",
+            "【少年运势】（1-25岁）少年时期可能较为艰苦，需要努力学习，多依靠父母帮助。",
+            "【中年运势】（26-50岁）中年运势渐入佳境，遇贵人相助，事业有成。婚姻缘分来得稍晚，但质量高。",
+            "【晚年运势】（51岁后）晚年子孙孝顺，大器晚成，可享清福。注意肝胆、筋骨保养。"
+        ]
+    },
+    '火': {
+        True: [
+            "【综合命运】日主丙火身旺，如日中天，光明磊落，热情开朗。具有领袖气质，事业心强，年轻时即有成就。",
+            "【少年运势】（1-25岁）少年时期活泼好动，学业表现突出，但性格急躁，需修身养性。",
+            "【中年运势】（26-50岁）中年事业达高峰，名利双收。但火旺则燥，需水来济，宜多与水型人合作。",
+            "【晚年运势】（51岁后）晚年子孙有出息，家庭和睦。注意心血管保养，忌暴躁。"
+        ],
+        False: [
+            "【综合命运】日主丙火身弱，如烛火微弱，需木来生扶。性格温和，善于交际，人缘极佳。",
+            "【少年运势】（1-25岁）少年时期需贵人提携，依靠家庭扶持，学业平稳。",
+            "【中年运势】（26-50岁）中年运势渐佳，适合公关、销售类工作。财运平稳，不宜冒险投资。",
+            "【晚年运势】（51岁后）晚年子孙缘深，家庭幸福。注意心脏、血压保养。"
+        ]
+    },
+    '土': {
+        True: [
+            "【综合命运】日主戊土身旺，如山岳稳重，诚实守信，有担当。但过于固执，需注意灵活变通。",
+            "【少年运势】（1-25岁）少年时期性格踏实，学业稳定，但不够灵活，需多拓展视野。",
+            "【中年运势】（26-50岁）中年事业稳定，适合政府、国企、教育等行业。财运稳健，積蓄渐丰。",
+            "【晚年运势】（51岁后）晚年安稳，子孙孝顺，家业兴旺。注意脾胃保养。"
+        ],
+        False: [
+            "【综合命运】日主戊土身弱，如田园乏水，需火土生扶。性格随和，包容性强，人缘好。",
+            "【少年运势】（1-25岁）少年时期需依靠家庭，学业较为平常，但能吃苦耐劳。",
+            "【中年运势】（26-50岁）中年后运势渐入佳境，大器晚成。适合稳定的工作环境。",
+            "【晚年运势】（51岁后）晚年福泻深厚，子孙满堂，家庄和睦。注意肠胃保养。"
+        ]
+    },
+    '金': {
+        True: [
+            "【综合命运】日主庚金身旺，如刃剑出鞘，果断刚毅。适合武职、法律、金融等行业。",
+            "【少年运势】（1-25岁）少年时期性格要强，学业表现突出，但需注意人际关系。",
+            "【中年运势】（26-50岁）中年事业有成，正财运佳。但金旺克木太过，宜注意家庭和谐。",
+            "【晚年运势】（51岁后）晚年安康，子孙孝顺。注意肺部、呼吸系统保养。"
+        ],
+        False: [
+            "【综合命运】日主庚金身弱，如饰品小巧，需土金生扶。心思细密，善于策划，适合幕后工作。",
+            "【少年运势】（1-25岁）少年时期需依靠家庭扶持，学业平稳，善于思考。",
+            "【中年运势】（26-50岁）中年运势渐佳，适合技术、管理岗位。财运需耐心经营，稳中求进。",
+            "【晚年运势】（51岁后）晚年子孙缘深，家庭和睦。注意肺部、皮肤保养。"
+        ]
+    },
+    '水': {
+        True: [
+            "【综合命运】日主壬水身旺，如江河汹涌，智慧过人，变通能力强。适合研究、写作、咨询等智力工作。",
+            "【少年运势】（1-25岁）少年时期聪明过人，学业优异，但思绪不定，需专注。",
+            "【中年运势】（26-50岁）中年事业有成，有海外发展运。但水旺则泛，需土来制，宜与土型人合作。",
+            "【晚年运势】（51岁后）晚年智慧不减，可发挥余热。注意肾脏、泰尿系统保养。"
+        ],
+        False: [
+            "【综合命运】日主壬水身弱，如源头细流，需金水生扶。性格温顺，适应力强，人缘好。",
+            "【少年运势】（1-25岁）少年时期需家庭扶持，学业平稳，但善于适应环境。",
+            "【中年运势】（26-50岁）中年运势渐佳，需贵人提携，合作经营为佳。婚姻和美。",
+            "【晚年运势】（51岁后）晚年子孙缘深，家庭幸福。注意肾脏、注意保暖。"
+        ]
+    }
+}
+
+# 流年运势（运势等级 -> (概述, 详情)）
+YEAR_LUCK_TEXTS = {
+    '大吉': ("流年为喜用神，诸事顺遍，可積极进取。", [
+        "💰 财运：财运亨通，正财偏财皆有机会，可适当投资理财，但不宜贪心。",
+        "🏢 事业：工作顺利，有贵人相助，适合拓展业务或谋求晋升。",
+        "💗 感情：单身者有望遇良缘，已婚者感情和睦，家庭美满。",
+        "🎯 健康：身体状况良好，但仍需注意作息规律，勿过度劳累。"
+    ]),
+    '平稳': ("流年与日主同元，运势平稳，宜守不宜攻。", [
+        "💰 财运：收入稳定，正财为主，不宜投机冒险，稳健理财为宜。",
+        "🏢 事业：工作按部就班，不宜贸然跳槽或创业，守住本职为上。",
+        "💗 感情：感情平淡，需用心经营，多与伴侣沟通交流。",
+        "🎯 健康：注意肠胃保养，饮食宜清淡，保持适当运动。"
+    ]),
+    '平常': ("流年与命局有冲，宜谨慎行事，避免重大决策。", [
+        "💰 财运：财运波动，忌贪忌投机，守住现有钱财，勿轻信他人。",
+        "🏢 事业：工作中可能遇到小人或阻碍，宜低调做事，不争风头。",
+        "💗 感情：感情易有波折，多包容理解，避免争吵。",
+        "🎯 健康：注意安全，谨防意外，定期体检，预防为主。"
+    ]),
+}
+
+# 老黄历宜事详解
+YI_EXPLANATIONS = {
+    "嫁娶": "【嫁娶】今日适合举办婚礼、订婚、提亲等喜事。选择此日成婚，夫妻和睦，白头偕老，子孙满堂。婚姻大事，需择良辰吉日，方能福泽绵长。",
+    "祭祀": "【祭祀】今日适合祭拜神明、祖先、上香进贡。可前往寺庙烧香祈福，或在家中祭祀先人。诚心祭拜，可保家宅平安，事业顺遂。",
+    "出行": "【出行】今日适合外出、旅游、出差、探亲访友。路途平安顺利，诸事顺心。无论是短途还是远行，都能一路平安，高高兴兴出门，平平安安回家。",
+    "开市": "【开市】今日适合店铺开业、公司开张、新项目启动。选此日开业，财源广进，客似云来，生意兴隆。新店开张或公司成立，均为上上大吉之日。",
+    "纳财": "【纳财】今日适合收取钱财、结算账款、收取租金。财运亨通，进财顺利，适合处理财务事宜。无论是收款还是理财，都能顺风顺水。",
+    "动土": "【动土】今日适合建房动工、地基开挖、园林施工。动土大吉，工程顺利，地基稳固。此日动工，可保建筑稳固，家宅兴旺。",
+    "安床": "【安床】今日适合安置床铺、调整床位。床位安定，睡眠安稳，家庭和睦。新婚安床或调整卧室布局，皆为吉日。",
+    "入宅": "【入宅】今日适合搬家入住、乔迁新居。入住新居后家运亨通，万事如意。新家入住，品质生活从此开始，幸福美满源源不断。",
+    "开光": "【开光】今日适合佛像开光、神位开光、吉祥物品开光。开光后的物品灵气十足，可保佑平安、招财进宝。",
+    "修造": "【修造】今日适合房屋修缮、装修改造。工程顺利，质量保证，修缮后的房屋稳固耐用。无论是小修小补还是大工程，都能顺利完工。"
+}
+
+# 老黄历忌事详解
+JI_EXPLANATIONS = {
+    "诉讼": "【诉讼】今日不宜打官司、起诉、争讼。若有纠纷，宜和解为上，否则官司缠身，耗财伤神。退一步海阔天空，忍一时风平浪静。",
+    "安葬": "【安葬】今日不宜下葬、安放遗骸。宜另择吉日，以免影响子孙运势。丧葬大事，须慎重择日，方能保家宅安宁。",
+    "破土": "【破土】今日不宜挖掘土地、墓地动工。恐惊动土神，带来不利。若有土木工程，宜择他日方能平安顺利。",
+    "伐木": "【伐木】今日不宜砂伐树木、采伐林木。树木有灵，随意砍伐恐伤元气。若确需破坏树木，应另择吉日进行。",
+    "作灶": "【作灶】今日不宜安装火灶、灶台。灶为家中财库，安装不当影响财运。若要安装厨房设备，应另择吉日，方能财源广进。",
+    "掘井": "【掘井】今日不宜挖掘水井、打水井。井为生命之源，择日不当恐影响家人健康。若需挖井，应另择吉日方能水源不断。",
+    "栽种": "【栽种】今日不宜种植花草树木。植物难以成活，或生长不旺。若要绿化美化环境，应另择吉日，方能花木繁茂。"
+}
+
+# 宜忌事项列表（老黄历按日期从中确定性选取）
+YI_ITEMS = list(YI_EXPLANATIONS.keys())
+JI_ITEMS = list(JI_EXPLANATIONS.keys())
+
+# 冲煞吉凶详解
+CHONGSHA_EXPLANATIONS = {
+    'chong': {'鼠':'属鼠者今日与日支相冲，宜静不宜动。','牛':'属牛者今日与日支相冲，宜保守稳重。','虎':'属虎者今日与日支相冲，注意控制情绪。','兔':'属兔者今日与日支相冲，宜低调行事。','龙':'属龙者今日与日支相冲，谨慎为上。','蛇':'属蛇者今日与日支相冲，守住本分。','马':'属马者今日与日支相冲，注意安全。','羊':'属羊者今日与日支相冲，宜守不宜攻。','猴':'属猴者今日与日支相冲，稳健为上。','鸡':'属鸡者今日与日支相冲，宜缓不宜急。','狗':'属狗者今日与日支相冲，避免口舌是非。','猪':'属猪者今日与日支相冲，不宜张扬。'},
+    'sha': {'东':'煎东方，今日不宜向东方行事或远行。','西':'煎西方，今日不宜向西方行事或远行。','南':'煎南方，今日不宜向南方行事或远行。','北':'煎北方，今日不宜向北方行事或远行。'},
+    'ji_shen': {'天德':'【天德】为上吉之神，主福德，诸事皆宜。','月德':'【月德】主贵人相助，办事顺利。','天恩':'【天恩】主上天降福，宜广结善缘。','福星':'【福星】主福禄寿喜，宜办喜事。','文昌':'【文昌】主文运学业，利于考试学习。','驿马':'【驿马】主出行迁徙，利于出差旅游。','天喜':'【天喜】主喜事临门，宜婚嘉庆典。','玉堂':'【玉堂】主贵人健康，宜求医置产。'},
+    'xiong_shen': {'五鬼':'【五鬼】主破财疾病，宜谨慎理财。','死气':'【死气】主不吉，宜避免探病吃丧。','白虎':'【白虎】主血光争斗，谨防意外。','天刑':'【天刑】主刑罚讼争，和气为贵。','朱雀':'【朱雀】主口舌是非，少说多做。','天狗':'【天狗】主小人暗算，谨慎交友。'}
+}
+
+# 桃花星解读
+PEACH_MEANINGS = {
+    '子': "桃花在子（属鼠）：水地桃花，聪明灵利，异性缘佳，桃花来得早且快，感情世界丰富多彩。",
+    '卯': "桃花在卯（属兔）：木地桃花，温柔文雅，感情细腻，容易吸引异性追求，但需防感情纠葥。",
+    '午': "桃花在午（属马）：火地桃花，热情开朗，魅力四射，感情来得快也旺，但需防感情冲动。",
+    '酉': "桃花在酉（属鸡）：金地桃花，外貌出众，幽雅迷人，桃花质量高，容易遇到优质对象。"
+}
@@ -0,0 +1,181 @@
+"""
+玄机命理 - 虚拟化表格控件
+
+在一个 Canvas 上绘制表格行，只为当前可见的行创建画布元素（文字、进度条），
+滚动时把这些元素移到新位置并更新内容，因此行数再多（上千行）占用的画布元素数量也不变，
+滚动保持流畅。
+
+每列的单元格类型：
+    - 'text'：值为文字，或 (文字, 颜色)
+    - 'bar'：值为 (百分比 0-100, 颜色)，按列宽绘制进度条
+
+用法：
+    table = VirtualTable(parent, [Column("年龄", 160, anchor="w"), Column("强度", 200, 'bar')])
+    table.pack(fill=tk.X)
+    table.set_rows([[("28岁", "#fff"), (65, "#ff69b4")], ...])
+
+Author: Mystery Fortune Team
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, List, NamedTuple, Sequence
+
+
+class Column(NamedTuple):
+    title: str
+    width: int
+    kind: str = 'text'      # 'text' 或 'bar'
+    anchor: str = 'center'  # 文字对齐：'w' 或 'center'
+    font: Any = None        # 文字字体，默认使用表格字体
+
+
+CELL_PADX = 5      # 列间距（左右各）
+BAR_HEIGHT = 14
+
+
+class VirtualTable(tk.Frame):
+    """只绘制可见行的表格"""
+
+    def __init__(self, parent, columns: Sequence[Column], row_height: int = 32, max_visible_rows: int = 15,
+                 bg: str = '#1a1a2e', row_bg: str = '#2a2a4a', bar_bg: str = '#1a1a2e',
+                 fg: str = '#ffffff', header_fg: str = '#a0a0a0', font=("Microsoft YaHei", 10),
+                 header_font=("Microsoft YaHei", 9, "bold")):
+        """
+        Args:
+            columns: 列定义
+            row_height: 行高（像素，含行间距）
+            max_visible_rows: 最多同时显示的行数，行数更多时出现滚动条
+        """
+        super().__init__(parent, bg=bg)
+        self.row_height = row_height
+        self.max_visible_rows = max_visible_rows
+        self.row_bg = row_bg
+        self.bar_bg = bar_bg
+        self.fg = fg
+        self.font = font
+        self.header_fg = header_fg
+        self.header_font = header_font
+
+        self.header = tk.Canvas(self, bg=bg, height=22, highlightthickness=0)
+        self.header.pack(fill=tk.X)
+
+        body = tk.Frame(self, bg=bg)
+        body.pack(fill=tk.X)
+        self.canvas = tk.Canvas(body, bg=bg, height=row_height, highlightthickness=0,
+                                yscrollincrement=row_height)
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.canvas.bind("<Configure>", lambda e: self._render(force=True))
+
+        self._rows: List[Sequence[Any]] = []
+        self._pool: List[List[int]] = []   # 每个可见行的画布元素
+        self._shown = (0, 0)
+        self.set_columns(columns)
+
+    # ============ 对外接口 ============
+    def set_columns(self, columns: Sequence[Column]):
+        """更换列定义（同时清空行数据，之后须重新 set_rows）"""
+        self.columns = list(columns)
+        # 每列左边界
+        self._col_x = []
+        x = 0
+        for col in self.columns:
+            self._col_x.append(x + CELL_PADX)
+            x += col.width + CELL_PADX * 2
+        self._total_width = x
+
+        self.header.delete("all")
+        for col, left in zip(self.columns, self._col_x):
+            if col.title:
+                self._create_cell_text(self.header, col, left, 11, col.title, self.header_fg, self.header_font)
+        self.canvas.delete("all")
+        self._rows = []
+        self._pool = []
+        self._shown = (0, 0)
+
+    def set_rows(self, rows: Sequence[Sequence[Any]]):
+        """设置全部行数据（每行与列定义一一对应），滚动回顶部"""
+        self._rows = rows
+        visible = max(1, min(len(rows), self.max_visible_rows))
+        self.canvas.configure(height=visible * self.row_height,
+                              scrollregion=(0, 0, self._total_width, len(rows) * self.row_height))
+        if len(rows) > self.max_visible_rows:
+            self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        else:
+            self.scrollbar.pack_forget()
+        self.canvas.yview_moveto(0)
+        self._render(force=True)
+
+    def row_count(self) -> int:
+        return len(self._rows)
+
+    def visible_range(self) -> tuple:
+        """当前已绘制的行号范围 [first, last)"""
+        return self._shown
+
+    # ============ 绘制 ============
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._render()
+
+    def _render(self, force: bool = False):
+        height = self.canvas.winfo_height()
+        if height <= 1:  # 尚未显示时按设定高度计算
+            height = int(self.canvas.cget('height'))
+        top = max(0, int(self.canvas.canvasy(0)))
+        first = min(top // self.row_height, len(self._rows))
+        last = min(len(self._rows), (top + height) // self.row_height + 1)
+        if not force and (first, last) == self._shown:
+            return
+
+        while len(self._pool) < last - first:
+            self._pool.append(self._create_row_items())
+        for k, index in enumerate(range(first, last)):
+            self._place_row(self._pool[k], index, self._rows[index])
+        for items in self._pool[last - first:]:
+            for item in items:
+                self.canvas.itemconfigure(item, state='hidden')
+        self._shown = (first, last)
+
+    def _create_cell_text(self, canvas, col: Column, left: int, y: int, text: str, fg: str, font) -> int:
+        if col.anchor == 'w':
+            return canvas.create_text(left, y, text=text, fill=fg, font=font, anchor="w")
+        return canvas.create_text(left + col.width // 2, y, text=text, fill=fg, font=font)
+
+    def _create_row_items(self) -> List[int]:
+        """一行的画布元素：行背景，然后每个文字列一个文字，每个进度条列底条和前景条各一个"""
+        canvas = self.canvas
+        items = [canvas.create_rectangle(0, 0, 0, 0, fill=self.row_bg, width=0)]
+        for col, left in zip(self.columns, self._col_x):
+            if col.kind == 'bar':
+                items.append(canvas.create_rectangle(0, 0, 0, 0, fill=self.bar_bg, width=0))
+                items.append(canvas.create_rectangle(0, 0, 0, 0, width=0))
+            else:
+                items.append(self._create_cell_text(canvas, col, left, 0, "", self.fg, col.font or self.font))
+        return items
+
+    def _place_row(self, items: List[int], index: int, row: Sequence[Any]):
+        canvas = self.canvas
+        top = index * self.row_height
+        mid = top + self.row_height // 2
+        canvas.coords(items[0], 0, top + 3, self._total_width, top + self.row_height - 3)
+        canvas.itemconfigure(items[0], state='normal')
+
+        i = 1
+        for col, left, value in zip(self.columns, self._col_x, row):
+            if col.kind == 'bar':
+                percent, color = value
+                bar_top, bar_bottom = mid - BAR_HEIGHT // 2, mid + BAR_HEIGHT // 2
+                canvas.coords(items[i], left, bar_top, left + col.width, bar_bottom)
+                canvas.coords(items[i + 1], left, bar_top, left + col.width * percent / 100, bar_bottom)
+                canvas.itemconfigure(items[i], state='normal')
+                canvas.itemconfigure(items[i + 1], fill=color, state='normal')
+                i += 2
+            else:
+                text, color = value if isinstance(value, tuple) else (value, self.fg)
+                x = left if col.anchor == 'w' else left + col.width // 2
+                canvas.coords(items[i], x, mid)
+                canvas.itemconfigure(items[i], text=text, fill=color, state='normal')
+                i += 1